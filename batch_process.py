@@ -8,23 +8,75 @@ import sys
 import json
 import time
 import re
+import mmap
+import signal
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait
 from datetime import datetime
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from core.downloader import VideoDownloader
-from core.transcriber import WhisperTranscriber
-from core.keyword_extractor import KeywordExtractor
-from core.image_scraper_pro import ImageScraperPro
-from core.video_creator_pro import VideoCreatorPro
+# core classes are imported where they are used, so a run only pays for
+# the heavy deps (torch, moviepy, playwright) of the steps it reaches
+from utils.helpers import link_or_copy
 
 BROLLSUFF = "/home/admin/Downloads/brollsuff"
 SKIP_FOLDERS = ["ncie"]  # Skip this folder per user request
 MAX_JOB_TIME = 25 * 60  # 25 minutes max per job
+LINK_LINE_RE = re.compile(rb'\s*(\S+)(.*)')  # url, then markers
+TIKTOK_DOMAINS = (b'tiktok.com',)
+YOUTUBE_DOMAINS = (b'youtube.com', b'youtu.be')
+TIKTOK_HINTS = ('tiktok', 'crime', 'zeph')  # names of already-downloaded TikToks
+NOT_YOUTUBE_HINTS = ('broll', 'output', 'tiktok')  # our own renders, not sources
+DOWNLOAD_WORKERS = 6  # yt-dlp is network bound, threads overlap the socket waits
+RENDER_WORKERS = 3  # one per output video
+DOWNLOAD_STOP_GRACE = 30  # seconds cancelled downloads get to hang up
+TRANSCRIBE_BATCH = 8  # TikToks transcribed per folder
+IMAGE_EXTS = ('.jpg', '.png', '.webp')
+FALLBACK_PREFIX = 'fallback_'  # images borrowed from another folder, not this folder's own
+DEFAULT_KEYWORDS = ["nature", "food", "cooking", "life", "science"]
+
+class JobTimeout(BaseException):
+    """Raised by the deadline alarm. BaseException so the per-step
+    `except Exception` handlers don't swallow it"""
+    pass
+
+# (second, "HH:MM:SS") - the clock is formatted once per second, not per line
+_stamp = (0, "")
 
 def log(msg):
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    print(f"[{timestamp}] {msg}", flush=True)
+    global _stamp
+    now = int(time.time())
+    if now != _stamp[0]:
+        _stamp = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+    print(f"[{_stamp[1]}] {msg}", flush=True)
+
+def _on_deadline(signum, frame):
+    raise JobTimeout()
+
+def arm_deadline(seconds):
+    """Raise JobTimeout in the main thread after seconds (Unix only)"""
+    if hasattr(signal, 'SIGALRM'):
+        signal.signal(signal.SIGALRM, _on_deadline)
+        signal.setitimer(signal.ITIMER_REAL, seconds)
+
+def disarm_deadline():
+    if hasattr(signal, 'SIGALRM'):
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+def iter_lines_mmap(path):
+    """Yield raw byte lines of a file via mmap (no per-line decode)"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            size = len(mm)
+            while start < size:
+                nl = mm.find(b'\n', start)
+                if nl == -1:
+                    nl = size
+                yield mm[start:nl]
+                start = nl + 1
 
 def parse_links_txt(links_path):
     """Parse links.txt and return TikTok URLs (for SRT) and YouTube URLs (for B-roll)"""
@@ -34,25 +86,67 @@ def parse_links_txt(links_path):
     if not os.path.exists(links_path):
         return tiktok_urls, youtube_urls
     
-    with open(links_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Extract URL (before any markers like [SRT][IMG])
-            url = line.split()[0] if line.split() else line
-            
-            if 'tiktok.com' in url.lower():
-                needs_srt = '[SRT]' in line or '[srt]' in line
-                tiktok_urls.append({'url': url, 'srt': needs_srt})
-            elif 'youtube.com' in url.lower() or 'youtu.be' in url.lower():
-                youtube_urls.append({'url': url})
+    for line in iter_lines_mmap(links_path):
+        # URL first, then any markers like [SRT][IMG]
+        m = LINK_LINE_RE.match(line)
+        if not m:
+            continue
+        
+        url_lower = m.group(1).lower()
+        
+        # classify on bytes, only decode the urls we keep
+        if any(d in url_lower for d in TIKTOK_DOMAINS):
+            needs_srt = b'[srt]' in m.group(2).lower()
+            tiktok_urls.append({'url': m.group(1).decode('utf-8', 'replace'), 'srt': needs_srt})
+        elif any(d in url_lower for d in YOUTUBE_DOMAINS):
+            youtube_urls.append({'url': m.group(1).decode('utf-8', 'replace')})
     
     return tiktok_urls, youtube_urls
 
-def process_folder(folder_path, folder_name):
-    """Process a single job folder"""
+def submit_downloads(ex, downloader, urls):
+    """Queue urls on the pool, returns future -> position in urls"""
+    return {ex.submit(downloader.download, url): i for i, url in enumerate(urls)}
+
+def collect_downloads(futures, wait=True):
+    """Paths from submitted downloads, in url order
+    wait=False only takes the ones that already finished"""
+    results = [None] * len(futures)
+    done = as_completed(futures) if wait else [f for f in futures if f.done()]
+    for fut in done:
+        try:
+            path = fut.result()
+            if path:
+                results[futures[fut]] = path
+                log(f"    ✓ {os.path.basename(path)[:40]}...")
+        except Exception as e:
+            log(f"    ✗ Failed: {str(e)[:50]}")
+    return [p for p in results if p]
+
+def is_own_image(name):
+    """An image this folder scraped itself - borrowed fallback_ links dont count"""
+    return name.lower().endswith(IMAGE_EXTS) and not name.startswith(FALLBACK_PREFIX)
+
+def materialize_in_images_dir(src, images_dir, from_folder):
+    """Hardlink (or kernel-copy) a borrowed image into this folder's images dir"""
+    dst = os.path.join(images_dir, f"{FALLBACK_PREFIX}{from_folder}_{os.path.basename(src)}")
+    if os.path.exists(dst):
+        return dst
+    try:
+        return link_or_copy(src, dst)
+    except OSError as e:
+        log(f"    ✗ Could not borrow {os.path.basename(src)}: {e}")
+        return None
+
+def render_output(creator_kwargs, method, media, output_name):
+    """Process pool worker - builds its own VideoCreatorPro and renders one output"""
+    from core.video_creator_pro import VideoCreatorPro
+    creator = VideoCreatorPro(**creator_kwargs)
+    return getattr(creator, method)(media, output_name)
+
+def process_folder(folder_path, folder_name, transcriber, extractor, scraper):
+    """Process a single job folder
+    transcriber/extractor/scraper come from main() so the whisper model,
+    spacy and the browser stay loaded between folders"""
     job_start = time.time()
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
@@ -72,133 +166,170 @@ def process_folder(folder_path, folder_name):
         log("  No valid links found, skipping...")
         return False
     
-    downloader = VideoDownloader(output_dir=folder_path)
     downloaded_tiktok = []
     downloaded_youtube = []
+    srt_files = []
+    keywords = []
+    images = []
+    existing_images = []
     
-    # Step 1: Download TikTok videos (for SRT)
-    log("\n[STEP 1] Downloading TikTok videos...")
-    for i, url_data in enumerate(tiktok_urls):
-        if time.time() - job_start > MAX_JOB_TIME:
-            log("  Time limit reached, using what we have...")
-            break
+    # One alarm for the whole folder instead of polling the clock,
+    # it also interrupts a download/scrape that is blocked on the network
+    arm_deadline(MAX_JOB_TIME)
+    # one pool for both kinds of download - YouTube keeps downloading in
+    # the background while steps 3-5 run on the TikToks
+    pool = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS)
+    downloader = None
+    tiktok_futures = {}
+    yt_futures = {}
+    try:
+        from core.downloader import VideoDownloader
+        downloader = VideoDownloader(output_dir=folder_path)
         
-        url = url_data['url']
-        # Check if already downloaded
-        existing = [f for f in os.listdir(folder_path) if f.endswith('.mp4') and 'tiktok' in f.lower() or 'crime' in f.lower() or 'zeph' in f.lower()]
+        # Snapshot the folder once - lower-case name -> real name
+        existing_mp4s = {f.lower(): f for f in os.listdir(folder_path) if f.lower().endswith('.mp4')}
+        tiktok_like = [orig for low, orig in existing_mp4s.items() if any(k in low for k in TIKTOK_HINTS)]
+        yt_like = [orig for low, orig in existing_mp4s.items() if not any(k in low for k in NOT_YOUTUBE_HINTS)]
         
-        if existing:
-            log(f"  TikTok already downloaded: {existing[0][:40]}...")
-            downloaded_tiktok.append(os.path.join(folder_path, existing[0]))
-        else:
-            log(f"  Downloading TikTok [{i+1}/{len(tiktok_urls)}]...")
-            try:
-                path = downloader.download(url)
-                if path:
-                    downloaded_tiktok.append(path)
-                    log(f"    ✓ {os.path.basename(path)[:40]}...")
-            except Exception as e:
-                log(f"    ✗ Failed: {str(e)[:50]}")
-    
-    # Step 2: Download YouTube videos (for B-roll)
-    log("\n[STEP 2] Downloading YouTube videos...")
-    for i, url_data in enumerate(youtube_urls):
-        if time.time() - job_start > MAX_JOB_TIME:
-            log("  Time limit reached, using what we have...")
-            break
+        # Step 1: Download TikTok videos (for SRT)
+        log("\n[STEP 1] Downloading TikTok videos...")
+        pending = []
+        for url_data in tiktok_urls:
+            # Check if already downloaded (each file only matches one url)
+            if tiktok_like:
+                existing = tiktok_like.pop(0)
+                if existing in yt_like:
+                    yt_like.remove(existing)
+                log(f"  TikTok already downloaded: {existing[:40]}...")
+                downloaded_tiktok.append(os.path.join(folder_path, existing))
+            else:
+                pending.append(url_data['url'])
         
-        url = url_data['url']
-        # Check if already downloaded
-        existing_yt = [f for f in os.listdir(folder_path) if f.endswith('.mp4') and not any(x in f.lower() for x in ['broll', 'output', 'tiktok'])]
+        tiktok_futures = submit_downloads(pool, downloader, pending)
         
-        if existing_yt:
-            log(f"  YouTube already downloaded: {existing_yt[0][:40]}...")
-            downloaded_youtube.append(os.path.join(folder_path, existing_yt[0]))
-        else:
-            log(f"  Downloading YouTube [{i+1}/{len(youtube_urls)}]...")
+        # Step 2: Download YouTube videos (for B-roll)
+        log("\n[STEP 2] Downloading YouTube videos...")
+        pending_yt = []
+        for url_data in youtube_urls:
+            # Check if already downloaded
+            if yt_like:
+                existing_yt = yt_like.pop(0)
+                log(f"  YouTube already downloaded: {existing_yt[:40]}...")
+                downloaded_youtube.append(os.path.join(folder_path, existing_yt))
+            else:
+                pending_yt.append(url_data['url'])
+        
+        if pending_yt:
+            log(f"  Downloading {len(pending_yt)} YouTube in the background...")
+            yt_futures = submit_downloads(pool, downloader, pending_yt)
+        
+        # TikToks are needed right away for the SRT
+        if pending:
+            log(f"  Downloading {len(pending)} TikTok in parallel...")
+            downloaded_tiktok.extend(collect_downloads(tiktok_futures))
+        
+        # Step 3: Generate SRT from TikTok videos
+        if downloaded_tiktok:
+            log("\n[STEP 3] Generating SRT from TikTok...")
+            
+            # Check for existing SRT
+            existing_srt = [f for f in os.listdir(folder_path) if f.endswith('.srt')]
+            if existing_srt:
+                log(f"  SRT already exists: {existing_srt[0]}")
+                srt_files = [os.path.join(folder_path, f) for f in existing_srt]
+            else:
+                try:
+                    transcriber.set_output_dir(folder_path)
+                    # short TikToks share one batched decode
+                    for srt_path in transcriber.transcribe_batch(downloaded_tiktok[:TRANSCRIBE_BATCH]):
+                        srt_files.append(srt_path)
+                        log(f"    ✓ {os.path.basename(srt_path)}")
+                except Exception as e:
+                    log(f"    ✗ SRT failed: {str(e)[:50]}")
+        
+        # Step 4: Extract keywords
+        if srt_files:
+            log("\n[STEP 4] Extracting keywords...")
             try:
-                path = downloader.download(url)
-                if path:
-                    downloaded_youtube.append(path)
-                    log(f"    ✓ {os.path.basename(path)[:40]}...")
+                for srt in srt_files:
+                    kw = extractor.extract_from_srt(srt)
+                    keywords.extend(kw)
+                keywords = list(dict.fromkeys(keywords))[:15]
+                log(f"    Found {len(keywords)} keywords: {keywords[:5]}...")
             except Exception as e:
-                log(f"    ✗ Failed: {str(e)[:50]}")
-    
-    # Step 3: Generate SRT from TikTok videos
-    srt_files = []
-    if downloaded_tiktok:
-        log("\n[STEP 3] Generating SRT from TikTok...")
+                log(f"    ✗ Keywords failed: {str(e)[:50]}")
+                keywords = DEFAULT_KEYWORDS
+        
+        if not keywords:
+            keywords = DEFAULT_KEYWORDS
+        
+        # Step 5: Scrape images
+        # one listing of images/ - the scraper keeps it current from here on
+        # borrowed images dont count, or a folder that once borrowed 10
+        # would never get scraped again
+        with os.scandir(images_dir) as it:
+            existing_images = [e.path for e in it if e.is_file() and is_own_image(e.name)]
         
-        # Check for existing SRT
-        existing_srt = [f for f in os.listdir(folder_path) if f.endswith('.srt')]
-        if existing_srt:
-            log(f"  SRT already exists: {existing_srt[0]}")
-            srt_files = [os.path.join(folder_path, f) for f in existing_srt]
+        if len(existing_images) >= 10:
+            log(f"\n[STEP 5] Using {len(existing_images)} existing images...")
+            images = existing_images
         else:
+            log("\n[STEP 5] Scraping images...")
             try:
-                transcriber = WhisperTranscriber(model_name="small", use_gpu=True, output_dir=folder_path)
-                for video in downloaded_tiktok[:1]:  # Just first TikTok for SRT
-                    if time.time() - job_start > MAX_JOB_TIME:
-                        break
-                    srt_path = transcriber.transcribe(video)
-                    if srt_path:
-                        srt_files.append(srt_path)
-                        log(f"    ✓ {os.path.basename(srt_path)}")
+                scraper.set_output_dir(images_dir)
+                log(f"    Searching: {', '.join(keywords[:5])}...")
+                # all keywords share one download pool - 5 keywords x 4 is the
+                # 20 image cap, so nothing gets saved only to be dropped
+                images = scraper.search_many(keywords[:5], max_per_keyword=4, existing=set(existing_images))
+                log(f"    Total: {len(images)} images")
             except Exception as e:
-                log(f"    ✗ SRT failed: {str(e)[:50]}")
-    
-    # Step 4: Extract keywords
-    keywords = []
-    if srt_files:
-        log("\n[STEP 4] Extracting keywords...")
-        try:
-            extractor = KeywordExtractor()
-            for srt in srt_files:
-                kw = extractor.extract_from_srt(srt)
-                keywords.extend(kw)
-            keywords = list(dict.fromkeys(keywords))[:15]
-            log(f"    Found {len(keywords)} keywords: {keywords[:5]}...")
-        except Exception as e:
-            log(f"    ✗ Keywords failed: {str(e)[:50]}")
-            keywords = ["nature", "food", "cooking", "life", "science"]
-    
-    if not keywords:
-        keywords = ["nature", "food", "cooking", "life", "science"]
-    
-    # Step 5: Scrape images
-    images = []
-    existing_images = [os.path.join(images_dir, f) for f in os.listdir(images_dir) if f.endswith(('.jpg', '.png', '.webp'))]
-    
-    if len(existing_images) >= 10:
-        log(f"\n[STEP 5] Using {len(existing_images)} existing images...")
-        images = existing_images
-    else:
-        log("\n[STEP 5] Scraping images...")
-        try:
-            scraper = ImageScraperPro(output_dir=images_dir, min_width=800, min_height=600)
-            for kw in keywords[:5]:
-                if time.time() - job_start > MAX_JOB_TIME:
-                    break
-                if len(images) >= 20:
-                    break
-                log(f"    Searching: {kw}...")
-                found = scraper.search(kw, max_images=5)
-                images.extend(found)
-            log(f"    Total: {len(images)} images")
-        except Exception as e:
-            log(f"    ✗ Scraping failed: {str(e)[:50]}")
+                log(f"    ✗ Scraping failed: {str(e)[:50]}")
+        
+        if yt_futures:
+            log("\n[STEP 2] Waiting for YouTube downloads...")
+            downloaded_youtube.extend(collect_downloads(yt_futures))
+            yt_futures = {}
+        
+    except JobTimeout:
+        log("  Time limit reached, using what we have...")
+        # keep the YouTube videos that made it in time
+        downloaded_youtube.extend(collect_downloads(yt_futures, wait=False))
+    finally:
+        disarm_deadline()
+        # on JobTimeout the downloads still running are told to stop (they
+        # hang up at their next progress tick) so nothing keeps writing
+        # into the folder while step 6 renders. the YoutubeDLs are only
+        # closed once no thread is using them anymore
+        if downloader:
+            downloader.cancel()
+        pool.shutdown(wait=False, cancel_futures=True)
+        _, stragglers = wait(list(tiktok_futures) + list(yt_futures), timeout=DOWNLOAD_STOP_GRACE)
+        if downloader:
+            if stragglers:
+                log(f"  {len(stragglers)} download(s) still stopping, leaving them open")
+            else:
+                downloader.close()
     
     if not images:
         images = existing_images or []
     
     if len(images) < 5:
         log("  Not enough images, trying to use from other folders...")
-        for other_folder in os.listdir(BROLLSUFF):
-            other_path = os.path.join(BROLLSUFF, other_folder, "images")
-            if os.path.isdir(other_path) and other_folder != folder_name:
-                for f in os.listdir(other_path)[:5]:
-                    if f.endswith(('.jpg', '.png', '.webp')):
-                        images.append(os.path.join(other_path, f))
+        with os.scandir(BROLLSUFF) as folders:
+            for entry in folders:
+                if not entry.is_dir(follow_symlinks=False) or entry.name == folder_name:
+                    continue
+                try:
+                    with os.scandir(os.path.join(entry.path, "images")) as it:
+                        # only that folder's own images, so borrows dont chain
+                        for i, img in enumerate(e for e in it if is_own_image(e.name)):
+                            if i >= 5:
+                                break
+                            path = materialize_in_images_dir(img.path, images_dir, entry.name)
+                            if path:
+                                images.append(path)
+                except (FileNotFoundError, NotADirectoryError):
+                    continue
                 if len(images) >= 10:
                     break
     
@@ -206,41 +337,44 @@ def process_folder(folder_path, folder_name):
     if images and len(images) >= 5:
         log(f"\n[STEP 6] Creating video outputs with {len(images)} images...")
         
+        # Split the cores between the renders so the ffmpegs dont oversubscribe
+        ffmpeg_threads = max(1, (os.cpu_count() or RENDER_WORKERS) // RENDER_WORKERS)
+        creator_kwargs = {
+            'images_dir': images_dir,
+            'videos_dir': folder_path,
+            'output_dir': folder_path,
+            'settings': {
+                'secondsPerImage': 2.5,
+                'bgColor': '#FFFFFF',
+                'soundVolume': 1.0,
+                'motionLevel': 'off',  # No motion to prevent shakiness
+                'targetDuration': 60,
+                'ffmpegThreads': ffmpeg_threads
+            }
+        }
+        
+        jobs = [
+            ("create_slideshow", images[:20], f"output_video_{timestamp}.mp4"),  # Output 1: Landscape slideshow
+            ("create_portrait", images[:15], f"broll_instagram_{timestamp}.mp4"),  # Output 2: Portrait (Instagram)
+        ]
+        # Output 3: YouTube mix (ONLY YouTube videos)
+        if downloaded_youtube:
+            jobs.append(("create_youtube_mix", downloaded_youtube, f"broll_youtube_{timestamp}.mp4"))
+        
         try:
-            creator = VideoCreatorPro(
-                images_dir=images_dir,
-                videos_dir=folder_path,
-                output_dir=folder_path,
-                settings={
-                    'secondsPerImage': 2.5,
-                    'bgColor': '#FFFFFF',
-                    'soundVolume': 1.0,
-                    'motionLevel': 'off',  # No motion to prevent shakiness
-                    'targetDuration': 60
-                }
-            )
-            
-            # Output 1: Landscape slideshow
-            if time.time() - job_start < MAX_JOB_TIME:
-                log("    Creating output_video.mp4...")
-                out1 = creator.create_slideshow(images[:20], f"output_video_{timestamp}.mp4")
-                if out1:
-                    log(f"      ✓ {os.path.getsize(out1)/1024/1024:.1f} MB")
-            
-            # Output 2: Portrait (Instagram)
-            if time.time() - job_start < MAX_JOB_TIME:
-                log("    Creating broll_instagram.mp4...")
-                out2 = creator.create_portrait(images[:15], f"broll_instagram_{timestamp}.mp4")
-                if out2:
-                    log(f"      ✓ {os.path.getsize(out2)/1024/1024:.1f} MB")
-            
-            # Output 3: YouTube mix (ONLY YouTube videos)
-            if downloaded_youtube and time.time() - job_start < MAX_JOB_TIME:
-                log("    Creating broll_youtube.mp4...")
-                out3 = creator.create_youtube_mix(downloaded_youtube, f"broll_youtube_{timestamp}.mp4")
-                if out3:
-                    log(f"      ✓ {os.path.getsize(out3)/1024/1024:.1f} MB")
-            
+            with ProcessPoolExecutor(max_workers=RENDER_WORKERS) as ex:
+                futures = {}
+                for method, media, output_name in jobs:
+                    log(f"    Creating {output_name}...")
+                    futures[ex.submit(render_output, creator_kwargs, method, media, output_name)] = output_name
+                
+                for fut in as_completed(futures):
+                    try:
+                        out = fut.result()
+                        if out:
+                            log(f"      ✓ {futures[fut]} {os.path.getsize(out)/1024/1024:.1f} MB")
+                    except Exception as e:
+                        log(f"    ✗ {futures[fut]} failed: {str(e)[:100]}")
         except Exception as e:
             log(f"    ✗ Video creation failed: {str(e)[:100]}")
     else:
@@ -256,24 +390,39 @@ def main():
     log("BATCH PROCESSOR - Processing all brollsuff folders")
     log("="*60)
     
-    folders = [f for f in os.listdir(BROLLSUFF) 
-               if os.path.isdir(os.path.join(BROLLSUFF, f)) 
-               and f not in SKIP_FOLDERS
-               and not f.endswith('.json')]
+    with os.scandir(BROLLSUFF) as it:
+        folders = [e.name for e in it
+                   if e.is_dir()
+                   and e.name not in SKIP_FOLDERS
+                   and not e.name.endswith('.json')]
     
     log(f"Found {len(folders)} folders to process (skipping: {SKIP_FOLDERS})")
     
+    from core.transcriber import WhisperTranscriber
+    from core.keyword_extractor import KeywordExtractor
+    from core.image_scraper_pro import ImageScraperPro
+    
+    # built once - the whisper weights and the browser are the expensive bits
+    transcriber = WhisperTranscriber(model_name="small", use_gpu=True, output_dir=BROLLSUFF)
+    extractor = KeywordExtractor()
+    scraper = ImageScraperPro(output_dir=BROLLSUFF, min_width=800, min_height=600)
+    
     results = {}
     for i, folder in enumerate(sorted(folders)):
         folder_path = os.path.join(BROLLSUFF, folder)
         log(f"\n[{i+1}/{len(folders)}] Starting {folder}...")
         
         try:
-            success = process_folder(folder_path, folder)
+            success = process_folder(folder_path, folder, transcriber, extractor, scraper)
             results[folder] = "✓" if success else "⚠"
-        except Exception as e:
-            log(f"ERROR in {folder}: {e}")
+        except (Exception, JobTimeout) as e:
+            log(f"ERROR in {folder}: {e!r}")
             results[folder] = "✗"
+        finally:
+            # never let one folder's alarm leak into the next
+            disarm_deadline()
+    
+    scraper.close()
     
     log("\n" + "="*60)
     log("BATCH COMPLETE - Results:")
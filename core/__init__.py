@@ -5,25 +5,46 @@ all the heavy lifting happens here
 video processing, scraping, transcription
 
 imports for easy access from other modules
+the classes load on first access (PEP 562) so importing one module
+doesnt drag in the rest of core and their deps
 """
 
-from .downloader import VideoDownloader
-from .transcriber import WhisperTranscriber
-from .keyword_extractor import KeywordExtractor
-from .video_creator import VideoCreator
-
-# pro versions with better quality
-try:
-    from .image_scraper_pro import ImageScraperPro
-    from .video_creator_pro import VideoCreatorPro
-except ImportError:
-    pass
-
-# safety monitoring
-try:
-    from .safety_monitor import SafetyMonitor
-except ImportError:
-    pass
+import importlib
+
+# name -> submodule that defines it
+_LAZY = {
+    "VideoDownloader": ".downloader",
+    "WhisperTranscriber": ".transcriber",
+    "KeywordExtractor": ".keyword_extractor",
+    "VideoCreator": ".video_creator",
+    # pro versions with better quality
+    "ImageScraperPro": ".image_scraper_pro",
+    "VideoCreatorPro": ".video_creator_pro",
+    # safety monitoring
+    "SafetyMonitor": ".safety_monitor",
+}
+
+# these were always optional - missing deps just mean the name isnt there
+_OPTIONAL = {"ImageScraperPro", "VideoCreatorPro", "SafetyMonitor"}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = importlib.import_module(_LAZY[name], __name__)
+    except ImportError:
+        if name in _OPTIONAL:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        raise
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
+
 
 __all__ = [
     "VideoDownloader",
@@ -6,14 +6,41 @@ FIXED:
 - Better filename sanitization to avoid path issues
 - Multiple user agents to avoid blocks
 - Timeout handling
+- Info cache so reruns skip re-extraction of already downloaded urls
 """
 
 import os
 import re
-import time
+import json
 import random
+import shutil
+import threading
 from typing import Callable, Optional
 
+# filename sanitizing - keep alphanumeric, spaces, hyphens, underscores
+_NON_ALNUM = re.compile(r'[^\w\s\-]')
+_COLLAPSE = re.compile(r'[\s_]+')
+
+# extensions yt-dlp may leave behind, in lookup order
+_VIDEO_EXTS = (".mp4", ".webm", ".mkv", ".m4a")
+_VIDEO_ONLY_EXTS = (".mp4", ".webm", ".mkv")
+
+# User agents for rotation
+_USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
+)
+
+# error text that means "try again"
+_RETRYABLE_TOKENS = ('403', '429', '503', 'timeout', 'connection', 'network', 'temporary', 'unavailable')
+
+
+class DownloadCancelled(Exception):
+    """raised from the yt-dlp hooks once cancel() was called"""
+    pass
+
 
 class VideoDownloader:
     """
@@ -27,12 +54,10 @@ class VideoDownloader:
     """
     
     # User agents for rotation
-    USER_AGENTS = [
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15",
-        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
-    ]
+    USER_AGENTS = _USER_AGENTS
+    
+    # yt-dlp keeps its JS player / signature cache here across runs
+    YTDLP_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "da-editor", "yt-dlp")
     
     def __init__(
         self,
@@ -46,18 +71,60 @@ class VideoDownloader:
         
         os.makedirs(output_dir, exist_ok=True)
         
+        # url -> {"path", "mtime"} for videos we already have on disk
+        self.info_cache_path = os.path.join(output_dir, ".ytdlp_info.json")
+        self._info_cache = self._load_info_cache()
+        self._cache_lock = threading.Lock()
+        
+        # cached YoutubeDL instances, see _get_ydl()
+        self._local = threading.local()
+        self._ydl_lock = threading.Lock()
+        self._all_ydls = []
+        
+        # set by cancel() - downloads in flight stop at their next progress tick
+        self._cancelled = threading.Event()
+        
         print(f"[Downloader v2] ready - output: {output_dir}")
     
+    def _load_info_cache(self) -> dict:
+        """load the url -> downloaded path cache"""
+        if not os.path.exists(self.info_cache_path):
+            return {}
+        try:
+            with open(self.info_cache_path, "r") as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"[Downloader] info cache load error: {e}")
+            return {}
+    
+    def _cache_download(self, url: str, path: str):
+        """remember a finished download, written atomically"""
+        with self._cache_lock:
+            self._info_cache[url] = {"path": path, "mtime": os.path.getmtime(path)}
+            tmp_path = self.info_cache_path + ".tmp"
+            try:
+                with open(tmp_path, "w") as f:
+                    json.dump(self._info_cache, f, indent=2)
+                os.replace(tmp_path, self.info_cache_path)
+            except Exception as e:
+                print(f"[Downloader] info cache save error: {e}")
+    
+    def _cached_path(self, url: str) -> Optional[str]:
+        """path of a previous download of url if it is still on disk"""
+        entry = self._info_cache.get(url)
+        if entry and os.path.exists(entry.get("path", "")):
+            return entry["path"]
+        return None
+    
     def _sanitize_filename(self, title: str) -> str:
         """Sanitize filename to avoid issues with special characters"""
         if not title:
             return "video"
         
         # Remove or replace problematic characters
-        # Keep alphanumeric, spaces, hyphens, underscores
-        sanitized = re.sub(r'[^\w\s\-]', '', title)
+        sanitized = _NON_ALNUM.sub('', title)
         # Replace multiple spaces/underscores with single underscore
-        sanitized = re.sub(r'[\s_]+', '_', sanitized)
+        sanitized = _COLLAPSE.sub('_', sanitized)
         # Limit length
         sanitized = sanitized[:80]
         # Remove leading/trailing underscores
@@ -70,28 +137,36 @@ class VideoDownloader:
         Download a single video from url with retry logic
         Returns path to downloaded file or None if failed
         """
+        cached = self._cached_path(url)
+        if cached:
+            self.on_progress(f"Already downloaded: {os.path.basename(cached)}")
+            return cached
+        
         last_error = None
         
         for attempt in range(self.max_retries):
+            if self._cancelled.is_set():
+                return None
             try:
                 result = self._download_attempt(url, attempt)
                 if result:
+                    self._cache_download(url, result)
                     return result
             except Exception as e:
                 last_error = e
                 error_str = str(e).lower()
                 
                 # Check if it's a retryable error
-                is_retryable = any(x in error_str for x in [
-                    '403', '429', '503', 'timeout', 'connection', 
-                    'network', 'temporary', 'unavailable'
-                ])
+                is_retryable = any(x in error_str for x in _RETRYABLE_TOKENS)
+                
+                if self._cancelled.is_set():
+                    return None  # stopped on purpose, not a failure to retry
                 
                 if is_retryable and attempt < self.max_retries - 1:
                     # Exponential backoff with jitter
                     delay = (2 ** attempt) + random.uniform(0, 1)
                     self.on_progress(f"Retry {attempt + 1}/{self.max_retries} in {delay:.1f}s: {str(e)[:50]}...")
-                    time.sleep(delay)
+                    self._cancelled.wait(delay)  # wakes early on cancel()
                 else:
                     break
         
@@ -110,7 +185,68 @@ class VideoDownloader:
         
         # Use different user agent on retries
         user_agent = self.USER_AGENTS[attempt % len(self.USER_AGENTS)]
+        ydl = self._get_ydl(yt_dlp, user_agent, "tiktok.com" in url.lower())
         
+        try:
+            info = ydl.extract_info(url, download=True)
+            
+            if info:
+                # Sanitize the title for filename lookup
+                title = self._sanitize_filename(info.get("title", "video"))
+                
+                # Try to find the downloaded file
+                filename = ydl.prepare_filename(info)
+                base = os.path.splitext(filename)[0]
+                
+                for ext in _VIDEO_EXTS:
+                    path = base + ext
+                    if os.path.exists(path):
+                        # Rename to sanitized filename if needed
+                        final_path = self._ensure_safe_path(path)
+                        print(f"[Downloader] saved: {final_path}")
+                        return final_path
+                
+                # Try finding by sanitized title
+                for ext in _VIDEO_ONLY_EXTS:
+                    possible_path = os.path.join(self.output_dir, title + ext)
+                    if os.path.exists(possible_path):
+                        return possible_path
+                
+                # Last resort: find most recent file
+                recent = self._find_most_recent_video()
+                if recent:
+                    return recent
+                
+                print(f"[Downloader] warning: couldn't find downloaded file")
+                return None
+                
+        except Exception as e:
+            # Re-raise to trigger retry
+            raise RuntimeError(f"Download failed: {e}")
+        
+        return None
+    
+    def _get_ydl(self, yt_dlp, user_agent: str, is_tiktok: bool):
+        """
+        reuse one YoutubeDL per thread + options instead of building one per url
+        (extractors, cookie jar and player cache stay warm)
+        YoutubeDL is not thread safe so parallel downloads each get their own
+        """
+        cache = getattr(self._local, "ydl_by_opts", None)
+        if cache is None:
+            cache = self._local.ydl_by_opts = {}
+        
+        key = (user_agent, is_tiktok)
+        ydl = cache.get(key)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL(self._build_ydl_opts(user_agent, is_tiktok))
+            cache[key] = ydl
+            with self._ydl_lock:
+                self._all_ydls.append(ydl)
+        return ydl
+    
+    def _build_ydl_opts(self, user_agent: str, is_tiktok: bool) -> dict:
+        """yt-dlp options for one user agent / platform"""
         # Get sanitized filename
         output_template = os.path.join(self.output_dir, "%(title).80s.%(ext)s")
         
@@ -137,6 +273,8 @@ class VideoDownloader:
             "skip_unavailable_fragments": True,
             # Network options
             "socket_timeout": 30,
+            # keep the player cache between runs
+            "cachedir": self.YTDLP_CACHE_DIR,
             # User agent
             "http_headers": {
                 "User-Agent": user_agent,
@@ -155,48 +293,56 @@ class VideoDownloader:
         }
         
         # For TikTok, add special options
-        if "tiktok.com" in url.lower():
+        if is_tiktok:
             ydl_opts["format"] = "best"  # TikTok usually has single format
         
-        try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=True)
-                
-                if info:
-                    # Sanitize the title for filename lookup
-                    title = self._sanitize_filename(info.get("title", "video"))
-                    
-                    # Try to find the downloaded file
-                    filename = ydl.prepare_filename(info)
-                    base = os.path.splitext(filename)[0]
-                    
-                    for ext in [".mp4", ".webm", ".mkv", ".m4a"]:
-                        path = base + ext
-                        if os.path.exists(path):
-                            # Rename to sanitized filename if needed
-                            final_path = self._ensure_safe_path(path)
-                            print(f"[Downloader] saved: {final_path}")
-                            return final_path
-                    
-                    # Try finding by sanitized title
-                    for ext in [".mp4", ".webm", ".mkv"]:
-                        possible_path = os.path.join(self.output_dir, title + ext)
-                        if os.path.exists(possible_path):
-                            return possible_path
-                    
-                    # Last resort: find most recent file
-                    recent = self._find_most_recent_video()
-                    if recent:
-                        return recent
-                    
-                    print(f"[Downloader] warning: couldn't find downloaded file")
-                    return None
-                    
-        except Exception as e:
-            # Re-raise to trigger retry
-            raise RuntimeError(f"Download failed: {e}")
+        ydl_opts.update(self._transport_opts(is_tiktok))
         
-        return None
+        return ydl_opts
+    
+    def _transport_opts(self, is_tiktok: bool) -> dict:
+        """
+        faster transports when they are installed, plain urllib otherwise
+        - aria2c: segmented download over reused keep-alive connections
+        - curl_cffi: browser TLS fingerprint + connection reuse for TikTok
+        """
+        opts = {}
+        
+        if shutil.which("aria2c"):
+            opts["external_downloader"] = {"default": "aria2c"}
+            opts["external_downloader_args"] = {
+                "aria2c": ["-x16", "-s16", "-k1M", "--min-split-size=1M"]
+            }
+        
+        if is_tiktok:
+            try:
+                import curl_cffi  # noqa: F401
+                from yt_dlp.networking.impersonate import ImpersonateTarget
+                opts["impersonate"] = ImpersonateTarget("chrome")
+            except ImportError:
+                pass
+        
+        return opts
+    
+    def cancel(self):
+        """
+        stop every download of this downloader - queued ones return None
+        right away, running ones raise DownloadCancelled from the next yt-dlp
+        hook (an external aria2c only gets there between fragments)
+        """
+        self._cancelled.set()
+    
+    def close(self):
+        """close every cached YoutubeDL (flushes cookies)
+        only call it once no thread is downloading anymore"""
+        with self._ydl_lock:
+            ydls, self._all_ydls = self._all_ydls, []
+        for ydl in ydls:
+            try:
+                ydl.close()
+            except Exception:
+                pass
+        self._local = threading.local()
     
     def _ensure_safe_path(self, path: str) -> str:
         """Rename file to safe path if current path has issues"""
@@ -224,7 +370,7 @@ class VideoDownloader:
         """Find the most recently created video file in output dir"""
         videos = []
         for f in os.listdir(self.output_dir):
-            if f.endswith(('.mp4', '.webm', '.mkv')):
+            if f.endswith(_VIDEO_ONLY_EXTS):
                 path = os.path.join(self.output_dir, f)
                 mtime = os.path.getmtime(path)
                 videos.append((path, mtime))
@@ -238,6 +384,9 @@ class VideoDownloader:
     
     def _progress_hook(self, d):
         """Called by yt-dlp during download"""
+        if self._cancelled.is_set():
+            raise DownloadCancelled("download cancelled")
+        
         status = d.get("status")
         
         if status == "downloading":
@@ -258,6 +407,9 @@ class VideoDownloader:
     
     def _postprocess_hook(self, d):
         """Called after download when postprocessing"""
+        if self._cancelled.is_set():
+            raise DownloadCancelled("download cancelled")
+        
         status = d.get("status")
         if status == "started":
             self.on_progress("Processing video...")
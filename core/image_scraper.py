@@ -10,8 +10,10 @@ import os
 import re
 import time
 import random
+import io
 import hashlib
 import requests
+from requests.adapters import HTTPAdapter
 from typing import List, Optional
 from urllib.parse import urlparse
 
@@ -32,6 +34,19 @@ class ImageScraper:
         "stockphoto.com", "canstockphoto.com", "fotolia.com", "pond5.com",
         "adobe.stock", "vectorstock.com", "megapixl.com", "picfair.com"
     ]
+    # the same list as a set of hosts - the check looks at the url's
+    # hostname only, one set lookup per parent domain
+    BLOCKED_HOSTS = frozenset(BLOCKED_DOMAINS)
+    
+    # per-request headers (the UA lives on the session)
+    PAGE_HEADERS = {"Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8"}
+    IMAGE_HEADERS = {"Accept": "image/*", "Referer": "https://www.google.com/"}
+    
+    # images are held in memory until they pass, so cap what we'll hold
+    MAX_DOWNLOAD_SIZE = 12 * 1024 * 1024
+    # how far into the body the header parser gets fed before giving up
+    # and leaving it to _verify_image on the full download
+    HEADER_PROBE_LIMIT = 256 * 1024
     
     # user agents to rotate
     USER_AGENTS = [
@@ -52,9 +67,53 @@ class ImageScraper:
         self.min_height = min_height
         self.min_size_kb = min_size_kb
         
+        self._playwright = None
+        self._browser = None
+        
+        # one keep-alive pool for the search page and every image, so
+        # repeat hits on the same host skip the TCP+TLS handshake
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # one UA for the life of the scraper, browser included
+        self.user_agent = random.choice(self.USER_AGENTS)
+        self.session.headers["User-Agent"] = self.user_agent
+        
         os.makedirs(output_dir, exist_ok=True)
         print(f"[Scraper] ready - output: {output_dir}")
     
+    def _get_browser(self, sync_playwright):
+        """
+        1b. start chromium on first use and keep it
+        launching is ~1s, so it shouldnt happen per search
+        """
+        if self._browser is None:
+            self._playwright = sync_playwright().start()
+            try:
+                self._browser = self._playwright.chromium.launch(headless=True)
+            except Exception:
+                self._playwright.stop()
+                self._playwright = None
+                raise
+        return self._browser
+    
+    def close(self):
+        """shut the browser and the http pool down"""
+        try:
+            if self._browser:
+                self._browser.close()
+            if self._playwright:
+                self._playwright.stop()
+        except Exception:
+            pass
+        self._browser = None
+        self._playwright = None
+        try:
+            self.session.close()
+        except Exception:
+            pass
+    
     def search(self, keyword: str, max_images: int = 5) -> List[str]:
         """
         1a. search for images by keyword
@@ -81,13 +140,13 @@ class ImageScraper:
         
         downloaded = []
         
-        with sync_playwright() as p:
-            # launch browser
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                user_agent=random.choice(self.USER_AGENTS),
-                viewport={"width": 1920, "height": 1080}
-            )
+        # one browser for the life of the scraper, a fresh context per search
+        browser = self._get_browser(sync_playwright)
+        context = browser.new_context(
+            user_agent=self.user_agent,
+            viewport={"width": 1920, "height": 1080}
+        )
+        try:
             page = context.new_page()
             
             # go to google images
@@ -128,7 +187,8 @@ class ImageScraper:
                 except Exception as e:
                     continue
             
-            browser.close()
+        finally:
+            context.close()
         
         print(f"[Scraper] downloaded {len(downloaded)} images for '{keyword}'")
         return downloaded
@@ -140,15 +200,10 @@ class ImageScraper:
         """
         downloaded = []
         
-        headers = {
-            "User-Agent": random.choice(self.USER_AGENTS),
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        }
-        
         search_url = f"https://www.google.com/search?q={keyword}&tbm=isch&tbs=isz:l"
         
         try:
-            response = requests.get(search_url, headers=headers, timeout=10)
+            response = self.session.get(search_url, headers=self.PAGE_HEADERS, timeout=10)
             response.raise_for_status()
             
             # extract image URLs using regex (hacky but works)
@@ -174,9 +229,17 @@ class ImageScraper:
     def _is_blocked(self, url: str) -> bool:
         """
         3a. check if URL is from a blocked domain
+        the host and each parent domain is one set lookup
+        (img.c.alamy.com -> c.alamy.com -> alamy.com), so notalamy.com or
+        an alamy.com in the path dont count
         """
-        for domain in self.BLOCKED_DOMAINS:
-            if domain in url.lower():
+        try:
+            hostname = (urlparse(url).hostname or "").lower()
+        except ValueError:
+            return False
+        parts = hostname.split(".")
+        for i in range(len(parts) - 1):
+            if ".".join(parts[i:]) in self.BLOCKED_HOSTS:
                 return True
         return False
     
@@ -186,23 +249,19 @@ class ImageScraper:
         returns path if successful, None if failed
         """
         try:
-            headers = {
-                "User-Agent": random.choice(self.USER_AGENTS),
-                "Accept": "image/*",
-                "Referer": "https://www.google.com/"
-            }
-            
-            response = requests.get(url, headers=headers, timeout=15, stream=True)
+            response = self.session.get(url, headers=self.IMAGE_HEADERS, timeout=15, stream=True)
             response.raise_for_status()
             
             # check content type
             content_type = response.headers.get("content-type", "")
             if "image" not in content_type.lower():
+                response.close()  # hand the connection back to the pool
                 return None
             
             # check size
             content_length = int(response.headers.get("content-length", 0))
             if content_length > 0 and content_length < self.min_size_kb * 1024:
+                response.close()
                 return None
             
             # generate filename
@@ -212,19 +271,39 @@ class ImageScraper:
             filename = f"{safe_keyword}_{name_hash}.{ext}"
             filepath = os.path.join(self.output_dir, filename)
             
-            # save to disk
-            with open(filepath, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            # keep it in memory until it passes - rejects never touch the disk
+            # the first chunks also go through PIL's incremental parser, which
+            # has the size as soon as the header is in - a small image is
+            # dropped before the rest of its body downloads
+            parser = self._header_parser()
+            buf = io.BytesIO()
+            for chunk in response.iter_content(chunk_size=65536):
+                buf.write(chunk)
+                if buf.tell() > self.MAX_DOWNLOAD_SIZE:
+                    response.close()
+                    return None
+                if parser is not None:
+                    size = self._feed_header(parser, chunk)
+                    if size:
+                        parser = None
+                        if size[0] < self.min_width or size[1] < self.min_height:
+                            print(f"[Scraper] skipped: {size[0]}x{size[1]} too small")
+                            response.close()
+                            return None
+                    elif size is None or buf.tell() >= self.HEADER_PROBE_LIMIT:
+                        parser = None  # leave it to _verify_image
             
             # verify it's a valid image and check dimensions
-            if self._verify_image(filepath):
-                print(f"[Scraper] saved: {filename}")
-                return filepath
-            else:
-                os.unlink(filepath)
+            buf.seek(0)
+            if not self._verify_image(buf):
                 return None
             
+            # one write of the accepted bytes
+            with open(filepath, "wb") as f:
+                f.write(buf.getbuffer())
+            print(f"[Scraper] saved: {filename}")
+            return filepath
+            
         except Exception as e:
             return None
     
@@ -249,14 +328,34 @@ class ImageScraper:
         
         return "jpg"  # default
     
-    def _verify_image(self, path: str) -> bool:
+    def _header_parser(self):
+        """incremental PIL parser, knows the image size once the header is in"""
+        try:
+            from PIL import ImageFile
+            return ImageFile.Parser()
+        except ImportError:
+            return None
+    
+    def _feed_header(self, parser, chunk: bytes):
+        """feed one chunk - (width, height) once the header is parsed,
+        () while it isnt yet, None if the parser cant read the format"""
+        try:
+            parser.feed(chunk)
+        except Exception:
+            return None
+        if parser.image is not None:
+            return parser.image.size
+        return ()
+    
+    def _verify_image(self, source) -> bool:
         """
         4a. verify image is valid and meets size requirements
+        source is a path or a file-like object (the download buffer)
         """
         try:
             from PIL import Image
             
-            with Image.open(path) as img:
+            with Image.open(source) as img:
                 width, height = img.size
                 
                 if width < self.min_width or height < self.min_height:
@@ -284,6 +383,8 @@ def test_scraper():
     
     for img in images:
         print(f"  - {img}")
+    
+    scraper.close()
 
 
 if __name__ == "__main__":
@@ -7,6 +7,7 @@ FIXED:
 - Scrape time capped at 10 minutes total
 - ABC quality checks with hamming distance dedupe
 - cinema-clean images only
+- candidate downloads run in a thread pool, across keywords too
 """
 
 import os
@@ -15,10 +16,365 @@ import time
 import random
 import hashlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
-from typing import List, Optional, Set, Dict
+import mmap
+import atexit
+import weakref
+import socket
+import sqlite3
+import threading
+import multiprocessing
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait
+from typing import List, Optional, Set, Dict, Tuple, Iterable, Iterator
 from urllib.parse import urlparse, unquote, quote_plus
-import tempfile
+import html
+
+
+def _content_hasher():
+    """exact-content hash for the dedupe fallback and the phash cache key
+    blake2b is in hashlib and outruns md5 on 64-bit cpus, 16 bytes is plenty"""
+    return hashlib.blake2b(digest_size=16)
+
+
+# scrapers with a browser that may still be up - shut at interpreter exit
+# so a caller that never calls close() doesnt leave chromium running
+_LIVE_SCRAPERS = weakref.WeakSet()
+
+
+@atexit.register
+def _close_live_scrapers():
+    for scraper in list(_LIVE_SCRAPERS):
+        scraper._close_browser()
+
+
+# each bing result anchor (a.iusc) carries its metadata as html-escaped
+# json in the m attribute - matched on bytes, no decode of the whole body
+_BING_M_ATTR_RE = re.compile(rb'class="iusc"[^>]*?\sm="(\{[^"]*\})"')
+
+# fallback when the anchors arent there: the murl key on its own, html-escaped
+# in the page or raw in some inline scripts
+_BING_MURL_RE = re.compile(rb'murl(?:&quot;|"):(?:&quot;|")(https?://[^"<>\s]+?)(?:&quot;|")')
+
+# finds the full-res preview google opens after a thumbnail click and
+# returns its best url (largest srcset entry, else src) - or null
+_GOOGLE_FULLRES_JS = """() => {
+    const img = document.querySelector('img[jsname="kn3ccd"]')
+        || document.querySelector('img.sFlh5c.pT0Scc.iPVvYb')
+        || document.querySelector('img[class*="r48jcc"]');
+    if (!img) return null;
+    let src = img.getAttribute('src');
+    if (!src || !src.startsWith('http') || src.includes('data:image')) return null;
+    const parts = (img.getAttribute('srcset') || '').split(',');
+    for (let i = parts.length - 1; i >= 0; i--) {
+        const url = parts[i].trim().split(' ')[0];
+        if (url.startsWith('http')) { src = url; break; }
+    }
+    return src;
+}"""
+
+# same, but only once the url is no longer the thumbnail - for wait_for_function
+_GOOGLE_FULLRES_READY_JS = "() => { const u = (" + _GOOGLE_FULLRES_JS + ")(); return u && !u.includes('encrypted-tbn') ? u : null; }"
+
+_GOOGLE_THUMB_SELECTOR = 'div[jsname="dTDiAc"], div[data-id]'
+
+_DCT_ROWS = {}
+
+
+def _dct2_low(arr, k: int = 8):
+    """
+    top-left k x k block of the 2D orthonormal DCT-II of a square array
+    the pHash only keeps those coefficients, so only k rows of the DCT
+    matrix are used: (k x n) @ (n x n) @ (n x k) - a quarter of the full
+    transform for 32 -> 8, and no scipy import attempt per image
+    """
+    m = _dct_rows(arr.shape[-1], k)
+    return m @ arr @ m.T  # broadcasts, so a (B, n, n) stack works too
+
+
+def _dct_rows(n: int, k: int):
+    """first k rows of the n-point orthonormal DCT-II matrix (cached)"""
+    import numpy as np
+    
+    if (n, k) not in _DCT_ROWS:
+        rows = np.arange(k)[:, None]
+        m = np.cos(np.pi * (2 * np.arange(n)[None, :] + 1) * rows / (2 * n)) * np.sqrt(2.0 / n)
+        m[0] /= np.sqrt(2.0)
+        _DCT_ROWS[(n, k)] = m.astype(np.float32)
+    return _DCT_ROWS[(n, k)]
+
+
+def _dct2_low_cuda(stack, k: int = 8):
+    """_dct2_low for a (B, n, n) stack on the gpu, None without torch/cuda"""
+    try:
+        import torch
+        if not torch.cuda.is_available():
+            return None
+        m = torch.from_numpy(_dct_rows(stack.shape[-1], k)).cuda()
+        x = torch.from_numpy(stack).cuda(non_blocking=True)
+        return (m @ x @ m.T).cpu().numpy()
+    except Exception:
+        return None
+
+
+def _decode_small(filepath: str, min_width: int = 0, min_height: int = 0):
+    """open an image once for both B and C checks
+    the real size comes from the header, then jpegs get a draft decode
+    (libjpeg scales by 1/2..1/8 in the idct) straight to grayscale
+    returns (width, height, small grayscale image) - the image is None when
+    the header already shows it's under min_width x min_height, no decode"""
+    from PIL import Image
+    
+    with Image.open(filepath) as img:
+        width, height = img.size
+        if width < min_width or height < min_height:
+            return width, height, None
+        img.draft("L", (32, 32))  # no-op for png/webp
+        return width, height, img.convert("L")
+
+
+def _size_ok(width: int, height: int, min_width: int, min_height: int) -> bool:
+    """B-check rules that only need the dimensions"""
+    # min resolution (rule 115: >= 900px width)
+    if width < min_width or height < min_height:
+        return False
+    
+    # aspect ratio check (rule 118: reject cramped images)
+    aspect = width / height
+    if aspect < 0.4 or aspect > 2.5:
+        return False
+    
+    # composition (rule 117, headroom for the face overlay) is permissive -
+    # nothing gets rejected on it, so there is nothing to compute
+    
+    return True
+
+
+def _phash_from_image(gray) -> int:
+    """compute perceptual hash (DCT pHash) - 64 bit, packed into an int
+    holds up to jpeg recompression and small crops better than dhash"""
+    import numpy as np
+    from PIL import Image
+    
+    # resize to 32x32
+    arr = np.asarray(gray.resize((32, 32), Image.Resampling.LANCZOS), dtype=np.float32)
+    
+    # keep the 8x8 lowest frequencies, threshold on their median (minus DC)
+    low = _dct2_low(arr, 8)
+    med = np.median(low.ravel()[1:])
+    bits = low > med
+    return int.from_bytes(np.packbits(bits.ravel()).tobytes(), "big")
+
+
+def _phash_batch(filepaths: List[str]) -> List[Optional[int]]:
+    """
+    pHash a lot of files at once (same hashes as _perceptual_hash)
+    decodes run on threads - PIL drops the GIL in the codecs - then every
+    32x32 goes through one stacked DCT, on the gpu when torch has cuda and
+    the batch is big enough to pay for the copy. None for unreadable files
+    """
+    import numpy as np
+    from PIL import Image
+    
+    def small(path):
+        try:
+            gray = _decode_small(path)[2]
+            return np.asarray(gray.resize((32, 32), Image.Resampling.LANCZOS), dtype=np.float32)
+        except Exception:
+            return None
+    
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 2)) as ex:
+        arrays = list(ex.map(small, filepaths))
+    
+    hashes: List[Optional[int]] = [None] * len(filepaths)
+    ok = [i for i, a in enumerate(arrays) if a is not None]
+    if not ok:
+        return hashes
+    
+    stack = np.stack([arrays[i] for i in ok])
+    low = _dct2_low_cuda(stack) if len(ok) >= 32 else None
+    if low is None:
+        low = _dct2_low(stack, 8)
+    flat = low.reshape(len(ok), -1)
+    med = np.median(flat[:, 1:], axis=1, keepdims=True)
+    for i, row in zip(ok, np.packbits(flat > med, axis=1)):
+        hashes[i] = int.from_bytes(row.tobytes(), "big")
+    return hashes
+
+
+def _quality_ok(filepath: str, min_width: int, min_height: int, min_size_kb: int) -> bool:
+    """B-check: quality validation (rules 84, 115)
+    module level so the check pool can pickle it"""
+    passed, _ = _check_bc_worker(filepath, min_width, min_height, min_size_kb, False)
+    return passed
+
+
+def _perceptual_hash(filepath: str) -> Optional[int]:
+    """pHash of an image file, None when the file cant be decoded"""
+    try:
+        return _phash_from_image(_decode_small(filepath)[2])
+    except Exception:
+        return None
+
+
+def _check_bc_worker(filepath: str, min_width: int, min_height: int, min_size_kb: int, need_hash: bool):
+    """check pool job: B-check plus the phash off a single reduced decode
+    returns (passed, phash or None)"""
+    try:
+        # file size check
+        if os.path.getsize(filepath) < min_size_kb * 1024:
+            return False, None
+        
+        width, height, gray = _decode_small(filepath, min_width, min_height)
+        if not _size_ok(width, height, min_width, min_height):
+            return False, None
+    except Exception as e:
+        print(f"[Scraper] quality check error: {e}")
+        return False, None
+    
+    if not need_hash:
+        return True, None
+    try:
+        return True, _phash_from_image(gray)
+    except Exception:
+        return True, None
+
+
+class _HashIndex:
+    """
+    seen image hashes kept as parallel arrays instead of a dict
+    the 64-bit phashes sit in one uint64 array (grown by doubling) next to
+    a list of the files they came from, so a check is one sweep over
+    contiguous memory. content digest fallbacks (strings) go in a plain dict
+    
+    near-duplicate lookups also go through a band index: the 64 bits are
+    cut into NEAR_RADIUS + 1 bands, and two hashes within NEAR_RADIUS bits
+    of each other must agree exactly on at least one band (pigeonhole).
+    so only rows sharing a band with the query get popcounted
+    """
+    
+    NEAR_RADIUS = 5
+    # (shift, mask) per band - 11,11,11,11,10,10 bits
+    _BANDS = ((0, 0x7FF), (11, 0x7FF), (22, 0x7FF), (33, 0x7FF), (44, 0x3FF), (54, 0x3FF))
+    
+    def __init__(self):
+        import numpy as np
+        self._np = np
+        self._hashes = np.empty(64, dtype=np.uint64)
+        self.paths: List[str] = []
+        self.exact: Dict[str, str] = {}
+        self._buckets: List[Dict[int, List[int]]] = [{} for _ in self._BANDS]
+    
+    def __len__(self) -> int:
+        return len(self.paths) + len(self.exact)
+    
+    @property
+    def phashes(self):
+        return self._hashes[:len(self.paths)]
+    
+    def add(self, h, path: str):
+        if not isinstance(h, int):
+            self.exact[h] = path
+            return
+        n = len(self.paths)
+        if n == len(self._hashes):
+            self._hashes = self._np.concatenate([self._hashes, self._np.empty_like(self._hashes)])
+        self._hashes[n] = h
+        self.paths.append(path)
+        self._index_row(n, h)
+    
+    def _index_row(self, row: int, h: int):
+        for bucket, (shift, mask) in zip(self._buckets, self._BANDS):
+            bucket.setdefault((h >> shift) & mask, []).append(row)
+    
+    def _popcount(self, xor):
+        np = self._np
+        if hasattr(np, "bitwise_count"):  # numpy 2.0+
+            return np.bitwise_count(xor)
+        # SWAR popcount - every constant is uint64 so nothing falls back to float
+        x = xor - ((xor >> np.uint64(1)) & np.uint64(0x5555555555555555))
+        x = (x & np.uint64(0x3333333333333333)) + ((x >> np.uint64(2)) & np.uint64(0x3333333333333333))
+        x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+        return (x * np.uint64(0x0101010101010101)) >> np.uint64(56)
+    
+    def min_distance(self, h: int) -> int:
+        """smallest hamming distance from h to any stored phash (64 if none)
+        one xor + popcount sweep over the whole array"""
+        phashes = self.phashes
+        if not len(phashes):
+            return 64
+        return int(self._popcount(phashes ^ self._np.uint64(h)).min())
+    
+    def has_near(self, h: int, radius: int = NEAR_RADIUS) -> bool:
+        """any stored phash within radius bits of h
+        only the rows sharing a band with h are compared"""
+        if radius > self.NEAR_RADIUS:
+            return self.min_distance(h) <= radius
+        rows = set()
+        for bucket, (shift, mask) in zip(self._buckets, self._BANDS):
+            rows.update(bucket.get((h >> shift) & mask, ()))
+        if not rows:
+            return False
+        np = self._np
+        candidates = self._hashes[np.fromiter(rows, dtype=np.intp, count=len(rows))]
+        return int(self._popcount(candidates ^ np.uint64(h)).min()) <= radius
+    
+    def to_dict(self) -> Dict[str, str]:
+        """manifest form - hash (as string) -> filepath"""
+        data = {str(h): p for h, p in zip(self.phashes.tolist(), self.paths)}
+        data.update(self.exact)
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, str], parse_key) -> "_HashIndex":
+        """rebuild from the manifest - phashes land in the array in one go"""
+        index = cls()
+        np = index._np
+        hashes = []
+        for k, v in data.items():
+            h = parse_key(k)
+            if isinstance(h, int):
+                hashes.append(h)
+                index.paths.append(v)
+            else:
+                index.exact[h] = v
+        if hashes:
+            # leave room to grow so the first adds dont reallocate
+            index._hashes = np.empty(max(64, 2 * len(hashes)), dtype=np.uint64)
+            index._hashes[:len(hashes)] = np.array(hashes, dtype=np.uint64)
+            for row, h in enumerate(hashes):
+                index._index_row(row, h)
+        return index
+
+
+def dedupe_images(filepaths: List[str]) -> List[str]:
+    """
+    drop visual duplicates from a list of image files, first one wins
+    same pHash + near-dup radius as the scraper uses, so the same picture
+    saved from two urls (or borrowed from two jobs) only counts once.
+    files that wont decode are compared by content digest instead
+    """
+    index = _HashIndex()
+    unique = []
+    for path, h in zip(filepaths, _phash_batch(filepaths)):
+        if h is None:
+            try:
+                hasher = _content_hasher()
+                with open(path, "rb") as f:
+                    for chunk in iter(lambda: f.read(1 << 16), b""):
+                        hasher.update(chunk)
+                h = hasher.hexdigest()
+            except OSError:
+                continue
+            if h in index.exact:
+                continue
+        elif index.has_near(h):
+            continue
+        index.add(h, path)
+        unique.append(path)
+    return unique
 
 
 class ImageScraperPro:
@@ -28,7 +384,7 @@ class ImageScraperPro:
     """
     
     # blocked domains - hostname based checking (rule 116)
-    BLOCKED_HOSTNAMES = {
+    BLOCKED_HOSTNAMES = frozenset({
         # stock sites with watermarks
         "alamy.com", "www.alamy.com",
         "shutterstock.com", "www.shutterstock.com",
@@ -53,7 +409,7 @@ class ImageScraperPro:
         # social media profile pics / low quality
         "gravatar.com", "0.gravatar.com", "1.gravatar.com", "2.gravatar.com",
         "pbs.twimg.com",  # but we'll check path for /profile
-    }
+    })
     
     # bad URL patterns (thumbnails, previews, etc)
     BAD_URL_PATTERNS = [
@@ -70,10 +426,22 @@ class ImageScraperPro:
         "encrypted-tbn", "gstatic.com/images",  # google thumbnails
         "data:image",  # base64 encoded (usually tiny)
     ]
+    # all the patterns in one pass over the url instead of one scan each
+    BAD_URL_RE = re.compile("|".join(map(re.escape, BAD_URL_PATTERNS)), re.IGNORECASE)
+    
+    # per-request extras for image fetches (UA/Accept live on the session)
+    IMAGE_HEADERS = {"Referer": "https://www.google.com/"}
     
     # max download size in bytes (12MB cap - rule 12)
     MAX_DOWNLOAD_SIZE = 12 * 1024 * 1024
     
+    # content digest -> phash, shared by every job so re-fetched bytes skip the decode
+    PHASH_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "da-editor", "phash_cache.db")
+    
+    # concurrent candidate downloads (network bound, so threads are fine)
+    DOWNLOAD_WORKERS = 16
+    PER_HOST_LIMIT = 4  # dont hammer one CDN with every worker at once
+    
     # user agents
     USER_AGENTS = [
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -94,15 +462,43 @@ class ImageScraperPro:
         self.min_height = min_height
         self.min_size_kb = min_size_kb
         self.manifest_path = manifest_path
+        self._manifest_saved = None  # (urls, hashes) counts at the last load/save
         
         # tracking for deduplication
-        self.used_urls: Set[str] = set()
-        self.used_hashes: Dict[str, str] = {}  # hash -> filepath
+        self.used_urls: Set[bytes] = set()  # 8-byte url digests, see _url_key
+        self.used_hashes = _HashIndex()  # 64-bit phashes (or digest strs) -> filepath
+        # url hashes already sitting in output_dir (from the caller's listing)
+        self.known_url_hashes: Set[str] = set()
+        # guards used_urls/used_hashes when downloads run in parallel
+        self._lock = threading.Lock()
+        self._phash_db = None  # opened on first use, False if it cant be
+        self._check_pool = None  # processes for the decode-heavy B/C work
+        self._phash_db_lock = threading.Lock()
+        
+        # one keep-alive pool for every image/search request, so repeat
+        # hits on the same CDN skip the TCP+TLS handshake
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # one UA for the whole session (http + browser) - a host seeing the
+        # same client throughout looks less like a bot than a rotating one
+        self.user_agent = random.choice(self.USER_AGENTS)
+        self.session.headers.update({
+            "User-Agent": self.user_agent,
+            "Accept": "image/*,*/*",
+            "Accept-Language": "en-US,en;q=0.9",
+        })
         
         # FIXED: Reuse browser across searches
         self._browser = None
         self._context = None
         self._playwright = None
+        self._browser_failed = False  # dont relaunch chromium every search if it cant start
         self._scrape_start_time = None
         self._max_scrape_time = 10 * 60  # 10 minute cap
         
@@ -120,32 +516,107 @@ class ImageScraperPro:
             try:
                 with open(self.manifest_path, "r") as f:
                     data = json.load(f)
-                    self.used_urls = set(data.get("used_urls", []))
-                    self.used_hashes = data.get("used_hashes", {})
+                    self.used_urls = {self._parse_url_key(u) for u in data.get("used_urls", [])}
+                    raw = data.get("used_hashes", {})
+                    hashes = self._rehash_legacy(raw)
+                    self.used_hashes = _HashIndex.from_dict(hashes, self._parse_hash_key)
+                    if hashes is raw:  # re-hashed entries still need writing back
+                        self._manifest_saved = (len(self.used_urls), len(self.used_hashes))
                     print(f"[Scraper] loaded manifest: {len(self.used_urls)} URLs, {len(self.used_hashes)} hashes")
             except Exception as e:
                 print(f"[Scraper] manifest load error: {e}")
     
+    def _rehash_legacy(self, hashes: Dict[str, str]) -> Dict[str, str]:
+        """
+        old manifests hold dhashes (64 char '0'/'1' keys) which never line up
+        with a pHash - re-hash the ones whose files are still around, all in
+        one batch. the next save_manifest writes them back as phashes
+        """
+        legacy = [k for k, p in hashes.items()
+                  if len(k) == 64 and set(k) <= {"0", "1"} and os.path.exists(p)]
+        if not legacy:
+            return hashes
+        
+        hashes = dict(hashes)
+        fresh = _phash_batch([hashes[k] for k in legacy])
+        for key, phash in zip(legacy, fresh):
+            if phash is not None:
+                hashes[str(phash)] = hashes.pop(key)
+        print(f"[Scraper] re-hashed {sum(h is not None for h in fresh)} legacy dhash entries")
+        return hashes
+    
+    @staticmethod
+    def _url_key(url: str) -> bytes:
+        """8-byte digest standing in for a seen url
+        a long crawl keeps thousands of these, the full strings are 100-200
+        bytes each - collisions at 64 bits are not a practical concern"""
+        return hashlib.blake2b(url.encode(), digest_size=8).digest()
+    
+    @classmethod
+    def _parse_url_key(cls, item: str) -> bytes:
+        """manifest entry -> url key, old manifests stored the urls themselves"""
+        if len(item) == 16 and not item.startswith("http"):
+            try:
+                return bytes.fromhex(item)
+            except ValueError:
+                pass
+        return cls._url_key(item)
+    
+    @staticmethod
+    def _parse_hash_key(key: str):
+        """json turns the int hashes into strings - turn them back
+        old manifests stored dhash as a 64 char '0'/'1' string"""
+        if len(key) == 64 and set(key) <= {"0", "1"}:
+            return int(key, 2)
+        if key.isdigit():
+            return int(key)
+        return key  # content digest fallback
+    
     def _get_browser(self):
         """FIXED: Get or create browser - REUSES existing browser"""
         if self._browser is not None:
             return self._browser
+        if self._browser_failed:
+            return None
         
         try:
             from playwright.sync_api import sync_playwright
             
             self._playwright = sync_playwright().start()
             self._browser = self._playwright.chromium.launch(headless=True)
-            self._context = self._browser.new_context(
-                user_agent=random.choice(self.USER_AGENTS),
-                viewport={"width": 1920, "height": 1080}
-            )
+            _LIVE_SCRAPERS.add(self)
             print("[Scraper] browser started (will be reused)")
             return self._browser
         except Exception as e:
             print(f"[Scraper] failed to start browser: {e}")
+            self._browser_failed = True
+            self._close_browser()  # whatever half started
             return None
     
+    def _new_page(self):
+        """open a tab in the shared context (made once, next to the browser)"""
+        if not self._context:
+            self._context = self._browser.new_context(
+                user_agent=self.user_agent,
+                viewport={"width": 1920, "height": 1080}
+            )
+            self._context.route("**/*", self._route_request)
+        return self._context.new_page()
+    
+    def _route_request(self, route):
+        """
+        drop what the url collection never looks at - fonts, video and the
+        thumbnail grid (gstatic tbn). other images still load because google
+        only swaps the full-res url into the preview once it has loaded
+        """
+        request = route.request
+        if request.resource_type in ("font", "media") or (
+            request.resource_type == "image" and "encrypted-tbn" in request.url
+        ):
+            route.abort()
+        else:
+            route.continue_()
+    
     def _close_browser(self):
         """Close the browser when done"""
         try:
@@ -159,6 +630,20 @@ class ImageScraperPro:
         except:
             pass
     
+    def close(self):
+        """Close the browser and the http pool"""
+        self._close_browser()
+        try:
+            self.session.close()
+        except Exception:
+            pass
+        if self._phash_db:
+            self._phash_db.close()
+            self._phash_db = None
+        if self._check_pool:
+            self._check_pool.shutdown(wait=False, cancel_futures=True)
+            self._check_pool = None
+    
     def __del__(self):
         """Cleanup browser on destruction"""
         self._close_browser()
@@ -166,95 +651,299 @@ class ImageScraperPro:
     def save_manifest(self):
         """save manifest for persistence (rule 88)"""
         if self.manifest_path:
+            # both only ever grow, so equal counts = nothing new to write
+            sizes = (len(self.used_urls), len(self.used_hashes))
+            if sizes == self._manifest_saved:
+                return
             data = {
-                "used_urls": list(self.used_urls),
-                "used_hashes": self.used_hashes
+                "used_urls": [k.hex() for k in self.used_urls],
+                "used_hashes": self.used_hashes.to_dict()
             }
-            with open(self.manifest_path, "w") as f:
-                json.dump(data, f, indent=2)
+            # compact, and swapped in whole so a crash mid-write cant
+            # truncate the cross-job history
+            tmp_path = self.manifest_path + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, self.manifest_path)
+            self._manifest_saved = sizes
     
-    def search(self, keyword: str, max_images: int = 5) -> List[str]:
+    def set_output_dir(self, output_dir: str):
         """
-        main search - FIXED: reuses browser, respects time limit
+        point the scraper at the next job's images folder
+        per-job dedup state and the time cap start over, the browser stays up
         """
+        self.output_dir = output_dir
+        os.makedirs(output_dir, exist_ok=True)
+        with self._lock:
+            self.known_url_hashes = set()
+            if not self.manifest_path:
+                self.used_urls = set()
+                self.used_hashes = _HashIndex()
+        self._scrape_start_time = None
+    
+    def _time_left(self) -> bool:
+        """True while we are inside the scrape time cap"""
         # Initialize scrape start time if not set
         if self._scrape_start_time is None:
             self._scrape_start_time = time.time()
         
-        # Check time limit
         elapsed = time.time() - self._scrape_start_time
         if elapsed > self._max_scrape_time:
             print(f"[Scraper] time limit reached ({elapsed:.0f}s), skipping search")
-            return []
-        
+            return False
+        return True
+    
+    def note_existing(self, existing: Optional[Set[str]]):
+        """
+        remember files the caller already has in output_dir
+        saved names look like {keyword}_{urlhash}.{ext} so the url hash is
+        enough to skip re-downloading the same picture
+        """
+        for path in existing or ():
+            stem = os.path.splitext(os.path.basename(path))[0]
+            self.known_url_hashes.add(stem.rsplit("_", 1)[-1])
+    
+    @staticmethod
+    def _url_hash(url: str) -> str:
+        return hashlib.md5(url.encode()).hexdigest()[:10]
+    
+    def search(self, keyword: str, max_images: int = 5, existing: Optional[Set[str]] = None) -> List[str]:
+        """
+        main search - FIXED: reuses browser, respects time limit
+        """
         print(f"[Scraper] searching: {keyword}")
-        downloaded = []
+        return self.search_many([keyword], max_images, existing)
+    
+    def search_many(self, keywords: List[str], max_per_keyword: int = 5, existing: Optional[Set[str]] = None) -> List[str]:
+        """
+        search several keywords at once
+        the browser collects candidate urls keyword by keyword (sync playwright
+        is tied to one thread) while bing's plain-html search runs for every
+        keyword on worker threads. each keyword's candidates go into the shared
+        download pool as soon as they're collected, so the downloads for one
+        keyword overlap the browser work for the next
+        """
+        self.note_existing(existing)
+        if not self._time_left():
+            return []
         
-        # step 1: playwright with SHARED browser
+        batches = self._collect_candidates(keywords, max_per_keyword * 3)
         try:
-            downloaded = self._search_playwright_click(keyword, max_images)
-            print(f"[Scraper] playwright: {len(downloaded)} images")
-        except Exception as e:
-            print(f"[Scraper] playwright failed: {e}")
+            per_keyword = self._download_candidates(batches, max_per_keyword)
+        finally:
+            batches.close()
+        self.save_manifest()
         
-        # step 2: bing fallback (check time limit first)
-        if len(downloaded) < max_images:
-            elapsed = time.time() - self._scrape_start_time
-            if elapsed < self._max_scrape_time:
+        downloaded = []
+        for keyword in keywords:
+            downloaded.extend(per_keyword.get(keyword, []))
+        print(f"[Scraper] search_many: {len(downloaded)} images for {len(keywords)} keywords")
+        return downloaded
+    
+    def _collect_candidates(self, keywords: List[str], wanted: int) -> Iterator[List[Tuple[str, str]]]:
+        """
+        yield each keyword's (keyword, url) candidates as they're collected
+        runs on the caller's thread - the browser has to stay on it
+        """
+        next_page = None
+        ex = ThreadPoolExecutor(max_workers=4)
+        try:
+            bing = {kw: ex.submit(self._collect_bing_requests_urls, kw, wanted) for kw in keywords}
+            for i, keyword in enumerate(keywords):
+                if not self._time_left():
+                    break
+                print(f"[Scraper] collecting: {keyword}")
                 try:
-                    remaining = max_images - len(downloaded)
-                    more = self._search_bing(keyword, remaining)
-                    downloaded.extend(more)
-                    print(f"[Scraper] bing fallback: {len(more)} more")
+                    # the next keyword's results load in a second tab while
+                    # this one is being clicked through
+                    page, next_page = next_page, None
+                    if i + 1 < len(keywords):
+                        next_page = self._open_google_page(keywords[i + 1])
+                    urls = self._collect_google_urls(keyword, wanted, page)
+                    print(f"[Scraper] playwright: {len(urls)} candidates")
                 except Exception as e:
-                    print(f"[Scraper] bing failed: {e}")
-        
-        # save manifest after each search
-        self.save_manifest()
-        
-        return downloaded[:max_images]
+                    print(f"[Scraper] playwright failed: {e}")
+                    urls = []
+                if len(urls) < wanted:
+                    try:
+                        more = [u for u in bing[keyword].result() if u not in urls]
+                        urls += more[:wanted - len(urls)]
+                    except Exception as e:
+                        print(f"[Scraper] bing failed: {e}")
+                yield [(keyword, u) for u in urls]
+        finally:
+            # bing lookups / a prefetched tab for keywords we never got to
+            ex.shutdown(wait=False, cancel_futures=True)
+            if next_page is not None:
+                try:
+                    next_page.close()
+                except Exception:
+                    pass
     
-    def _search_playwright_click(self, keyword: str, max_images: int) -> List[str]:
+    def _download_candidates(self, batches: Iterable[List[Tuple[str, str]]], max_per_keyword: int) -> Dict[str, List[str]]:
         """
-        playwright scraper - FIXED: REUSES browser from _get_browser()
+        download batches of (keyword, url) candidates in parallel
+        each batch is submitted as soon as it arrives, so a slow producer
+        (the browser) doesnt hold back the downloads it already handed over
+        a download only starts once it holds one of the keyword's
+        max_per_keyword slots, so no surplus image gets saved or recorded
+        in used_hashes. candidates that find every slot taken wait in a
+        queue and get the slot back if a download fails
+        returns keyword -> saved paths, in candidate order
         """
-        browser = self._get_browser()
-        if not browser:
-            # Fallback to requests-only search
-            return self._search_bing_requests(keyword, max_images)
+        results: Dict[str, Dict[int, str]] = {}
+        counts: Dict[str, int] = {}
+        inflight: Dict[str, int] = {}
+        waiting: Dict[str, deque] = {}
+        counts_lock = threading.Lock()
+        host_slots: Dict[str, threading.Semaphore] = {}
         
-        downloaded = []
+        def slot_for(url: str) -> threading.Semaphore:
+            host = urlparse(url).hostname or ""
+            with counts_lock:
+                if host not in host_slots:
+                    host_slots[host] = threading.Semaphore(self.PER_HOST_LIMIT)
+                return host_slots[host]
         
-        # Use the shared context
-        if not self._context:
-            self._context = browser.new_context(
-                user_agent=random.choice(self.USER_AGENTS),
-                viewport={"width": 1920, "height": 1080}
-            )
+        def fetch(keyword: str, url: str) -> Optional[str]:
+            if self._url_hash(url) in self.known_url_hashes:
+                return None
+            if not self._check_url(url):
+                return None
+            if self._known_duplicate(url):
+                return None  # same bytes as something we already have
+            with slot_for(url):
+                return self._download_and_validate(url, keyword)
+        
+        def work(i: int, keyword: str, url: str):
+            while True:
+                # reserve a slot before anything is downloaded or recorded
+                with counts_lock:
+                    if counts[keyword] >= max_per_keyword:
+                        return
+                    if counts[keyword] + inflight[keyword] >= max_per_keyword:
+                        waiting[keyword].append((i, url))
+                        return
+                    inflight[keyword] += 1
+                
+                path = None
+                try:
+                    path = fetch(keyword, url)
+                finally:
+                    with counts_lock:
+                        inflight[keyword] -= 1
+                        nxt = None
+                        if path:
+                            counts[keyword] += 1
+                            results[keyword][i] = path
+                        elif waiting[keyword]:
+                            nxt = waiting[keyword].popleft()  # hand the slot on
+                if nxt is None:
+                    return
+                i, url = nxt
+        
+        i = 0
+        futures = []
+        with ThreadPoolExecutor(max_workers=self.DOWNLOAD_WORKERS) as ex:
+            for batch in batches:
+                if not batch:
+                    continue
+                self._prewarm_dns(url for _, url in batch)
+                for keyword, url in batch:
+                    with counts_lock:
+                        counts.setdefault(keyword, 0)
+                        inflight.setdefault(keyword, 0)
+                        waiting.setdefault(keyword, deque())
+                        results.setdefault(keyword, {})
+                    futures.append(ex.submit(work, i, keyword, url))
+                    i += 1
+        
+        for f in futures:
+            if f.exception() is not None:
+                print(f"[Scraper] download worker failed: {f.exception()}")
+        
+        return {kw: [paths[j] for j in sorted(paths)] for kw, paths in results.items()}
+    
+    def _prewarm_dns(self, urls, timeout: float = 3.0):
+        """
+        resolve every candidate host at once before downloading
+        candidates spread over ~20 CDNs, so the cold lookups would otherwise
+        land one by one on the first request to each host. this fills the
+        system resolver cache (systemd-resolved/nscd), slow hosts are left
+        to the download itself after timeout
+        """
+        hosts = {urlparse(u).hostname for u in urls} - {None}
+        if not hosts:
+            return
+        ex = ThreadPoolExecutor(max_workers=min(16, len(hosts)))
+        try:
+            futures = [ex.submit(socket.getaddrinfo, h, 443, type=socket.SOCK_STREAM) for h in hosts]
+            wait(futures, timeout=timeout)
+        finally:
+            ex.shutdown(wait=False, cancel_futures=True)
+    
+    def _open_google_page(self, keyword: str):
+        """
+        open a tab and start the google images search for keyword
+        returns as soon as the navigation is committed, so the results load
+        in the background while another tab is being worked through
+        None when there is no browser
+        """
+        if not self._get_browser():
+            return None
         
-        page = self._context.new_page()
+        page = self._new_page()
         
         # URL encode keyword properly
         encoded_keyword = quote_plus(keyword)
         search_url = f"https://www.google.com/search?q={encoded_keyword}&tbm=isch&tbs=isz:l"
         
         try:
-            page.goto(search_url, wait_until="domcontentloaded", timeout=30000)
-            time.sleep(2)  # let images load
+            page.goto(search_url, wait_until="commit", timeout=30000)
+        except Exception as e:
+            print(f"[Scraper] page load error: {e}")
+        return page
+    
+    def _collect_google_urls(self, keyword: str, max_urls: int, page=None) -> List[str]:
+        """
+        playwright scraper - FIXED: REUSES browser from _get_browser()
+        clicks thumbnails and collects the full-res urls, no downloading here
+        page is a tab from _open_google_page that may already be loading
+        """
+        if page is None:
+            page = self._open_google_page(keyword)
+        if page is None:
+            # no browser - search_many's bing lookup already covers this keyword
+            return []
+        
+        urls = []
+        
+        try:
+            page.wait_for_load_state("domcontentloaded", timeout=30000)
             
             # handle consent if needed
             try:
                 consent_btn = page.query_selector('button[aria-label*="Accept"]')
                 if consent_btn:
                     consent_btn.click()
-                    time.sleep(1)
+                    page.wait_for_load_state("domcontentloaded", timeout=5000)
             except:
                 pass
             
-            # scroll to load more thumbnails
+            # go as soon as the grid is there instead of a fixed sleep
+            try:
+                page.wait_for_selector(_GOOGLE_THUMB_SELECTOR, timeout=5000)
+            except Exception:
+                pass
+            
+            # scroll to load more thumbnails - stop once a scroll adds nothing
             for _ in range(3):
+                count = page.evaluate("document.images.length")
                 page.evaluate("window.scrollBy(0, 600)")
-                time.sleep(0.4)
+                try:
+                    page.wait_for_function("n => document.images.length > n", arg=count, timeout=2000)
+                except Exception:
+                    break
             
             # get all thumbnail containers - these are clickable
             thumbnails = page.query_selector_all('div[jsname="dTDiAc"]')
@@ -263,46 +952,23 @@ class ImageScraperPro:
             
             print(f"[Scraper] found {len(thumbnails)} thumbnails to try")
             
-            tried = 0
-            for thumb in thumbnails[:max_images * 4]:
-                if len(downloaded) >= max_images:
-                    break
-                if tried >= max_images * 3:
+            for thumb in thumbnails[:max_urls + max_urls // 3]:
+                if len(urls) >= max_urls:
                     break
                 
-                tried += 1
-                time.sleep(0.3)
-                
                 try:
                     thumb.click()
-                    time.sleep(0.8)
-                    
-                    real_img = page.query_selector('img[jsname="kn3ccd"]')
-                    if not real_img:
-                        real_img = page.query_selector('img.sFlh5c.pT0Scc.iPVvYb')
-                    if not real_img:
-                        real_img = page.query_selector('img[class*="r48jcc"]')
                     
-                    if real_img:
-                        src = real_img.get_attribute("src")
-                        
-                        if src and src.startswith("http") and "data:image" not in src:
-                            srcset = real_img.get_attribute("srcset")
-                            if srcset:
-                                parts = srcset.split(",")
-                                for part in reversed(parts):
-                                    url = part.strip().split(" ")[0]
-                                    if url.startswith("http"):
-                                        src = url
-                                        break
-                            
-                            if self._check_url(src):
-                                path = self._download_and_validate(src, keyword)
-                                if path:
-                                    downloaded.append(path)
+                    # wait for the preview to swap in its full-res url,
+                    # one evaluate instead of a round-trip per selector/attribute
+                    try:
+                        src = page.wait_for_function(_GOOGLE_FULLRES_READY_JS, timeout=2500).json_value()
+                    except Exception:
+                        src = page.evaluate(_GOOGLE_FULLRES_JS)
+                    if src and self._check_url(src) and src not in urls:
+                        urls.append(src)
                     
                     page.keyboard.press("Escape")
-                    time.sleep(0.2)
                     
                 except Exception as e:
                     continue
@@ -315,99 +981,57 @@ class ImageScraperPro:
             except:
                 pass
         
-        return downloaded
+        return urls
     
-    def _search_bing(self, keyword: str, max_images: int) -> List[str]:
-        """bing images fallback - FIXED: REUSES browser"""
-        downloaded = []
-        
-        browser = self._get_browser()
-        if not browser:
-            return self._search_bing_requests(keyword, max_images)
-        
-        # Use the shared context
-        if not self._context:
-            self._context = browser.new_context(
-                user_agent=random.choice(self.USER_AGENTS),
-                viewport={"width": 1920, "height": 1080}
-            )
-        
-        page = self._context.new_page()
+    def _collect_bing_requests_urls(self, keyword: str, max_urls: int) -> List[str]:
+        """bing via plain requests - the murl is in the html, no browser needed
+        thread safe, so search_many runs it alongside the browser"""
+        urls = []
         
         encoded = quote_plus(keyword)
         search_url = f"https://www.bing.com/images/search?q={encoded}&qft=+filterui:imagesize-large"
         
         try:
-            page.goto(search_url, wait_until="domcontentloaded", timeout=30000)
-            time.sleep(2)
+            response = self.session.get(search_url, timeout=15)
             
-            # scroll
-            for _ in range(3):
-                page.evaluate("window.scrollBy(0, 600)")
-                time.sleep(0.4)
-            
-            # bing stores the actual image URL in the murl attribute
-            images = page.query_selector_all('a.iusc')
-            
-            for img in images[:max_images * 3]:
-                if len(downloaded) >= max_images:
+            for url in self._parse_bing_results(response.content):
+                if len(urls) >= max_urls:
                     break
-                
-                try:
-                    m_attr = img.get_attribute("m")
-                    if m_attr:
-                        data = json.loads(m_attr)
-                        url = data.get("murl")
+                if self._check_url(url) and url not in urls:
+                    urls.append(url)
                         
-                        if url and self._check_url(url):
-                            time.sleep(0.3)
-                            path = self._download_and_validate(url, keyword)
-                            if path:
-                                downloaded.append(path)
-                except:
-                    continue
-            
         except Exception as e:
-            print(f"[Scraper] bing error: {e}")
-        finally:
-            try:
-                page.close()
-            except:
-                pass
+            print(f"[Scraper] requests fallback failed: {e}")
         
-        return downloaded
+        return urls
     
-    def _search_bing_requests(self, keyword: str, max_images: int) -> List[str]:
-        """requests-only bing fallback for when playwright is unavailable"""
-        downloaded = []
-        
-        headers = {"User-Agent": random.choice(self.USER_AGENTS)}
-        encoded = quote_plus(keyword)
-        search_url = f"https://www.bing.com/images/search?q={encoded}&qft=+filterui:imagesize-large"
-        
-        try:
-            response = requests.get(search_url, headers=headers, timeout=15)
-            
-            # extract murl from page
-            urls = re.findall(r'"murl":"(https?://[^"]+)"', response.text)
-            
-            for url in urls[:max_images * 2]:
-                if len(downloaded) >= max_images:
-                    break
-                
-                # unescape the url
-                url = url.replace("\\u0026", "&")
-                
-                if self._check_url(url):
-                    time.sleep(0.5)
-                    path = self._download_and_validate(url, keyword)
-                    if path:
-                        downloaded.append(path)
-                        
-        except Exception as e:
-            print(f"[Scraper] requests fallback failed: {e}")
+    def _parse_bing_results(self, content: bytes) -> Iterator[str]:
+        """
+        full-size urls from a bing results page, in page order
+        reads each result's m json - when it reports the image size (mw/mh)
+        undersized ones are dropped here, before any request is made
+        """
+        found = False
+        for m in _BING_M_ATTR_RE.finditer(content):
+            try:
+                meta = json.loads(html.unescape(m.group(1).decode("utf-8", "replace")))
+            except ValueError:
+                continue
+            url = meta.get("murl")
+            if not url:
+                continue
+            found = True
+            try:
+                width, height = int(meta.get("mw") or 0), int(meta.get("mh") or 0)
+            except (TypeError, ValueError):
+                width = height = 0
+            if width and height and (width < self.min_width or height < self.min_height):
+                continue
+            yield url
         
-        return downloaded
+        if not found:
+            for m in _BING_MURL_RE.finditer(content):
+                yield html.unescape(m.group(1).decode("utf-8", "replace")).replace("\\u0026", "&")
     
     # =====================
     # URL VALIDATION (A-check)
@@ -418,8 +1042,6 @@ class ImageScraperPro:
         if not url or not url.startswith("http"):
             return False
         
-        url_lower = url.lower()
-        
         # parse hostname
         try:
             parsed = urlparse(url)
@@ -427,18 +1049,20 @@ class ImageScraperPro:
         except:
             return False
         
-        # check blocked hostnames (rule 116)
-        for blocked in self.BLOCKED_HOSTNAMES:
-            if hostname == blocked or hostname.endswith("." + blocked):
+        # check blocked hostnames (rule 116) - the host and each parent
+        # domain is one set lookup (a.b.alamy.com -> b.alamy.com -> alamy.com)
+        parts = hostname.split(".")
+        for i in range(len(parts) - 1):
+            if ".".join(parts[i:]) in self.BLOCKED_HOSTNAMES:
                 return False
         
-        # check bad URL patterns (thumbnails, previews, icons)
-        for pattern in self.BAD_URL_PATTERNS:
-            if pattern in url_lower:
-                return False
+        # check bad URL patterns (thumbnails, previews, icons) - the regex
+        # is case-insensitive so theres no lowered copy of the url
+        if self.BAD_URL_RE.search(url):
+            return False
         
         # already used (rule 87)
-        if url in self.used_urls:
+        if self._url_key(url) in self.used_urls:
             return False
         
         return True
@@ -449,105 +1073,174 @@ class ImageScraperPro:
     
     def _check_quality(self, filepath: str) -> bool:
         """B-check: quality validation (rules 84, 115)"""
+        return _quality_ok(filepath, self.min_width, self.min_height, self.min_size_kb)
+    
+    def _header_parser(self):
+        """incremental PIL parser, knows the image size once the header is in"""
         try:
-            from PIL import Image
-            
-            # file size check
-            size = os.path.getsize(filepath)
-            if size < self.min_size_kb * 1024:
-                return False
-            
-            with Image.open(filepath) as img:
-                width, height = img.size
-                
-                # min resolution (rule 115: >= 900px width)
-                if width < self.min_width or height < self.min_height:
-                    return False
-                
-                # aspect ratio check (rule 118: reject cramped images)
-                aspect = width / height
-                if aspect < 0.4 or aspect > 2.5:
-                    return False
-                
-                # composition check for face overlay (rule 117)
-                # for portrait format, prefer images with headroom
-                # reject images where main content is in bottom 30%
-                # we use a simple heuristic: check if bottom portion is mostly uniform
-                # (indicates empty space vs subject)
-                if aspect < 1.0:  # portrait-ish
-                    # crop bottom 30%
-                    bottom = img.crop((0, int(height * 0.7), width, height))
-                    # convert to grayscale and check variance
-                    gray = bottom.convert("L")
-                    pixels = list(gray.getdata())
-                    if len(pixels) > 0:
-                        avg = sum(pixels) / len(pixels)
-                        variance = sum((p - avg) ** 2 for p in pixels) / len(pixels)
-                        # low variance = uniform = probably background = good
-                        # high variance with high brightness = might be subject = still ok
-                        # we're being permissive here
-                
-            return True
-            
-        except Exception as e:
-            print(f"[Scraper] quality check error: {e}")
-            return False
+            from PIL import ImageFile
+            return ImageFile.Parser()
+        except ImportError:
+            return None
     
     # =====================
     # UNIQUENESS CHECK (C-check with Hamming distance)
     # =====================
     
-    def _check_unique(self, filepath: str) -> bool:
-        """C-check: uniqueness via perceptual hash with Hamming distance (rules 85-87)"""
+    def _check_unique(self, filepath: str, digest: Optional[str] = None, phash=None) -> bool:
+        """C-check: uniqueness via perceptual hash with Hamming distance (rules 85-87)
+        digest is the content hash taken while downloading, saves reading the file again
+        phash skips hashing when the check pool already did it"""
         try:
-            phash = self._get_perceptual_hash(filepath)
+            if phash is None:
+                phash = self._cached_phash(filepath, digest)
             
-            # check for NEAR duplicates using Hamming distance
-            # two hashes within 5 bits difference are considered duplicates
-            for existing_hash in self.used_hashes:
-                distance = self._hamming_distance(phash, existing_hash)
-                if distance <= 5:  # threshold for near-duplicate
-                    return False
+            if not isinstance(phash, int):
+                raise ValueError("no perceptual hash")
             
-            self.used_hashes[phash] = filepath
-            return True
+            with self._lock:
+                # check for NEAR duplicates using Hamming distance
+                # two hashes within 5 bits difference are considered duplicates
+                if self.used_hashes.has_near(phash, 5):  # threshold for near-duplicate
+                    return False
+                
+                self.used_hashes.add(phash, filepath)
+                return True
             
         except Exception:
-            # fallback to md5
-            md5 = hashlib.md5(open(filepath, 'rb').read()).hexdigest()
-            if md5 in self.used_hashes:
-                return False
-            self.used_hashes[md5] = filepath
-            return True
+            # fallback to the exact content digest
+            digest = digest or self._file_digest(filepath)
+            with self._lock:
+                if digest in self.used_hashes.exact:
+                    return False
+                self.used_hashes.add(digest, filepath)
+                return True
     
-    def _get_perceptual_hash(self, filepath: str) -> str:
-        """compute perceptual hash (dhash) - 64 bit"""
-        try:
-            from PIL import Image
-            
-            with Image.open(filepath) as img:
-                # convert to grayscale and resize to 9x8
-                img = img.convert("L").resize((9, 8), Image.Resampling.LANCZOS)
-                pixels = list(img.getdata())
-                
-                # compute difference hash
-                diff = []
-                for row in range(8):
-                    for col in range(8):
-                        idx = row * 9 + col
-                        diff.append('1' if pixels[idx] < pixels[idx + 1] else '0')
-                
-                return ''.join(diff)
-                
-        except Exception:
-            # fallback
-            return hashlib.md5(open(filepath, 'rb').read()).hexdigest()[:64]
+    def _phash_cache(self):
+        """sqlite content digest -> phash table, None when unavailable"""
+        with self._phash_db_lock:
+            if self._phash_db is None:
+                try:
+                    os.makedirs(os.path.dirname(self.PHASH_CACHE_PATH), exist_ok=True)
+                    db = sqlite3.connect(self.PHASH_CACHE_PATH, check_same_thread=False)
+                    db.execute("PRAGMA journal_mode=WAL")
+                    db.execute("PRAGMA synchronous=NORMAL")
+                    # hex text - phashes use all 64 bits and sqlite ints are signed
+                    db.execute("CREATE TABLE IF NOT EXISTS content_phash(digest TEXT PRIMARY KEY, phash TEXT)")
+                    # which bytes a url served last time (key is _url_key hex)
+                    db.execute("CREATE TABLE IF NOT EXISTS url_content(key TEXT PRIMARY KEY, digest TEXT)")
+                    db.commit()
+                    self._phash_db = db
+                except Exception as e:
+                    print(f"[Scraper] phash cache unavailable: {e}")
+                    self._phash_db = False
+            return self._phash_db or None
+    
+    def _file_digest(self, filepath: str) -> str:
+        """content digest of a file through mmap - no copy of the bytes into python"""
+        with open(filepath, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return _content_hasher().hexdigest()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hasher = _content_hasher()
+                hasher.update(mm)
+                return hasher.hexdigest()
+    
+    def _phash_lookup(self, digest: str) -> Optional[int]:
+        """cached phash for these exact bytes, None on a miss"""
+        db = self._phash_cache()
+        if not db:
+            return None
+        with self._phash_db_lock:
+            row = db.execute("SELECT phash FROM content_phash WHERE digest=?", (digest,)).fetchone()
+        return int(row[0], 16) if row else None
+    
+    def _phash_store(self, digest: str, phash: int):
+        db = self._phash_cache()
+        if not db:
+            return
+        with self._phash_db_lock:
+            db.execute("INSERT OR IGNORE INTO content_phash VALUES (?, ?)", (digest, f"{phash:016x}"))
+            db.commit()
     
-    def _hamming_distance(self, h1: str, h2: str) -> int:
-        """compute hamming distance between two hashes"""
-        if len(h1) != len(h2):
-            return 64  # max distance
-        return sum(c1 != c2 for c1, c2 in zip(h1, h2))
+    def _url_digest_store(self, url: str, digest: str):
+        db = self._phash_cache()
+        if not db:
+            return
+        with self._phash_db_lock:
+            db.execute("INSERT OR REPLACE INTO url_content VALUES (?, ?)", (self._url_key(url).hex(), digest))
+            db.commit()
+    
+    def _known_duplicate(self, url: str) -> bool:
+        """
+        True when an earlier run downloaded this url and its bytes are
+        already (near-)covered by used_hashes - lets the caller skip the
+        download entirely. unknown urls and cache misses return False
+        """
+        db = self._phash_cache()
+        if not db:
+            return False
+        with self._phash_db_lock:
+            row = db.execute(
+                "SELECT u.digest, c.phash FROM url_content u LEFT JOIN content_phash c ON c.digest = u.digest WHERE u.key=?",
+                (self._url_key(url).hex(),)
+            ).fetchone()
+        if not row:
+            return False
+        digest, phash = row
+        with self._lock:
+            if digest in self.used_hashes.exact:
+                return True
+            return phash is not None and self.used_hashes.has_near(int(phash, 16), 5)
+    
+    def _cached_phash(self, filepath: str, digest: Optional[str] = None):
+        """phash for a file, from the cache when these exact bytes were seen before"""
+        digest = digest or self._file_digest(filepath)
+        phash = self._phash_lookup(digest)
+        if phash is not None:
+            return phash
+        
+        phash = self._get_perceptual_hash(filepath)
+        if isinstance(phash, int):
+            self._phash_store(digest, phash)
+        return phash
+    
+    def _get_check_pool(self):
+        """process pool for B/C checks, started once and kept for the session
+        spawn, not fork - the parent has download threads and a browser going"""
+        with self._lock:
+            if self._check_pool is None:
+                try:
+                    self._check_pool = ProcessPoolExecutor(
+                        max_workers=os.cpu_count() or 2,
+                        mp_context=multiprocessing.get_context("spawn")
+                    )
+                except Exception as e:
+                    print(f"[Scraper] check pool unavailable ({e}), checking in-thread")
+                    self._check_pool = False
+            return self._check_pool or None
+    
+    def _run_checks(self, filepath: str, need_hash: bool):
+        """B-check (+ phash when need_hash) off the GIL, returns (passed, phash or None)"""
+        args = (filepath, self.min_width, self.min_height, self.min_size_kb, need_hash)
+        pool = self._get_check_pool()
+        if pool:
+            try:
+                return pool.submit(_check_bc_worker, *args).result()
+            except Exception as e:
+                # broken pool (worker died) - dont keep feeding it
+                print(f"[Scraper] check pool failed ({e}), checking in-thread")
+                with self._lock:
+                    self._check_pool = False
+        return _check_bc_worker(*args)
+    
+    def _get_perceptual_hash(self, filepath: str):
+        """compute perceptual hash (DCT pHash) - 64 bit, packed into an int"""
+        phash = _perceptual_hash(filepath)
+        if phash is None:
+            # fallback
+            return self._file_digest(filepath)
+        return phash
     
     # =====================
     # DOWNLOAD
@@ -555,27 +1248,26 @@ class ImageScraperPro:
     
     def _download_and_validate(self, url: str, keyword: str) -> Optional[str]:
         """download image and run all ABC checks"""
+        temp_path = None
         try:
-            headers = {
-                "User-Agent": random.choice(self.USER_AGENTS),
-                "Accept": "image/*,*/*",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Referer": "https://www.google.com/"
-            }
+            # download with streaming and size limit - the body isnt read
+            # until the headers pass, so no separate HEAD round-trip
+            response = self.session.get(url, headers=self.IMAGE_HEADERS, timeout=20, stream=True)
+            response.raise_for_status()
             
             # check content-length before downloading (rule 12)
-            head_response = requests.head(url, headers=headers, timeout=10, allow_redirects=True)
-            content_length = int(head_response.headers.get("content-length", 0))
+            content_length = int(response.headers.get("content-length", 0) or 0)
             if content_length > self.MAX_DOWNLOAD_SIZE:
                 print(f"[Scraper] skipping - too large: {content_length // (1024*1024)}MB")
+                response.close()  # hand the connection back to the pool
                 return None
-            
-            # download with streaming and size limit
-            response = requests.get(url, headers=headers, timeout=20, stream=True)
-            response.raise_for_status()
+            if 0 < content_length < self.min_size_kb * 1024:
+                response.close()
+                return None  # B-check would reject it anyway
             
             content_type = response.headers.get("content-type", "")
             if "image" not in content_type.lower() and "octet" not in content_type.lower():
+                response.close()
                 return None
             
             # get extension
@@ -588,49 +1280,79 @@ class ImageScraperPro:
                 ext = "gif"
             
             # generate filename
-            url_hash = hashlib.md5(url.encode()).hexdigest()[:10]
+            url_hash = self._url_hash(url)
             safe_keyword = "".join(c if c.isalnum() else "_" for c in keyword)[:15]
             filename = f"{safe_keyword}_{url_hash}.{ext}"
-            temp_path = os.path.join(tempfile.gettempdir(), filename)
+            # hidden .part next to the final file - same filesystem, so
+            # publishing it is one atomic rename instead of a copy
+            temp_path = os.path.join(self.output_dir, f".{filename}.part")
             
-            # save to temp with size limit
+            # save to temp with size limit, hashing the bytes on the way through
+            # the header goes through a PIL parser too, so an image thats too
+            # small gets dropped after its first chunk instead of its last
             total_size = 0
+            hasher = _content_hasher()
+            parser = self._header_parser()
             with open(temp_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in response.iter_content(chunk_size=65536):
                     total_size += len(chunk)
                     if total_size > self.MAX_DOWNLOAD_SIZE:
                         f.close()
+                        response.close()
                         os.unlink(temp_path)
                         return None
+                    hasher.update(chunk)
                     f.write(chunk)
+                    if parser is not None:
+                        try:
+                            parser.feed(chunk)
+                        except Exception:
+                            parser = None  # let the B-check decide
+                            continue
+                        if parser.image is not None:
+                            width, height = parser.image.size
+                            parser = None
+                            if width < self.min_width or height < self.min_height:
+                                f.close()
+                                response.close()
+                                os.unlink(temp_path)
+                                return None
             
-            # run B-check (quality)
-            if not self._check_quality(temp_path):
+            digest = hasher.hexdigest()
+            self._url_digest_store(url, digest)
+            phash = self._phash_lookup(digest)
+            
+            # run B-check (quality) - plus the phash on a cache miss - in the
+            # check pool so the decoding doesnt hold the GIL
+            passed, fresh_hash = self._run_checks(temp_path, need_hash=phash is None)
+            if not passed:
                 os.unlink(temp_path)
                 return None
+            if fresh_hash is not None:
+                phash = fresh_hash
+                self._phash_store(digest, phash)
             
             # run C-check (uniqueness with hamming)
-            if not self._check_unique(temp_path):
+            if not self._check_unique(temp_path, digest, phash):
                 os.unlink(temp_path)
                 return None
             
             # move to output
             final_path = os.path.join(self.output_dir, filename)
-            import shutil
-            shutil.move(temp_path, final_path)
+            os.replace(temp_path, final_path)
             
-            self.used_urls.add(url)
+            with self._lock:
+                self.used_urls.add(self._url_key(url))
+                self.known_url_hashes.add(url_hash)
             print(f"[Scraper] saved: {filename}")
             return final_path
             
         except Exception as e:
             # cleanup temp if exists
             try:
-                temp_path = os.path.join(tempfile.gettempdir(), f"{keyword}_{hashlib.md5(url.encode()).hexdigest()[:10]}.*")
-                import glob
-                for f in glob.glob(temp_path):
-                    os.unlink(f)
-            except:
+                if temp_path:
+                    os.unlink(temp_path)
+            except OSError:
                 pass
             return None
 
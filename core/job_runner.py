@@ -18,9 +18,13 @@ import time
 import traceback
 import signal
 import glob
+import atexit
+import threading
+import weakref
 from datetime import datetime
 from typing import Dict, List, Optional
 from functools import wraps
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 import random
 
 # make sure we can import our modules
@@ -31,9 +35,10 @@ sys.path.insert(0, ROOT_DIR)
 from core.downloader import VideoDownloader
 from core.transcriber import WhisperTranscriber
 from core.keyword_extractor import KeywordExtractor
-from core.image_scraper_pro import ImageScraperPro
+from core.image_scraper_pro import ImageScraperPro, dedupe_images
 from core.video_creator_pro import VideoCreatorPro
 from core.safety_monitor import SafetyMonitor
+from utils.helpers import link_or_copy
 
 
 # Job timeout exception
@@ -41,16 +46,114 @@ class JobTimeoutError(Exception):
     pass
 
 
+# (second, "HH:MM:SS") - log lines come in bursts, so the clock only gets
+# formatted once per second instead of once per line
+_stamp = (0, "")
+
+
+def _timestamp() -> str:
+    global _stamp
+    now = int(time.time())
+    if now != _stamp[0]:
+        _stamp = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+    return _stamp[1]
+
+
 def log(msg: str):
     """print with timestamp so electron can parse it"""
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    print(f"[{timestamp}] {msg}", flush=True)
+    print(f"[{_timestamp()}] {msg}", flush=True)
 
 
 def error(msg: str):
     """print error to stderr and save to file"""
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    print(f"[{timestamp}] ERROR: {msg}", file=sys.stderr, flush=True)
+    print(f"[{_timestamp()}] ERROR: {msg}", file=sys.stderr, flush=True)
+
+
+def _dump_job(job: dict) -> bytes:
+    """job dict -> indented json bytes, orjson when it's installed"""
+    try:
+        import orjson
+        return orjson.dumps(job, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    except ImportError:
+        pass
+    except TypeError:
+        pass  # something orjson wont take (non-str keys etc) - stdlib handles it
+    return json.dumps(job, indent=2).encode()
+
+
+
+def _with_stamp(body: bytes, stamp: str) -> bytes:
+    """add last_updated as the last key of an already dumped job, so a
+    checkpoint only serializes the job once"""
+    end = body.rindex(b"}")
+    head = body[:end].rstrip()
+    sep = b"," if not head.endswith(b"{") else b""
+    return head + sep + b'\n  "last_updated": ' + json.dumps(stamp).encode() + b"\n" + body[end:]
+
+
+class _CheckpointWriter:
+    """
+    writes job.json off the pipeline thread
+    each save hands over the serialized job, a background thread writes
+    it. saves that pile up while a write is running collapse into the
+    newest one, so only the latest state ever hits the disk
+    key is what the caller compares to skip unchanged saves - it goes
+    back to None when the write fails, so the next save retries
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._pending = None
+        self._thread = None  # only alive while there is something to write
+        self.key = None  # key of the newest payload that is written or on its way
+        _LIVE_WRITERS.add(self)
+    
+    def submit(self, payload: bytes, key=None):
+        with self._lock:
+            self._pending = payload
+            self.key = key
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._drain, daemon=True)
+                self._thread.start()
+    
+    def _drain(self):
+        while True:
+            with self._lock:
+                payload, self._pending = self._pending, None
+                if payload is None:
+                    self._thread = None
+                    return
+            try:
+                # swapped in whole, a crash mid-write leaves the old job.json
+                tmp_path = self.path + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_path, self.path)
+            except Exception as e:
+                error(f"failed to save job.json: {e}")
+                with self._lock:
+                    if self._pending is None:
+                        self.key = None  # job.json is stale, dont skip the next save
+    
+    def flush(self):
+        """block until everything submitted so far is on disk"""
+        while True:
+            with self._lock:
+                thread = self._thread
+            if thread is None:
+                return
+            thread.join()
+
+
+# daemon writer threads die with the process - flush them on the way out
+_LIVE_WRITERS = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_writers():
+    for writer in list(_LIVE_WRITERS):
+        writer.flush()
 
 
 def retry_with_backoff(max_retries: int = 3, base_delay: float = 2.0, max_delay: float = 30.0):
@@ -108,12 +211,26 @@ class JobRunner:
     MAX_RENDER_TIME = 10 * 60  # 10 minutes for each render step
     MAX_RENDER_TIME = 20 * 60  # 20 minutes for rendering
     
+    # parallel video downloads (settings["downloadConcurrency"] overrides)
+    DOWNLOAD_WORKERS = 4
+    # write job.json after every this many finished downloads
+    DOWNLOAD_SAVE_EVERY = 4
+    # seconds between download starts, and how long cancelled downloads
+    # get to hang up after a timeout
+    DOWNLOAD_STAGGER = 0.5
+    DOWNLOAD_STOP_GRACE = 30
+    # output videos rendered at once (one per output)
+    RENDER_WORKERS = 3
+    # keywords kept per job
+    MAX_KEYWORDS = 40
+    
     def __init__(self, job_folder: str, settings: dict):
         self.job_folder = job_folder
         self.settings = settings
         self.job_json_path = os.path.join(job_folder, "job.json")
         self.links_path = os.path.join(job_folder, "links.txt")
         self.error_log_path = os.path.join(job_folder, "errors.log")
+        self._checkpoints = _CheckpointWriter(self.job_json_path)
         
         # Time tracking
         self.job_start_time = time.time()
@@ -199,11 +316,18 @@ class JobRunner:
         return {"urls": [], "status": "pending", "created": datetime.now().isoformat()}
     
     def _save_job(self):
-        """save current job state"""
-        self.job["last_updated"] = datetime.now().isoformat()
+        """save current job state - serialized here, written in the background
+        saves where nothing but the timestamp would change are skipped"""
         self.job["jobFolder"] = self.job_folder
-        with open(self.job_json_path, "w") as f:
-            json.dump(self.job, f, indent=2)
+        had_stamp = "last_updated" in self.job
+        stamp = self.job.pop("last_updated", None)
+        body = _dump_job(self.job)
+        if body == self._checkpoints.key:
+            if had_stamp:
+                self.job["last_updated"] = stamp
+            return
+        self.job["last_updated"] = datetime.now().isoformat()
+        self._checkpoints.submit(_with_stamp(body, self.job["last_updated"]), key=body)
     
     def _log_error(self, msg: str):
         """log error to file"""
@@ -339,6 +463,10 @@ class JobRunner:
             self.job["status"] = "error"
             self._save_job()
             return False
+        
+        finally:
+            # whoever runs us reads job.json next - make sure it's written
+            self._checkpoints.flush()
     
     def _download_videos(self):
         """download all videos from urls with retry logic"""
@@ -350,13 +478,9 @@ class JobRunner:
         urls = self.job.get("urls", [])
         downloaded = []
         failed_urls = []
+        todo = []
         
         for i, url_data in enumerate(urls):
-            # Check time limit
-            if not self._check_time_limit("download", self.MAX_DOWNLOAD_TIME):
-                log("download time limit reached, continuing with what we have...")
-                break
-            
             url = url_data.get("url", "")
             if not url:
                 continue
@@ -371,25 +495,73 @@ class JobRunner:
                 downloaded.append(url_data)
                 continue
             
+            todo.append((i, url_data))
+        
+        skipped_urls = []
+        skipped = object()  # fetch() result for urls the time limit cut off
+        
+        def fetch(i, url_data, start_at):
+            # throttle the start of each download - waited out on the worker
+            # thread, so finished downloads get collected meanwhile
+            delay = start_at - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            # Check time limit - anything still queued when it runs out is skipped
+            if not self._check_time_limit("download", self.MAX_DOWNLOAD_TIME):
+                return skipped
+            url = url_data["url"]
             log(f"downloading [{i+1}/{len(urls)}]: {url[:60]}...")
+            return self._download_with_retry(downloader, url)
+        
+        # downloads are all network wait - run a few at once (the downloader
+        # keeps a YoutubeDL per thread). checkpoint every few so a crash
+        # doesnt lose the finished ones
+        workers = self.settings.get("downloadConcurrency", self.DOWNLOAD_WORKERS)
+        pool = ThreadPoolExecutor(max_workers=max(1, workers))
+        futures = {}
+        try:
+            start = time.monotonic()
+            for n, (i, url_data) in enumerate(todo):
+                futures[pool.submit(fetch, i, url_data, start + n * self.DOWNLOAD_STAGGER)] = url_data
             
-            # throttle
-            time.sleep(0.5)
-            
-            try:
-                path = self._download_with_retry(downloader, url)
-                if path:
-                    url_data["downloaded_path"] = path
-                    url_data["platform"] = self._detect_platform(url)
-                    downloaded.append(url_data)
-                    log(f"  saved: {os.path.basename(path)}")
-                else:
+            for done, future in enumerate(as_completed(futures), 1):
+                url_data = futures[future]
+                url = url_data["url"]
+                try:
+                    path = future.result()
+                    if path is skipped:
+                        skipped_urls.append(url)
+                    elif path:
+                        url_data["downloaded_path"] = path
+                        url_data["platform"] = self._detect_platform(url)
+                        downloaded.append(url_data)
+                        log(f"  saved: {os.path.basename(path)}")
+                    else:
+                        failed_urls.append(url)
+                except JobTimeoutError:
+                    raise
+                except Exception as e:
+                    self._log_error(f"download failed for {url}: {e}")
                     failed_urls.append(url)
-            except Exception as e:
-                self._log_error(f"download failed for {url}: {e}")
-                failed_urls.append(url)
-                # Continue with other URLs instead of failing completely
-                continue
+                    # Continue with other URLs instead of failing completely
+                    continue
+                finally:
+                    if done % self.DOWNLOAD_SAVE_EVERY == 0:
+                        self._save_job()
+        finally:
+            # on a job timeout the running downloads are told to stop, so
+            # their threads dont keep the process alive at exit. the
+            # YoutubeDLs are only closed once nothing is using them
+            downloader.cancel()
+            pool.shutdown(wait=False, cancel_futures=True)
+            _, stragglers = wait(futures, timeout=self.DOWNLOAD_STOP_GRACE)
+            if stragglers:
+                log(f"{len(stragglers)} download(s) still stopping, leaving them open")
+            else:
+                downloader.close()
+        
+        if skipped_urls:
+            log(f"download time limit reached, skipped {len(skipped_urls)} - continuing with what we have...")
         
         if failed_urls:
             log(f"WARNING: {len(failed_urls)} downloads failed, continuing with {len(downloaded)} videos")
@@ -429,7 +601,9 @@ class JobRunner:
         transcriber = WhisperTranscriber(
             model_name=model,
             use_gpu=use_gpu,
-            output_dir=self.job_folder
+            output_dir=self.job_folder,
+            backend=self.settings.get("whisperBackend", "auto"),
+            cache_size_mb=self.settings.get("srtCacheSizeMb", 200)
         )
         
         for url_data in srt_urls:
@@ -465,18 +639,27 @@ class JobRunner:
     def _extract_keywords(self) -> List[str]:
         """extract keywords from SRT files"""
         extractor = KeywordExtractor()
-        all_keywords = []
         
+        srt_paths = []
         for url_data in self.job.get("urls", []):
             srt_path = url_data.get("srt_path")
             if not srt_path or not os.path.exists(srt_path):
                 continue
-            
             log(f"extracting keywords from: {os.path.basename(srt_path)}")
-            keywords = extractor.extract_from_srt(srt_path, max_keywords=30)
-            all_keywords.extend(keywords)
-        
-        unique = list(dict.fromkeys(all_keywords))[:40]
+            srt_paths.append(srt_path)
+        
+        # all files in one go - spaCy batches them
+        results = extractor.extract_from_srts(srt_paths, max_keywords=30)
+        
+        # first 40 distinct, in order - stops as soon as there are enough
+        unique = []
+        seen = set()
+        for kw in (kw for keywords in results for kw in keywords):
+            if kw not in seen:
+                seen.add(kw)
+                unique.append(kw)
+                if len(unique) >= self.MAX_KEYWORDS:
+                    break
         self.job["keywords"] = unique
         self._save_job()
         
@@ -499,8 +682,8 @@ class JobRunner:
         if keywords and img_urls:
             self._scrape_images(keywords, min_images)
         
-        # Check how many images we have
-        current_images = [img for img in self.job.get("images", []) if os.path.exists(img)]
+        # Check how many images we have - visual duplicates dont count
+        current_images = self._unique_images()
         
         # FALLBACK: if not enough images, borrow from other job folders
         if len(current_images) < min_images:
@@ -508,12 +691,40 @@ class JobRunner:
             self._borrow_images_from_other_jobs(min_images - len(current_images))
         
         # Final check
-        final_images = [img for img in self.job.get("images", []) if os.path.exists(img)]
+        final_images = self._unique_images()
+        self._save_job()
         if len(final_images) == 0:
             self._log_error("no images available even after fallback - using placeholder")
             # Create a simple placeholder image as last resort
             self._create_placeholder_image()
     
+    def _existing_files(self, paths: List[str]) -> List[str]:
+        """paths that are files on disk, in order - one directory listing
+        per folder instead of a stat per path (hundreds of images)"""
+        on_disk = set()
+        for folder in {os.path.dirname(p) for p in paths}:
+            try:
+                with os.scandir(folder or ".") as it:
+                    on_disk.update(os.path.join(folder, e.name) for e in it if e.is_file())
+            except OSError:
+                pass
+        return [p for p in paths if p in on_disk]
+    
+    def _unique_images(self) -> List[str]:
+        """the job's images that exist, minus visual duplicates (same
+        picture from two urls or two borrowed jobs) - updates job["images"]"""
+        images = self._existing_files(self.job.get("images", []))
+        try:
+            unique = dedupe_images(images)
+        except Exception as e:
+            # numpy/PIL trouble - keep the list as is
+            self._log_error(f"image dedupe failed: {e}")
+            unique = images
+        if len(unique) < len(images):
+            log(f"dropped {len(images) - len(unique)} duplicate images")
+        self.job["images"] = unique
+        return unique
+    
     def _scrape_images(self, keywords: List[str], min_images: int):
         """Normal image scraping with time limit"""
         scraper = ImageScraperPro(
@@ -525,6 +736,7 @@ class JobRunner:
         )
         
         images = []
+        seen = set()
         scrape_start = time.time()
         
         for keyword in keywords:
@@ -547,12 +759,16 @@ class JobRunner:
             
             try:
                 found = scraper.search(keyword, max_images=3)
-                images.extend(found)
+                for path in found:
+                    if path not in seen:
+                        seen.add(path)
+                        images.append(path)
             except Exception as e:
                 self._log_error(f"scrape failed for '{keyword}': {e}")
                 continue
         
         scraper.save_manifest()
+        scraper.close()  # chromium + the http pool
         
         self.job["images"] = images
         self._save_job()
@@ -606,8 +822,8 @@ class JobRunner:
                     continue
                 
                 try:
-                    import shutil
-                    shutil.copy2(source_path, dest_path)
+                    # hardlink when possible, no bytes copied
+                    link_or_copy(source_path, dest_path)
                     borrowed.append(dest_path)
                     log(f"  borrowed: {dest_name}")
                 except Exception as e:
@@ -643,7 +859,7 @@ class JobRunner:
     def _create_outputs(self):
         """Create video outputs with face overlay support"""
         images = self.job.get("images", [])
-        images = [img for img in images if os.path.exists(img)]
+        images = self._existing_files(images)
         
         if not images:
             self._log_error("no images available for rendering")
@@ -659,6 +875,10 @@ class JobRunner:
         srt_duration = self._get_srt_duration()
         face_overlay_path = self.settings.get("faceOverlayPath")
         
+        # the outputs render side by side - split the cores between their
+        # ffmpegs unless the user capped the threads already
+        ffmpeg_threads = self.settings.get("ffmpegThreads") or max(1, (os.cpu_count() or self.RENDER_WORKERS) // self.RENDER_WORKERS)
+        
         creator = VideoCreatorPro(
             images_dir=self.images_dir,
             videos_dir=self.job_folder,
@@ -667,61 +887,74 @@ class JobRunner:
             settings={
                 **self.settings,
                 "targetDuration": srt_duration,
-                "faceOverlayPath": face_overlay_path
+                "faceOverlayPath": face_overlay_path,
+                "ffmpegThreads": ffmpeg_threads,
+                # renders run off the main thread where the job alarm cant
+                # reach them - their ffmpegs get killed at the same limit
+                "renderDeadline": self.job_start_time + self.MAX_JOB_TIME
             }
         )
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        outputs = {}
-        
-        # output 1: landscape b-roll
-        log("creating output_video.mp4 (landscape b-roll)...")
-        try:
-            if not self._check_time_limit("render", self.MAX_RENDER_TIME):
-                log("render time limit reached, skipping remaining outputs...")
-            else:
-                output1 = creator.create_slideshow(images, "output_video.mp4")
-                if output1:
-                    outputs["slideshow"] = output1
-                    log(f"  done: output_video.mp4")
-        except Exception as e:
-            self._log_error(f"landscape b-roll failed: {e}")
-            traceback.print_exc(file=sys.stderr)
-        
-        # output 2: portrait/instagram
-        log("creating broll_instagram (portrait)...")
-        try:
-            if self._check_time_limit("render", self.MAX_RENDER_TIME):
-                output2 = creator.create_portrait(images, f"broll_instagram_{timestamp}.mp4")
-                if output2:
-                    outputs["portrait"] = output2
-                    log(f"  done: broll_instagram_{timestamp}.mp4")
-        except Exception as e:
-            self._log_error(f"portrait failed: {e}")
-            traceback.print_exc(file=sys.stderr)
+        # outputs a previous run already rendered are kept, not redone
+        outputs = {
+            key: path for key, path in self.job.get("outputs", {}).items()
+            if path and os.path.exists(path)
+        }
         
-        # output 3: youtube mix
+        # output 3 source clips
         youtube_vids = [
             u.get("downloaded_path") for u in self.job.get("urls", [])
             if u.get("platform") == "youtube" and u.get("downloaded_path")
             and os.path.exists(u.get("downloaded_path", ""))
         ]
         
-        if youtube_vids and self._check_time_limit("render", self.MAX_RENDER_TIME):
-            log("creating broll_youtube (youtube mix)...")
-            try:
-                output3 = creator.create_youtube_mix(youtube_vids, f"broll_youtube_{timestamp}.mp4")
-                if output3:
-                    outputs["youtubeMix"] = output3
-                    log(f"  done: broll_youtube_{timestamp}.mp4")
-            except Exception as e:
-                self._log_error(f"youtube mix failed: {e}")
-                traceback.print_exc(file=sys.stderr)
+        # (key, file name, label, render, media) - each one is its own set of
+        # ffmpeg processes with its own temp files, so they can overlap
+        renders = [
+            ("slideshow", "output_video.mp4", "landscape b-roll", creator.create_slideshow, images),
+            ("portrait", f"broll_instagram_{timestamp}.mp4", "portrait", creator.create_portrait, images),
+        ]
+        if youtube_vids:
+            renders.append(("youtubeMix", f"broll_youtube_{timestamp}.mp4", "youtube mix", creator.create_youtube_mix, youtube_vids))
         else:
             log("no youtube videos for output #3 (youtube mix)")
         
-        self.job["outputs"] = outputs
-        self._save_job()
+        for key, name, label, render, media in renders:
+            if key in outputs:
+                log(f"{label} already rendered: {os.path.basename(outputs[key])}")
+        renders = [r for r in renders if r[0] not in outputs]
+        
+        if not self._check_time_limit("render", self.MAX_RENDER_TIME):
+            log("render time limit reached, skipping remaining outputs...")
+            renders = []
+        
+        ex = ThreadPoolExecutor(max_workers=self.RENDER_WORKERS)
+        try:
+            futures = {}
+            for key, name, label, render, media in renders:
+                log(f"creating {name} ({label})...")
+                futures[ex.submit(render, media, name)] = (key, name, label)
+            
+            for future in as_completed(futures):
+                key, name, label = futures[future]
+                try:
+                    output = future.result()
+                    if output:
+                        outputs[key] = output
+                        log(f"  done: {name}")
+                except Exception as e:
+                    self._log_error(f"{label} failed: {e}")
+                    traceback.print_exc(file=sys.stderr)
+        except JobTimeoutError:
+            # report the timeout now - the renders still running hit the
+            # same renderDeadline, which kills their ffmpegs
+            log("job time limit reached while rendering, keeping the finished outputs")
+            raise
+        finally:
+            ex.shutdown(wait=False, cancel_futures=True)
+            self.job["outputs"] = outputs
+            self._save_job()
     
     def _convert_palette_images(self, images: List[str]) -> List[str]:
         """Convert palette images to RGBA to avoid PIL warnings"""
@@ -752,9 +985,13 @@ class JobRunner:
     
     def _validate_outputs(self):
         """validate that outputs are actually playable"""
+        import subprocess
+        
         outputs = self.job.get("outputs", {})
         valid = {}
         
+        # size gate first - no ffprobe for missing/stub files
+        candidates = []
         for name, path in outputs.items():
             if not path or not os.path.exists(path):
                 log(f"  {name}: missing")
@@ -765,8 +1002,10 @@ class JobRunner:
                 log(f"  {name}: too small ({size} bytes)")
                 continue
             
+            candidates.append((name, path, size))
+        
+        def probe(path) -> bool:
             try:
-                import subprocess
                 result = subprocess.run([
                     "ffprobe", "-v", "error",
                     "-select_streams", "v:0",
@@ -776,16 +1015,22 @@ class JobRunner:
                 ], capture_output=True, text=True, timeout=30)
                 
                 if result.returncode == 0:
-                    info = json.loads(result.stdout)
-                    if info.get("streams"):
-                        valid[name] = path
-                        size_mb = size / (1024 * 1024)
-                        log(f"  {name}: OK ({size_mb:.1f}MB)")
-                        continue
+                    return bool(json.loads(result.stdout).get("streams"))
             except Exception as e:
                 pass
-            
-            log(f"  {name}: validation failed")
+            return False
+        
+        # one ffprobe per output, all at once
+        with ThreadPoolExecutor(max_workers=max(1, len(candidates))) as ex:
+            results = list(ex.map(probe, [path for _, path, _ in candidates]))
+        
+        for (name, path, size), ok in zip(candidates, results):
+            if ok:
+                valid[name] = path
+                size_mb = size / (1024 * 1024)
+                log(f"  {name}: OK ({size_mb:.1f}MB)")
+            else:
+                log(f"  {name}: validation failed")
         
         self.job["valid_outputs"] = valid
         self._save_job()
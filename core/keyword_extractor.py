@@ -99,6 +99,37 @@ class KeywordExtractor:
         print(f"[Keywords] extracted {len(ranked)} keywords from {os.path.basename(srt_path)}")
         return ranked
     
+    def extract_from_srts(self, srt_paths: List[str], max_keywords: int = 30) -> List[List[str]]:
+        """
+        Extract keywords from several SRT files, one list per file
+        spaCy gets all the texts in one batched nlp.pipe call instead of
+        one nlp() per file. it stays in this process - every pipe worker
+        process would load its own copy of the model, which costs more than
+        parsing the few SRTs a job has
+        """
+        texts = []
+        for srt_path in srt_paths:
+            try:
+                with open(srt_path, "r", encoding="utf-8") as f:
+                    texts.append(self._parse_srt(f.read()))
+            except OSError:
+                print(f"[Keywords] file not found: {srt_path}")
+                texts.append("")
+        
+        docs = [None] * len(texts)
+        if self._check_spacy() and self.nlp:
+            try:
+                docs = list(self.nlp.pipe(texts))
+            except Exception as e:
+                print(f"[Keywords] spaCy extraction failed: {e}")
+        
+        results = []
+        for srt_path, text, doc in zip(srt_paths, texts, docs):
+            ranked = self._rank_keywords(self._extract_keywords(text, doc))[:max_keywords]
+            print(f"[Keywords] extracted {len(ranked)} keywords from {os.path.basename(srt_path)}")
+            results.append(ranked)
+        return results
+    
     def _parse_srt(self, content: str) -> str:
         """Parse SRT format and extract just the text"""
         lines = content.split("\n")
@@ -118,8 +149,9 @@ class KeywordExtractor:
         
         return " ".join(text_lines)
     
-    def _extract_keywords(self, text: str) -> List[str]:
-        """Extract candidate keywords using multiple methods"""
+    def _extract_keywords(self, text: str, doc=None) -> List[str]:
+        """Extract candidate keywords using multiple methods
+        doc: the text already run through spaCy, if the caller has it"""
         keywords = []
         
         # method 1: simple word extraction (always works)
@@ -128,7 +160,9 @@ class KeywordExtractor:
         keywords.extend(filtered)
         
         # method 2: try spacy ONLY if already installed (no auto-download)
-        if self._check_spacy() and self.nlp:
+        if doc is not None:
+            keywords.extend(self._nouns_from_doc(doc))
+        elif self._check_spacy() and self.nlp:
             try:
                 keywords.extend(self._extract_nouns_spacy(text))
             except Exception as e:
@@ -149,7 +183,10 @@ class KeywordExtractor:
         if not self.nlp:
             return []
         
-        doc = self.nlp(text)
+        return self._nouns_from_doc(self.nlp(text))
+    
+    def _nouns_from_doc(self, doc) -> List[str]:
+        """nouns + short noun phrases from a spaCy doc"""
         nouns = []
         
         # get nouns
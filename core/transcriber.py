@@ -2,36 +2,62 @@
 Da Editor - Whisper Transcriber
 ================================
 1a. transcribes video/audio to SRT format
-1b. uses openai whisper with GPU support
+1b. uses faster-whisper (int8 ctranslate2) when installed, openai whisper otherwise
 1c. handles model loading and caching
+1d. batches short clips through one decode call
+1e. caches SRTs across jobs by audio content
 """
 
 import os
-from typing import Optional
+import shutil
+import hashlib
+import subprocess
+from typing import List, Optional
 
 
 class WhisperTranscriber:
     """
-    transcribe audio to SRT using openai whisper
+    transcribe audio to SRT using faster-whisper or openai whisper
     
     1a. loads specified model
     1b. extracts audio if needed
     1c. outputs SRT file
     """
     
+    # SRTs keyed by a hash of the decoded audio (+ model), shared by every
+    # job - a re-downloaded clip skips whisper entirely
+    SRT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "da-editor", "srt")
+    
     def __init__(
         self,
         model_name: str = "base",
         use_gpu: bool = True,
-        output_dir: str = None
+        output_dir: str = None,
+        backend: str = "auto",
+        cache_size_mb: float = 200
     ):
         self.model_name = model_name
         self.use_gpu = use_gpu
         self.output_dir = output_dir or os.getcwd()
+        # "auto" tries faster-whisper then openai, "faster_whisper" or
+        # "openai" pins one
+        self.requested_backend = backend
+        # oldest-used SRTs get dropped past this (0 turns the cache off)
+        self.cache_size_mb = cache_size_mb
         self.model = None
+        self.device = None
+        self.backend = None  # "faster" or "openai" once loaded
         
         os.makedirs(self.output_dir, exist_ok=True)
-        print(f"[Transcriber] init with model={model_name}, gpu={use_gpu}")
+        print(f"[Transcriber] init with model={model_name}, gpu={use_gpu}, backend={backend}")
+    
+    def set_output_dir(self, output_dir: str):
+        """
+        1a. write the next SRTs somewhere else
+        lets one loaded model serve many jobs
+        """
+        self.output_dir = output_dir
+        os.makedirs(self.output_dir, exist_ok=True)
     
     def _load_model(self):
         """
@@ -41,22 +67,92 @@ class WhisperTranscriber:
         if self.model is not None:
             return
         
+        if self.requested_backend != "openai" and self._load_faster_whisper():
+            return
+        if self.requested_backend == "faster_whisper":
+            raise RuntimeError("faster-whisper not available - run: pip install faster-whisper")
+        
         try:
             import whisper
             import torch
             
             # check GPU availability
             device = "cuda" if self.use_gpu and torch.cuda.is_available() else "cpu"
+            self.device = device
+            self.backend = "openai"
             
             print(f"[Transcriber] loading {self.model_name} on {device}...")
             self.model = whisper.load_model(self.model_name, device=device)
             print(f"[Transcriber] model loaded")
             
+            if device == "cuda":
+                self._compile_model()
+            
         except ImportError:
             raise RuntimeError("whisper not installed - run: pip install openai-whisper")
         except Exception as e:
             raise RuntimeError(f"failed to load whisper model: {e}")
     
+    def _compile_model(self):
+        """
+        1a. torch.compile the encoder so its kernels get fused
+        the decoder stays eager - its kv-cache hooks keep tensors between
+        calls and the token length grows every step, so a compiled decoder
+        recompiles (or replays stale cuda graphs) all the time
+        pays the compile once on a second of silence here, through the same
+        batched decode transcribe_batch uses, instead of on the first real
+        clip - worth it because the model stays loaded
+        """
+        import numpy
+        import torch
+        
+        if not hasattr(torch, "compile"):
+            return
+        
+        encoder = self.model.encoder
+        try:
+            print(f"[Transcriber] compiling encoder (one-time warmup)...")
+            self.model.encoder = torch.compile(encoder, fullgraph=True)
+            self._decode_audio([numpy.zeros(16000, dtype=numpy.float32)])
+            print(f"[Transcriber] encoder compiled")
+        except Exception as e:
+            # compile is just a speedup - keep the eager module
+            print(f"[Transcriber] torch.compile failed ({e}), running eager")
+            self.model.encoder = encoder
+    
+    def _load_faster_whisper(self) -> bool:
+        """
+        1a. try the ctranslate2 backend first
+        int8 weights with fp16 compute on GPU, plain int8 on CPU
+        returns False if faster-whisper isnt installed or wont load
+        """
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:
+            return False
+        
+        device = "cpu"
+        if self.use_gpu:
+            try:
+                import ctranslate2
+                if ctranslate2.get_cuda_device_count() > 0:
+                    device = "cuda"
+            except Exception:
+                pass
+        compute_type = "int8_float16" if device == "cuda" else "int8"
+        
+        try:
+            print(f"[Transcriber] loading {self.model_name} (faster-whisper, {compute_type}) on {device}...")
+            self.model = WhisperModel(self.model_name, device=device, compute_type=compute_type)
+            self.device = device
+            self.backend = "faster"
+            print(f"[Transcriber] model loaded")
+            return True
+        except Exception as e:
+            print(f"[Transcriber] faster-whisper failed ({e}), using openai whisper")
+            self.model = None
+            return False
+    
     def transcribe(self, video_path: str) -> Optional[str]:
         """
         1b. transcribe video to SRT
@@ -66,40 +162,293 @@ class WhisperTranscriber:
             print(f"[Transcriber] file not found: {video_path}")
             return None
         
+        srt_path = self._srt_path(video_path)
+        
+        # same audio seen before - no model load, no decode
+        key = self._audio_key(video_path)
+        if key and self._from_cache(key, srt_path):
+            return srt_path
+        
+        return self._transcribe_uncached(video_path, key)
+    
+    def _transcribe_uncached(self, video_path: str, key: Optional[str]) -> Optional[str]:
+        """1b. the actual whisper run, result goes into the cache under key"""
+        srt_path = self._srt_path(video_path)
+        
         # load model
         self._load_model()
         
-        # output path
-        basename = os.path.splitext(os.path.basename(video_path))[0]
-        # clean the filename - remove special chars
-        safe_name = "".join(c if c.isalnum() or c in "._- " else "_" for c in basename)
-        srt_path = os.path.join(self.output_dir, f"{safe_name}.srt")
-        
         try:
             print(f"[Transcriber] transcribing: {video_path}")
             
-            # run transcription
-            result = self.model.transcribe(
-                video_path,
-                language="en",  # could make this configurable
-                task="transcribe",
-                verbose=False
-            )
+            if self.backend == "faster":
+                # greedy decode, vad drops the silent stretches before decoding
+                segments, _ = self.model.transcribe(
+                    video_path,
+                    language="en",
+                    task="transcribe",
+                    beam_size=1,
+                    vad_filter=True
+                )
+                segments = [{"start": s.start, "end": s.end, "text": s.text} for s in segments]
+            else:
+                # run transcription
+                result = self.model.transcribe(
+                    video_path,
+                    language="en",  # could make this configurable
+                    task="transcribe",
+                    verbose=False
+                )
+                segments = result["segments"]
             
-            # convert to SRT format
-            srt_content = self._to_srt(result["segments"])
-            
-            # save to file
-            with open(srt_path, "w", encoding="utf-8") as f:
-                f.write(srt_content)
-            
-            print(f"[Transcriber] saved: {srt_path}")
+            self._write_srt(segments, srt_path)
+            if key:
+                self._to_cache(key, srt_path)
             return srt_path
             
         except Exception as e:
             print(f"[Transcriber] failed: {e}")
             return None
     
+    def _audio_key(self, video_path: str) -> Optional[str]:
+        """
+        3a. cache key for a video's SRT - hash of its decoded mono 16k
+        audio plus the model name, so a remux or re-download of the same
+        clip still hits. None if the cache is off or ffmpeg cant decode it
+        """
+        if not self.cache_size_mb:
+            return None
+        
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(self.model_name.encode())
+        try:
+            proc = subprocess.Popen(
+                ["ffmpeg", "-nostdin", "-v", "error", "-i", video_path,
+                 "-vn", "-ac", "1", "-ar", "16000", "-f", "s16le", "-"],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+            with proc.stdout:
+                for chunk in iter(lambda: proc.stdout.read(1 << 20), b""):
+                    hasher.update(chunk)
+            if proc.wait() != 0:
+                return None
+        except Exception:
+            return None
+        return hasher.hexdigest()
+    
+    def _from_cache(self, key: str, srt_path: str) -> bool:
+        """3b. copy a cached SRT into place, True on a hit"""
+        cached = os.path.join(self.SRT_CACHE_DIR, f"{key}.srt")
+        try:
+            shutil.copyfile(cached, srt_path)
+            os.utime(cached)  # mark as recently used for the eviction
+        except OSError:
+            return False
+        print(f"[Transcriber] cached SRT: {srt_path}")
+        return True
+    
+    def _to_cache(self, key: str, srt_path: str):
+        """3c. keep a copy of a fresh SRT, then trim the cache to size"""
+        try:
+            os.makedirs(self.SRT_CACHE_DIR, exist_ok=True)
+            cached = os.path.join(self.SRT_CACHE_DIR, f"{key}.srt")
+            shutil.copyfile(srt_path, cached + ".tmp")
+            os.replace(cached + ".tmp", cached)
+            self._evict_cache()
+        except OSError as e:
+            print(f"[Transcriber] could not cache SRT: {e}")
+    
+    def _evict_cache(self):
+        """3d. drop least recently used SRTs until under cache_size_mb"""
+        entries = []
+        total = 0
+        with os.scandir(self.SRT_CACHE_DIR) as it:
+            for entry in it:
+                if entry.name.endswith(".srt"):
+                    st = entry.stat()
+                    entries.append((max(st.st_atime, st.st_mtime), st.st_size, entry.path))
+                    total += st.st_size
+        
+        limit = self.cache_size_mb * 1024 * 1024
+        for _, size, path in sorted(entries):
+            if total <= limit:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+    
+    def transcribe_batch(self, video_paths: List[str], batch_size: int = 8) -> List[str]:
+        """
+        1d. transcribe several videos, returns the SRT paths that worked
+        clips that fit in one 30s whisper window are stacked into a single
+        mel batch and decoded together, longer ones go through transcribe()
+        """
+        video_paths = [p for p in video_paths if os.path.exists(p)]
+        if not video_paths:
+            return []
+        
+        # cache hits are done already, only the rest need the model
+        srt_paths = []
+        keys = {}
+        misses = []
+        for path in video_paths:
+            key = self._audio_key(path)
+            if key and self._from_cache(key, self._srt_path(path)):
+                srt_paths.append(self._srt_path(path))
+            else:
+                keys[path] = key
+                misses.append(path)
+        video_paths = misses
+        if not video_paths:
+            return srt_paths
+        
+        self._load_model()
+        
+        def one(path):
+            return self._transcribe_uncached(path, keys[path])
+        
+        if self.backend == "faster":
+            # ctranslate2 already batches inside each file
+            return srt_paths + [p for p in map(one, video_paths) if p]
+        
+        import whisper
+        
+        short_clips = []
+        
+        for path in video_paths:
+            try:
+                audio = whisper.load_audio(path)
+            except Exception as e:
+                print(f"[Transcriber] could not load audio: {path}: {e}")
+                continue
+            
+            duration = len(audio) / whisper.audio.SAMPLE_RATE
+            if duration <= whisper.audio.CHUNK_LENGTH:
+                short_clips.append((path, audio, duration))
+            else:
+                srt_path = one(path)
+                if srt_path:
+                    srt_paths.append(srt_path)
+        
+        for i in range(0, len(short_clips), batch_size):
+            batch = short_clips[i:i + batch_size]
+            try:
+                batch_srts = self._decode_batch(batch)
+                for (path, _, _), srt_path in zip(batch, batch_srts):
+                    if keys[path]:
+                        self._to_cache(keys[path], srt_path)
+                srt_paths.extend(batch_srts)
+            except Exception as e:
+                # batch decode failed - fall back to one at a time
+                print(f"[Transcriber] batch decode failed ({e}), going one by one")
+                for path, _, _ in batch:
+                    srt_path = one(path)
+                    if srt_path:
+                        srt_paths.append(srt_path)
+        
+        return srt_paths
+    
+    def _decode_batch(self, batch: list) -> List[str]:
+        """
+        2c. run one whisper decode over a stack of <=30s clips
+        """
+        import whisper
+        
+        print(f"[Transcriber] batch decoding {len(batch)} clips")
+        
+        results = self._decode_audio([a for _, a, _ in batch])
+        
+        tokenizer = whisper.tokenizer.get_tokenizer(
+            self.model.is_multilingual, language="en", task="transcribe"
+        )
+        
+        srt_paths = []
+        for (path, _, duration), result in zip(batch, results):
+            segments = self._segments_from_tokens(result.tokens, tokenizer, duration)
+            srt_paths.append(self._write_srt(segments, self._srt_path(path)))
+        
+        return srt_paths
+    
+    def _decode_audio(self, clips: list) -> list:
+        """
+        2c. whisper.decode over a stack of <=30s float32 clips
+        one DecodingResult per clip
+        """
+        import numpy
+        import whisper
+        import torch
+        
+        n_mels = self.model.dims.n_mels
+        device = self.model.device
+        
+        # one pinned host buffer -> one copy to the GPU, then the mel/stft
+        # runs there instead of on the CPU clip by clip
+        audio = torch.from_numpy(numpy.stack([whisper.pad_or_trim(a) for a in clips]))
+        if device.type == "cuda":
+            audio = audio.pin_memory().to(device, non_blocking=True)
+        
+        # rows stay separate so each clip keeps its own log-mel clamp
+        mels = torch.stack([
+            whisper.log_mel_spectrogram(row, n_mels=n_mels)
+            for row in audio
+        ])
+        
+        options = whisper.DecodingOptions(
+            language="en",
+            task="transcribe",
+            fp16=self.device == "cuda"
+        )
+        return whisper.decode(self.model, mels, options)
+    
+    def _segments_from_tokens(self, tokens: list, tokenizer, duration: float) -> list:
+        """
+        2d. split decoded tokens into segments on the timestamp tokens
+        same layout as whisper's transcribe() segments
+        """
+        segments = []
+        start = None
+        last_end = 0.0
+        text_tokens = []
+        
+        for token in tokens:
+            if token >= tokenizer.timestamp_begin:
+                t = (token - tokenizer.timestamp_begin) * 0.02
+                if start is None:
+                    start = t
+                else:
+                    if text_tokens:
+                        segments.append({"start": start, "end": t, "text": tokenizer.decode(text_tokens)})
+                    last_end = t
+                    start = None
+                    text_tokens = []
+            else:
+                text_tokens.append(token)
+        
+        # trailing text without a closing timestamp runs to the end of the clip
+        if text_tokens:
+            segments.append({"start": last_end if start is None else start, "end": duration, "text": tokenizer.decode(text_tokens)})
+        
+        return segments
+    
+    def _srt_path(self, video_path: str) -> str:
+        """output SRT path for a video"""
+        basename = os.path.splitext(os.path.basename(video_path))[0]
+        # clean the filename - remove special chars
+        safe_name = "".join(c if c.isalnum() or c in "._- " else "_" for c in basename)
+        return os.path.join(self.output_dir, f"{safe_name}.srt")
+    
+    def _write_srt(self, segments: list, srt_path: str) -> str:
+        """convert segments to SRT and save to file"""
+        srt_content = self._to_srt(segments)
+        
+        with open(srt_path, "w", encoding="utf-8") as f:
+            f.write(srt_content)
+        
+        print(f"[Transcriber] saved: {srt_path}")
+        return srt_path
+    
     def _to_srt(self, segments: list) -> str:
         """
         2a. convert whisper segments to SRT format
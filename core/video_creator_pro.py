@@ -15,6 +15,7 @@ This reduces:
 
 import os
 import sys
+import time
 import random
 import subprocess
 import shutil
@@ -74,6 +75,12 @@ class VideoCreatorPro:
         if not self._check_ffmpeg():
             print("[VideoCreator] WARNING: ffmpeg not found!")
         
+        # 0 = let x264 pick, set lower when several renders run at once
+        self.ffmpeg_threads = int(self.settings.get("ffmpegThreads", 0))
+        # time.time() past which no ffmpeg may keep running (the job's hard
+        # limit) - None = no limit
+        self.deadline = self.settings.get("renderDeadline")
+        
         motion = self.settings.get("motionLevel", "slow")  # off, slow, medium
         print(f"[VideoCreator v6] SINGLE FILTERGRAPH - {len(self.sound_files)} sounds, motion={motion}")
     
@@ -85,6 +92,19 @@ class VideoCreatorPro:
         except:
             return False
     
+    def _run(self, cmd: List[str], **kwargs) -> subprocess.CompletedProcess:
+        """subprocess.run for ffmpeg/ffprobe - with a renderDeadline the
+        process is killed there (TimeoutExpired) instead of running on"""
+        if self.deadline:
+            kwargs["timeout"] = max(1.0, self.deadline - time.time())
+        return subprocess.run(cmd, **kwargs)
+    
+    def _thread_args(self) -> List[str]:
+        """-threads flag for x264 encodes, empty when not capped"""
+        if self.ffmpeg_threads > 0:
+            return ["-threads", str(self.ffmpeg_threads)]
+        return []
+    
     def create_slideshow(
         self,
         images: List[str],
@@ -145,7 +165,7 @@ class VideoCreatorPro:
                 self._add_sfx_single_pass(temp_video, output_path, len(images), seconds_per_image, sound_volume)
             else:
                 if os.path.exists(temp_video):
-                    shutil.move(temp_video, output_path)
+                    self._move(temp_video, output_path)
             
             # Cleanup
             self._safe_delete(temp_video)
@@ -273,7 +293,7 @@ class VideoCreatorPro:
         cmd.extend([
             "-filter_complex", filter_complex,
             "-map", "[outv]",
-            "-c:v", "libx264", "-preset", "fast", "-crf", "22",
+            "-c:v", "libx264", "-preset", "fast", "-crf", "22", *self._thread_args(),
             "-r", str(fps),
             *self.MP4_FLAGS,
             output
@@ -281,7 +301,7 @@ class VideoCreatorPro:
         
         print(f"[VideoCreator] running single-pass filtergraph ({n} images)")
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = self._run(cmd, capture_output=True, text=True)
         
         if result.returncode != 0:
             print(f"[VideoCreator] single-pass error: {result.stderr[:500] if result.stderr else 'unknown'}")
@@ -330,13 +350,13 @@ class VideoCreatorPro:
         cmd.extend([
             "-filter_complex", filter_complex,
             "-map", "[outv]",
-            "-c:v", "libx264", "-preset", "fast", "-crf", "22",
+            "-c:v", "libx264", "-preset", "fast", "-crf", "22", *self._thread_args(),
             "-r", str(fps),
             *self.MP4_FLAGS,
             output
         ])
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = self._run(cmd, capture_output=True, text=True)
         return result.returncode == 0 and os.path.exists(output)
     
     def _create_single_image_video(
@@ -352,7 +372,7 @@ class VideoCreatorPro:
         """Create video from single image"""
         total_frames = int(duration * fps)
         
-        result = subprocess.run([
+        result = self._run([
             "ffmpeg", "-y",
             "-loop", "1", "-i", img,
             "-vf", (
@@ -362,7 +382,7 @@ class VideoCreatorPro:
                 f"d={total_frames}:s={width}x{height}:fps={fps}"
             ),
             "-t", str(duration),
-            "-c:v", "libx264", "-preset", "fast", "-crf", "22",
+            "-c:v", "libx264", "-preset", "fast", "-crf", "22", *self._thread_args(),
             *self.MP4_FLAGS,
             output
         ], capture_output=True)
@@ -381,16 +401,18 @@ class VideoCreatorPro:
         Add ALL sound effects in ONE ffmpeg process
         Instead of layering sounds one by one (40+ processes),
         we build one adelay+amix filter for all sounds
+        video_path is moved to output_path when there's nothing to mix in
+        (callers delete it afterwards anyway) - no copy of the whole video
         """
         if not self.sound_files:
-            shutil.copy(video_path, output_path)
+            self._move(video_path, output_path)
             return True
         
         total_duration = num_clips * clip_duration + 2
         num_transitions = num_clips - 1
         
         if num_transitions <= 0:
-            shutil.copy(video_path, output_path)
+            self._move(video_path, output_path)
             return True
         
         # Pick sounds for each transition
@@ -423,7 +445,7 @@ class VideoCreatorPro:
             current_time += clip_duration
         
         if not sounds_to_use:
-            shutil.copy(video_path, output_path)
+            self._move(video_path, output_path)
             return True
         
         # Build single filter for all sounds
@@ -469,11 +491,11 @@ class VideoCreatorPro:
         
         print(f"[VideoCreator] adding {len(sounds_to_use)} SFX in single pass")
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = self._run(cmd, capture_output=True, text=True)
         
         if result.returncode != 0:
             print(f"[VideoCreator] SFX failed, copying video without audio")
-            shutil.copy(video_path, output_path)
+            self._move(video_path, output_path)
         
         return os.path.exists(output_path)
     
@@ -522,18 +544,18 @@ class VideoCreatorPro:
                 self._add_sfx_single_pass(temp_video, temp_with_audio, len(images), seconds_per_image, sound_volume)
                 self._safe_delete(temp_video)
             else:
-                shutil.move(temp_video, temp_with_audio)
+                self._move(temp_video, temp_with_audio)
             
             # Add face overlay if enabled
             if face_overlay_path and os.path.exists(face_overlay_path):
                 overlaid = self._add_face_overlay(temp_with_audio, face_overlay_path, width, height)
                 if overlaid:
                     self._safe_delete(temp_with_audio)
-                    shutil.move(overlaid, output_path)
+                    self._move(overlaid, output_path)
                 else:
-                    shutil.move(temp_with_audio, output_path)
+                    self._move(temp_with_audio, output_path)
             else:
-                shutil.move(temp_with_audio, output_path)
+                self._move(temp_with_audio, output_path)
             
             if os.path.exists(output_path) and self._validate_output(output_path):
                 print(f"[VideoCreator] done: {output_name}")
@@ -573,12 +595,12 @@ class VideoCreatorPro:
                 f"fps={fps},format=yuv420p"
             )
             
-            result = subprocess.run([
+            result = self._run([
                 "ffmpeg", "-y",
                 "-loop", "1", "-i", img,
                 "-vf", filter_chain,
                 "-t", str(duration),
-                "-c:v", "libx264", "-preset", "fast", "-crf", "23",
+                "-c:v", "libx264", "-preset", "fast", "-crf", "23", *self._thread_args(),
                 *self.MP4_FLAGS,
                 clip_path
             ], capture_output=True, text=True)
@@ -595,11 +617,11 @@ class VideoCreatorPro:
             for clip in temp_clips:
                 f.write(f"file '{clip}'\n")
         
-        result = subprocess.run([
+        result = self._run([
             "ffmpeg", "-y",
             "-f", "concat", "-safe", "0",
             "-i", concat_file,
-            "-c:v", "libx264", "-preset", "fast", "-crf", "22",
+            "-c:v", "libx264", "-preset", "fast", "-crf", "22", *self._thread_args(),
             *self.MP4_FLAGS,
             output
         ], capture_output=True, text=True)
@@ -690,7 +712,7 @@ class VideoCreatorPro:
             for i, (vid, start, dur) in enumerate(final_specs):
                 clip_path = os.path.join(self.output_dir, f"_yt_clip_{i:03d}.mp4")
                 
-                result = subprocess.run([
+                result = self._run([
                     "ffmpeg", "-y",
                     "-ss", str(start),
                     "-i", vid,
@@ -699,7 +721,7 @@ class VideoCreatorPro:
                     "-vf", f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
                            f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2:black,"
                            f"fps={fps},format=yuv420p",
-                    "-c:v", "libx264", "-preset", "fast", "-crf", "23",
+                    "-c:v", "libx264", "-preset", "fast", "-crf", "23", *self._thread_args(),
                     *self.MP4_FLAGS,
                     clip_path
                 ], capture_output=True, text=True)
@@ -719,11 +741,11 @@ class VideoCreatorPro:
                 for clip in temp_clips:
                     f.write(f"file '{clip}'\n")
             
-            result = subprocess.run([
+            result = self._run([
                 "ffmpeg", "-y",
                 "-f", "concat", "-safe", "0",
                 "-i", concat_file,
-                "-c:v", "libx264", "-preset", "fast", "-crf", "22",
+                "-c:v", "libx264", "-preset", "fast", "-crf", "22", *self._thread_args(),
                 *self.MP4_FLAGS,
                 temp_video
             ], capture_output=True, text=True)
@@ -743,7 +765,7 @@ class VideoCreatorPro:
                 self._add_sfx_single_pass(temp_video, output_path, len(final_specs), avg_clip, sound_volume)
                 self._safe_delete(temp_video)
             else:
-                shutil.move(temp_video, output_path)
+                self._move(temp_video, output_path)
             
             if os.path.exists(output_path) and self._validate_output(output_path):
                 print(f"[VideoCreator] done: {output_name}")
@@ -774,12 +796,12 @@ class VideoCreatorPro:
                 f"[0:v][face]overlay=(main_w-overlay_w)/2:{y_position}:shortest=1"
             )
             
-            result = subprocess.run([
+            result = self._run([
                 "ffmpeg", "-y",
                 "-i", video_path,
                 "-i", overlay_path,
                 "-filter_complex", filter_complex,
-                "-c:v", "libx264", "-preset", "fast", "-crf", "22",
+                "-c:v", "libx264", "-preset", "fast", "-crf", "22", *self._thread_args(),
                 "-c:a", "copy",
                 *self.MP4_FLAGS,
                 output
@@ -805,7 +827,7 @@ class VideoCreatorPro:
             return False
         
         try:
-            result = subprocess.run([
+            result = self._run([
                 "ffprobe", "-v", "error",
                 "-select_streams", "v:0",
                 "-show_entries", "stream=codec_name",
@@ -820,7 +842,7 @@ class VideoCreatorPro:
     def _get_duration(self, path: str) -> Optional[float]:
         """Get video duration"""
         try:
-            result = subprocess.run([
+            result = self._run([
                 "ffprobe", "-v", "error",
                 "-show_entries", "format=duration",
                 "-of", "default=noprint_wrappers=1:nokey=1",
@@ -833,6 +855,14 @@ class VideoCreatorPro:
             pass
         return None
     
+    def _move(self, src: str, dst: str):
+        """put src at dst - one rename when they share a filesystem (the temps
+        live in output_dir), copy+delete only across mounts"""
+        try:
+            os.replace(src, dst)
+        except OSError:
+            shutil.move(src, dst)
+    
     def _safe_delete(self, path: str):
         """Safely delete file"""
         try:
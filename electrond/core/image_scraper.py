@@ -32,6 +32,13 @@ class ImageScraper:
         "stockphoto.com", "canstockphoto.com", "fotolia.com", "pond5.com",
         "adobe.stock", "vectorstock.com", "megapixl.com", "picfair.com"
     ]
+    # the same list as a set of hosts - the check looks at the url's
+    # hostname only, one set lookup per parent domain
+    BLOCKED_HOSTS = frozenset(BLOCKED_DOMAINS)
+    
+    # how far into the body the header parser gets fed before giving up
+    # and leaving it to _verify_image on the full download
+    HEADER_PROBE_LIMIT = 256 * 1024
     
     # user agents to rotate
     USER_AGENTS = [
@@ -174,9 +181,17 @@ class ImageScraper:
     def _is_blocked(self, url: str) -> bool:
         """
         3a. check if URL is from a blocked domain
+        the host and each parent domain is one set lookup
+        (img.c.alamy.com -> c.alamy.com -> alamy.com), so notalamy.com or
+        an alamy.com in the path dont count
         """
-        for domain in self.BLOCKED_DOMAINS:
-            if domain in url.lower():
+        try:
+            hostname = (urlparse(url).hostname or "").lower()
+        except ValueError:
+            return False
+        parts = hostname.split(".")
+        for i in range(len(parts) - 1):
+            if ".".join(parts[i:]) in self.BLOCKED_HOSTS:
                 return True
         return False
     
@@ -212,10 +227,31 @@ class ImageScraper:
             filename = f"{safe_keyword}_{name_hash}.{ext}"
             filepath = os.path.join(self.output_dir, filename)
             
-            # save to disk
+            # save to disk - the first chunks also go through PIL's
+            # incremental parser, which has the size as soon as the header
+            # is in, so a small image is dropped before the rest downloads
+            parser = self._header_parser()
+            received = 0
+            too_small = False
             with open(filepath, "wb") as f:
                 for chunk in response.iter_content(chunk_size=8192):
                     f.write(chunk)
+                    received += len(chunk)
+                    if parser is None:
+                        continue
+                    size = self._feed_header(parser, chunk)
+                    if size:
+                        parser = None
+                        if size[0] < self.min_width or size[1] < self.min_height:
+                            print(f"[Scraper] skipped: {size[0]}x{size[1]} too small")
+                            too_small = True
+                            response.close()
+                            break
+                    elif size is None or received >= self.HEADER_PROBE_LIMIT:
+                        parser = None  # leave it to _verify_image
+            if too_small:
+                os.unlink(filepath)
+                return None
             
             # verify it's a valid image and check dimensions
             if self._verify_image(filepath):
@@ -249,6 +285,25 @@ class ImageScraper:
         
         return "jpg"  # default
     
+    def _header_parser(self):
+        """incremental PIL parser, knows the image size once the header is in"""
+        try:
+            from PIL import ImageFile
+            return ImageFile.Parser()
+        except ImportError:
+            return None
+    
+    def _feed_header(self, parser, chunk: bytes):
+        """feed one chunk - (width, height) once the header is parsed,
+        () while it isnt yet, None if the parser cant read the format"""
+        try:
+            parser.feed(chunk)
+        except Exception:
+            return None
+        if parser.image is not None:
+            return parser.image.size
+        return ()
+    
     def _verify_image(self, path: str) -> bool:
         """
         4a. verify image is valid and meets size requirements
@@ -12,16 +12,81 @@ rules 81-92, 115-118:
 - manifest persistence
 """
 
+import io
 import os
 import re
 import time
 import random
 import hashlib
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Set, Dict
 from urllib.parse import urlparse, unquote, quote_plus
-import tempfile
+
+
+class _DownloadBatch:
+    """
+    the downloads for one search, on a small thread pool
+    urls are handed over as soon as they're found, so the browser keeps
+    scraping while earlier candidates download. a url only downloads once
+    it holds one of the max_images slots, so no surplus image gets saved
+    or recorded in the manifest. urls that find every slot taken wait and
+    get a slot back when a download fails, once enough images are saved
+    the rest are skipped
+    """
+    
+    def __init__(self, scraper, keyword: str, max_images: int, workers: int):
+        self.scraper = scraper
+        self.keyword = keyword
+        self.max_images = max_images
+        self.downloaded: List[str] = []
+        self._inflight = 0
+        self._waiting = deque()
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+    
+    def full(self) -> bool:
+        return len(self.downloaded) >= self.max_images
+    
+    def submit(self, url: str):
+        self._pool.submit(self._work, url)
+    
+    def _work(self, url: str):
+        while True:
+            # reserve a slot before anything is downloaded or recorded
+            with self._lock:
+                if self.full():
+                    return
+                if len(self.downloaded) + self._inflight >= self.max_images:
+                    self._waiting.append(url)
+                    return
+                self._inflight += 1
+            
+            path = None
+            try:
+                path = self.scraper._download_and_validate(url, self.keyword, cancelled=self.full)
+            except Exception as e:
+                print(f"[Scraper] download worker failed: {e}")
+            finally:
+                with self._lock:
+                    self._inflight -= 1
+                    url = None
+                    if path:
+                        self.downloaded.append(path)
+                    elif self._waiting:
+                        url = self._waiting.popleft()  # hand the slot on
+            if url is None:
+                return
+    
+    def finish(self) -> List[str]:
+        """wait for whatever is still downloading, return the saved paths"""
+        self._pool.shutdown(wait=True)
+        return self.downloaded
 
 
 class ImageScraperPro:
@@ -31,7 +96,7 @@ class ImageScraperPro:
     """
     
     # blocked domains - hostname based checking (rule 116)
-    BLOCKED_HOSTNAMES = {
+    BLOCKED_HOSTNAMES = frozenset({
         # stock sites with watermarks
         "alamy.com", "www.alamy.com",
         "shutterstock.com", "www.shutterstock.com",
@@ -56,7 +121,7 @@ class ImageScraperPro:
         # social media profile pics / low quality
         "gravatar.com", "0.gravatar.com", "1.gravatar.com", "2.gravatar.com",
         "pbs.twimg.com",  # but we'll check path for /profile
-    }
+    })
     
     # bad URL patterns (thumbnails, previews, etc)
     BAD_URL_PATTERNS = [
@@ -74,9 +139,56 @@ class ImageScraperPro:
         "data:image",  # base64 encoded (usually tiny)
     ]
     
+    # the lists above in the shape the A-check wants: one regex alternation
+    # (a single pass over the url) and a suffix tuple (str.endswith in C)
+    BAD_URL_RE = re.compile("|".join(map(re.escape, BAD_URL_PATTERNS)), re.IGNORECASE)
+    BLOCKED_SUFFIXES = tuple("." + h for h in BLOCKED_HOSTNAMES)
+    
     # max download size in bytes (12MB cap - rule 12)
     MAX_DOWNLOAD_SIZE = 12 * 1024 * 1024
     
+    # google result pages - imgres links carry the source url in imgurl=,
+    # the inline json lists results as ["url",height,width]
+    GOOGLE_IMGRES_JS = """() => Array.from(document.querySelectorAll('a[href*="imgurl="]'))
+        .map(a => new URL(a.href, location.href).searchParams.get('imgurl'))
+        .filter(Boolean)"""
+    GOOGLE_RESULT_RE = re.compile(r'\["(https?://[^"]+)",(\d+),(\d+)\]')
+    # the full-size img in the preview panel (any of its known shapes)
+    GOOGLE_PREVIEW_SELECTOR = 'img[jsname="kn3ccd"], img.sFlh5c.pT0Scc.iPVvYb, img[class*="r48jcc"]'
+    
+    # a host that failed this many downloads at the connection level
+    # (timeouts, dns/tls/connect errors, 5xx) is skipped in the A-check.
+    # a 404 or a non-image is one dead url, not a dead host, so it doesnt
+    # count. a host's count is forgotten HOST_FAIL_TTL seconds after its
+    # last failure, or as soon as one of its downloads goes through
+    HOST_FAIL_LIMIT = 3
+    HOST_FAIL_TTL = 6 * 60 * 60
+    
+    # while streaming, try reading the image header every HEADER_PEEK_STEP
+    # bytes (jpeg SOF is usually in the first few KB), give up past the limit
+    HEADER_PEEK_STEP = 16 * 1024
+    HEADER_PEEK_LIMIT = 512 * 1024
+    
+    # politeness: at least this long between two requests to the same host
+    HOST_MIN_INTERVAL = 0.3
+    
+    # parallel downloads per search (network bound, threads are fine)
+    DOWNLOAD_WORKERS = 6
+    
+    # keywords searched side by side in search_many (a browser each)
+    SEARCH_WORKERS = 4
+    
+    # fresh browser context after this many pages - cookies/cache/leaked
+    # DOM state pile up in a long-lived one and chromium's RSS creeps up
+    CONTEXT_RECYCLE_AFTER = 50
+    
+    # near-dup lookups: the 64 hash bits cut into NEAR_RADIUS + 1 bands.
+    # two hashes within NEAR_RADIUS bits must agree on at least one band
+    # (pigeonhole), so only rows sharing a band get compared
+    NEAR_RADIUS = 5
+    LINEAR_SCAN_MAX = 16
+    HASH_BANDS = ((0, 0x7FF), (11, 0x7FF), (22, 0x7FF), (33, 0x7FF), (44, 0x3FF), (54, 0x3FF))  # (shift, mask)
+    
     # user agents
     USER_AGENTS = [
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -97,10 +209,46 @@ class ImageScraperPro:
         self.min_height = min_height
         self.min_size_kb = min_size_kb
         self.manifest_path = manifest_path
+        self._manifest_saved = None  # (urls, hashes, host fail version) at the last load/save
         
         # tracking for deduplication (rules 87-90)
         self.used_urls: Set[str] = set()
-        self.used_hashes: Dict[str, str] = {}  # hash -> filepath
+        self.used_hashes: Dict[object, str] = {}  # 64-bit int phash (or content digest str) -> filepath
+        # the int phashes again as one uint64 array, so the near-dup check
+        # is a single xor + popcount over all of them. grown by doubling,
+        # the first _phash_count slots are live
+        self._phash_array = None
+        self._phash_count = 0
+        self._phash_bands: List[Dict[int, List[int]]] = []  # band value -> rows
+        # hostname -> [failed downloads, time.time() of the last one], kept
+        # in the manifest so the next job doesnt pay dns + tls for the same
+        # dead hosts again. the version bumps on every change
+        self._host_fail_count: Dict[str, list] = {}
+        self._host_fail_version = 0
+        # digests of every body already judged this run - the same bytes
+        # from another url get the same verdict without a PIL decode
+        self._seen_digests: Set[str] = set()
+        self._judging_digests: Set[str] = set()  # claimed, B-check still running
+        # hostname -> monotonic time of its next free request slot
+        self._host_next_slot: Dict[str, float] = {}
+        # guards used_urls/used_hashes - downloads run on worker threads
+        self._lock = threading.Lock()
+        
+        # one keep-alive pool for every page/image request, so repeat hits
+        # on the same CDN skip the TCP+TLS handshake (sessions are fine to
+        # share between the download threads)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        # one chromium per thread for the life of the scraper (launching is
+        # ~1-3s), its context gets swapped out every CONTEXT_RECYCLE_AFTER
+        # pages. per thread because playwright's sync objects cant cross
+        # threads - search_many runs keywords on several at once
+        self._local = threading.local()
+        # serializes manifest writes (they all go through the same .tmp)
+        self._manifest_lock = threading.Lock()
         
         os.makedirs(output_dir, exist_ok=True)
         
@@ -117,20 +265,113 @@ class ImageScraperPro:
                 with open(self.manifest_path, "r") as f:
                     data = json.load(f)
                     self.used_urls = set(data.get("used_urls", []))
-                    self.used_hashes = data.get("used_hashes", {})
+                    self.used_hashes = {self._parse_hash_key(k): v for k, v in data.get("used_hashes", {}).items()}
+                    # old manifests stored bare counts with no time - dropped
+                    now = time.time()
+                    self._host_fail_count = {
+                        host: [int(entry[0]), float(entry[1])]
+                        for host, entry in data.get("host_failures", {}).items()
+                        if isinstance(entry, list) and now - float(entry[1]) < self.HOST_FAIL_TTL
+                    }
+                    self._phash_array = None  # rebuilt on the next check
+                    self._manifest_saved = self._manifest_sizes()
                     print(f"[Scraper] loaded manifest: {len(self.used_urls)} URLs, {len(self.used_hashes)} hashes")
             except Exception as e:
                 print(f"[Scraper] manifest load error: {e}")
     
     def save_manifest(self):
         """save manifest for persistence (rule 88)"""
-        if self.manifest_path:
-            data = {
-                "used_urls": list(self.used_urls),
-                "used_hashes": self.used_hashes
-            }
-            with open(self.manifest_path, "w") as f:
-                json.dump(data, f, indent=2)
+        if not self.manifest_path:
+            return
+        with self._manifest_lock:
+            # snapshot under the lock - download threads may still be adding
+            with self._lock:
+                # these only ever grow, so equal counts = nothing new to write
+                sizes = self._manifest_sizes()
+                if sizes == self._manifest_saved:
+                    return
+                data = {
+                    "used_urls": list(self.used_urls),
+                    # int phashes go out as 16 char hex
+                    "used_hashes": {(f"{h:016x}" if isinstance(h, int) else h): p for h, p in self.used_hashes.items()},
+                    "host_failures": {host: list(entry) for host, entry in self._host_fail_count.items()}
+                }
+            # compact, and swapped in whole so a crash mid-write cant
+            # truncate the cross-job history
+            tmp_path = self.manifest_path + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, self.manifest_path)
+            self._manifest_saved = sizes
+    
+    def _manifest_sizes(self):
+        return (len(self.used_urls), len(self.used_hashes), self._host_fail_version)
+    
+    @staticmethod
+    def _parse_hash_key(key: str):
+        """manifest key -> hash. 16 hex chars is a phash, old manifests
+        stored the dhash as a 64 char '0'/'1' string, anything else is a
+        content digest (blake2b, md5 in older manifests)"""
+        try:
+            if len(key) == 16:
+                return int(key, 16)
+            if len(key) == 64 and set(key) <= {"0", "1"}:
+                return int(key, 2)
+        except ValueError:
+            pass
+        return key
+    
+    def _new_page(self, sync_playwright):
+        """a tab in this thread's browser - launched on first use"""
+        local = self._local
+        if getattr(local, "browser", None) is None:
+            local.playwright = sync_playwright().start()
+            try:
+                local.browser = local.playwright.chromium.launch(headless=True)
+            except Exception:
+                local.playwright.stop()
+                local.playwright = None
+                raise
+            local.context = None
+        
+        if local.context is not None and local.context_uses >= self.CONTEXT_RECYCLE_AFTER:
+            try:
+                local.context.close()
+            except Exception:
+                pass
+            local.context = None
+        if local.context is None:
+            local.context = local.browser.new_context(
+                user_agent=random.choice(self.USER_AGENTS),
+                viewport={"width": 1920, "height": 1080}
+            )
+            local.context_uses = 0
+        
+        local.context_uses += 1
+        return local.context.new_page()
+    
+    def _close_browser(self):
+        """close this thread's browser (if it ever started one)"""
+        local = self._local
+        try:
+            if getattr(local, "browser", None):
+                local.browser.close()
+            if getattr(local, "playwright", None):
+                local.playwright.stop()
+        except Exception:
+            pass
+        local.browser = None
+        local.playwright = None
+        local.context = None
+    
+    def close(self):
+        """shut the browser down and let go of the pooled http connections
+        (search_many workers close their own browsers on the way out)"""
+        self._close_browser()
+        try:
+            self.session.close()
+        except Exception:
+            pass
     
     def search(self, keyword: str, max_images: int = 5) -> List[str]:
         """
@@ -172,26 +413,57 @@ class ImageScraperPro:
         
         return downloaded[:max_images]
     
+    def search_many(self, keywords: List[str], max_per: int = 5) -> Dict[str, List[str]]:
+        """
+        search several keywords at once - up to SEARCH_WORKERS threads, each
+        with its own browser, so one keyword's page loads and downloads
+        overlap the others'. returns keyword -> downloaded paths
+        """
+        pending = queue.Queue()
+        for keyword in keywords:
+            pending.put(keyword)
+        results: Dict[str, List[str]] = {}
+        
+        def worker():
+            try:
+                while True:
+                    try:
+                        keyword = pending.get_nowait()
+                    except queue.Empty:
+                        return
+                    try:
+                        results[keyword] = self.search(keyword, max_per)
+                    except Exception as e:
+                        print(f"[Scraper] search failed for '{keyword}': {e}")
+                        results[keyword] = []
+            finally:
+                # playwright objects belong to this thread - close here
+                self._close_browser()
+        
+        threads = [threading.Thread(target=worker, daemon=True)
+                   for _ in range(min(self.SEARCH_WORKERS, len(keywords)))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        return {k: results.get(k, []) for k in keywords}
+    
     def _search_playwright_click(self, keyword: str, max_images: int) -> List[str]:
         """
         playwright scraper that ACTUALLY CLICKS thumbnails
         this is the key - we need to click to get the real image URL
+        (unless the page already hands them over - see _extract_google_urls)
         """
         try:
             from playwright.sync_api import sync_playwright
         except ImportError:
             raise RuntimeError("playwright not installed - run: playwright install chromium")
         
-        downloaded = []
+        batch = _DownloadBatch(self, keyword, max_images, self.DOWNLOAD_WORKERS)
         
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                user_agent=random.choice(self.USER_AGENTS),
-                viewport={"width": 1920, "height": 1080}
-            )
-            page = context.new_page()
-            
+        page = self._new_page(sync_playwright)
+        try:
             # URL encode keyword properly
             encoded_keyword = quote_plus(keyword)
             search_url = f"https://www.google.com/search?q={encoded_keyword}&tbm=isch&tbs=isz:l"
@@ -214,31 +486,46 @@ class ImageScraperPro:
                     page.evaluate("window.scrollBy(0, 600)")
                     time.sleep(0.4)
                 
+                # most results already carry their full-size url (imgres
+                # links / the inline result json) - take them all in one
+                # evaluate instead of ~1s of clicking per candidate
+                bulk = self._extract_google_urls(page, max_images * 3)
+                if bulk:
+                    print(f"[Scraper] extracted {len(bulk)} urls without clicking")
+                for url in bulk:
+                    batch.submit(url)
+                
                 # get all thumbnail containers - these are clickable
                 # google images uses data-index for thumbnails
-                thumbnails = page.query_selector_all('div[jsname="dTDiAc"]')
-                if not thumbnails:
-                    thumbnails = page.query_selector_all('div[data-id]')
-                
-                print(f"[Scraper] found {len(thumbnails)} thumbnails to try")
+                # (only needed when the bulk pass found nothing)
+                thumbnails = []
+                if not bulk:
+                    thumbnails = page.query_selector_all('div[jsname="dTDiAc"]')
+                    if not thumbnails:
+                        thumbnails = page.query_selector_all('div[data-id]')
+                    print(f"[Scraper] found {len(thumbnails)} thumbnails to try")
                 
                 tried = 0
                 for thumb in thumbnails[:max_images * 4]:  # try more than needed
-                    if len(downloaded) >= max_images:
+                    if batch.full():
                         break
                     if tried >= max_images * 3:  # dont try forever
                         break
                     
                     tried += 1
-                    time.sleep(0.3)  # throttle (rule 92)
+                    self._pace("www.google.com")  # throttle (rule 92)
                     
                     try:
                         # click the thumbnail to open preview panel
                         thumb.click()
-                        time.sleep(0.8)  # wait for preview to load
                         
                         # now extract the REAL image URL from the preview panel
-                        # it appears in an img with specific attributes
+                        # it appears in an img with specific attributes - wait
+                        # for it to show up rather than a fixed 0.8s
+                        try:
+                            page.wait_for_selector(self.GOOGLE_PREVIEW_SELECTOR, timeout=2000)
+                        except Exception:
+                            pass
                         real_img = page.query_selector('img[jsname="kn3ccd"]')
                         if not real_img:
                             real_img = page.query_selector('img.sFlh5c.pT0Scc.iPVvYb')
@@ -261,11 +548,9 @@ class ImageScraperPro:
                                             src = url
                                             break
                                 
-                                # validate and download
+                                # validate and download (in the background)
                                 if self._check_url(src):
-                                    path = self._download_and_validate(src, keyword)
-                                    if path:
-                                        downloaded.append(path)
+                                    batch.submit(src)
                         
                         # press escape to close preview
                         page.keyboard.press("Escape")
@@ -277,29 +562,56 @@ class ImageScraperPro:
                 
             except Exception as e:
                 print(f"[Scraper] page load error: {e}")
-            
-            browser.close()
+        finally:
+            page.close()
         
-        return downloaded
+        return batch.finish()
+    
+    def _extract_google_urls(self, page, limit: int) -> List[str]:
+        """
+        full-size urls straight off a google images results page, no clicks
+        /imgres?imgurl= links first, else the ["url",height,width] entries
+        in the inline result json (small ones dropped by their size)
+        """
+        try:
+            found = page.evaluate(self.GOOGLE_IMGRES_JS) or []
+        except Exception:
+            found = []
+        
+        if not found:
+            try:
+                content = page.content()
+            except Exception:
+                content = ""
+            for m in self.GOOGLE_RESULT_RE.finditer(content):
+                height, width = int(m.group(2)), int(m.group(3))
+                if width < self.min_width or height < self.min_height:
+                    continue  # thumbnails and small originals
+                try:
+                    found.append(json.loads(f'"{m.group(1)}"'))  # \u003d etc
+                except ValueError:
+                    continue
+        
+        urls = []
+        for url in found:
+            if len(urls) >= limit:
+                break
+            if url not in urls and self._check_url(url):
+                urls.append(url)
+        return urls
     
     def _search_bing(self, keyword: str, max_images: int) -> List[str]:
         """bing images fallback - more reliable than google for direct scraping"""
-        downloaded = []
-        
         try:
             from playwright.sync_api import sync_playwright
         except ImportError:
             # fall back to requests
             return self._search_bing_requests(keyword, max_images)
         
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                user_agent=random.choice(self.USER_AGENTS),
-                viewport={"width": 1920, "height": 1080}
-            )
-            page = context.new_page()
-            
+        batch = _DownloadBatch(self, keyword, max_images, self.DOWNLOAD_WORKERS)
+        
+        page = self._new_page(sync_playwright)
+        try:
             encoded = quote_plus(keyword)
             search_url = f"https://www.bing.com/images/search?q={encoded}&qft=+filterui:imagesize-large"
             
@@ -317,7 +629,7 @@ class ImageScraperPro:
                 images = page.query_selector_all('a.iusc')
                 
                 for img in images[:max_images * 3]:
-                    if len(downloaded) >= max_images:
+                    if batch.full():
                         break
                     
                     try:
@@ -328,51 +640,42 @@ class ImageScraperPro:
                             url = data.get("murl")  # murl is the media URL (full res)
                             
                             if url and self._check_url(url):
-                                time.sleep(0.3)
-                                path = self._download_and_validate(url, keyword)
-                                if path:
-                                    downloaded.append(path)
+                                batch.submit(url)
                     except:
                         continue
                 
             except Exception as e:
                 print(f"[Scraper] bing error: {e}")
-            
-            browser.close()
+        finally:
+            page.close()
         
-        return downloaded
+        return batch.finish()
     
     def _search_bing_requests(self, keyword: str, max_images: int) -> List[str]:
         """requests-only bing fallback for when playwright is unavailable"""
-        downloaded = []
+        batch = _DownloadBatch(self, keyword, max_images, self.DOWNLOAD_WORKERS)
         
         headers = {"User-Agent": random.choice(self.USER_AGENTS)}
         encoded = quote_plus(keyword)
         search_url = f"https://www.bing.com/images/search?q={encoded}&qft=+filterui:imagesize-large"
         
         try:
-            response = requests.get(search_url, headers=headers, timeout=15)
+            response = self.session.get(search_url, headers=headers, timeout=15)
             
             # extract murl from page
             urls = re.findall(r'"murl":"(https?://[^"]+)"', response.text)
             
             for url in urls[:max_images * 2]:
-                if len(downloaded) >= max_images:
-                    break
-                
                 # unescape the url
                 url = url.replace("\\u0026", "&")
                 
                 if self._check_url(url):
-                    time.sleep(0.5)
-                    path = self._download_and_validate(url, keyword)
-                    if path:
-                        downloaded.append(path)
+                    batch.submit(url)
                         
         except Exception as e:
             print(f"[Scraper] requests fallback failed: {e}")
         
-        return downloaded
+        return batch.finish()
     
     # =====================
     # URL VALIDATION (A-check)
@@ -383,8 +686,6 @@ class ImageScraperPro:
         if not url or not url.startswith("http"):
             return False
         
-        url_lower = url.lower()
-        
         # parse hostname
         try:
             parsed = urlparse(url)
@@ -393,14 +694,16 @@ class ImageScraperPro:
             return False
         
         # check blocked hostnames (rule 116)
-        for blocked in self.BLOCKED_HOSTNAMES:
-            if hostname == blocked or hostname.endswith("." + blocked):
-                return False
+        if hostname in self.BLOCKED_HOSTNAMES or hostname.endswith(self.BLOCKED_SUFFIXES):
+            return False
+        
+        # host keeps failing downloads - dont even connect
+        if self._host_is_down(hostname):
+            return False
         
         # check bad URL patterns (thumbnails, previews, icons)
-        for pattern in self.BAD_URL_PATTERNS:
-            if pattern in url_lower:
-                return False
+        if self.BAD_URL_RE.search(url):
+            return False
         
         # already used (rule 87)
         if url in self.used_urls:
@@ -412,17 +715,22 @@ class ImageScraperPro:
     # QUALITY VALIDATION (B-check)
     # =====================
     
-    def _check_quality(self, filepath: str) -> bool:
-        """B-check: quality validation (rules 84, 115)"""
+    def _check_quality(self, source) -> bool:
+        """B-check: quality validation (rules 84, 115)
+        source is a path or an in-memory buffer (BytesIO)"""
         try:
             from PIL import Image
             
             # file size check
-            size = os.path.getsize(filepath)
+            if isinstance(source, str):
+                size = os.path.getsize(source)
+            else:
+                size = source.getbuffer().nbytes
+                source.seek(0)
             if size < self.min_size_kb * 1024:
                 return False
             
-            with Image.open(filepath) as img:
+            with Image.open(source) as img:
                 width, height = img.size
                 
                 # min resolution (rule 115: >= 900px width)
@@ -434,24 +742,9 @@ class ImageScraperPro:
                 if aspect < 0.4 or aspect > 2.5:
                     return False
                 
-                # composition check for face overlay (rule 117)
-                # for portrait format, prefer images with headroom
-                # reject images where main content is in bottom 30%
-                # we use a simple heuristic: check if bottom portion is mostly uniform
-                # (indicates empty space vs subject)
-                if aspect < 1.0:  # portrait-ish
-                    # crop bottom 30%
-                    bottom = img.crop((0, int(height * 0.7), width, height))
-                    # convert to grayscale and check variance
-                    gray = bottom.convert("L")
-                    pixels = list(gray.getdata())
-                    if len(pixels) > 0:
-                        avg = sum(pixels) / len(pixels)
-                        variance = sum((p - avg) ** 2 for p in pixels) / len(pixels)
-                        # low variance = uniform = probably background = good
-                        # high variance with high brightness = might be subject = still ok
-                        # we're being permissive here
-                
+                # composition (rule 117, headroom for the face overlay) is
+                # permissive - nothing gets rejected on it
+            
             return True
             
         except Exception as e:
@@ -462,64 +755,138 @@ class ImageScraperPro:
     # UNIQUENESS CHECK (C-check with Hamming distance)
     # =====================
     
-    def _check_unique(self, filepath: str) -> bool:
-        """C-check: uniqueness via perceptual hash with Hamming distance (rules 85-87)"""
+    def _check_unique(self, source, filepath: str) -> bool:
+        """C-check: uniqueness via perceptual hash with Hamming distance (rules 85-87)
+        source is what gets hashed (path or buffer), filepath is what we record"""
         try:
-            phash = self._get_perceptual_hash(filepath)
+            phash = self._get_perceptual_hash(source)
+            if not isinstance(phash, int):
+                raise ValueError("no perceptual hash")
             
-            # check for NEAR duplicates using Hamming distance
-            # two hashes within 5 bits difference are considered duplicates
-            for existing_hash in self.used_hashes:
-                distance = self._hamming_distance(phash, existing_hash)
-                if distance <= 5:  # threshold for near-duplicate
+            with self._lock:
+                # check for NEAR duplicates using Hamming distance
+                # two hashes within 5 bits difference are considered duplicates
+                if self._has_near(phash, 5):  # threshold for near-duplicate
                     return False
-            
-            self.used_hashes[phash] = filepath
-            return True
+                
+                self.used_hashes[phash] = filepath
+                self._remember_phash(phash)
+                return True
             
         except Exception:
-            # fallback to md5
-            md5 = hashlib.md5(open(filepath, 'rb').read()).hexdigest()
-            if md5 in self.used_hashes:
-                return False
-            self.used_hashes[md5] = filepath
-            return True
+            # fallback to an exact content digest
+            digest = self._digest_of(source)
+            with self._lock:
+                if digest in self.used_hashes:
+                    return False
+                self.used_hashes[digest] = filepath
+                return True
     
-    def _get_perceptual_hash(self, filepath: str) -> str:
-        """compute perceptual hash (dhash) - 64 bit"""
+    def _digest_of(self, source) -> str:
+        """blake2b of a path (read in chunks, not all at once) or an
+        in-memory buffer - faster than md5 on 64-bit cpus"""
+        hasher = hashlib.blake2b(digest_size=16)
+        if isinstance(source, str):
+            with open(source, "rb") as f:
+                for chunk in iter(lambda: f.read(65536), b""):
+                    hasher.update(chunk)
+        else:
+            hasher.update(source.getbuffer())
+        return hasher.hexdigest()
+    
+    def _get_perceptual_hash(self, source):
+        """compute perceptual hash (dhash) - 64 bit, packed into an int"""
         try:
+            import numpy as np
             from PIL import Image
             
-            with Image.open(filepath) as img:
-                # convert to grayscale and resize to 9x8
-                img = img.convert("L").resize((9, 8), Image.Resampling.LANCZOS)
-                pixels = list(img.getdata())
-                
-                # compute difference hash
-                diff = []
-                for row in range(8):
-                    for col in range(8):
-                        idx = row * 9 + col
-                        diff.append('1' if pixels[idx] < pixels[idx + 1] else '0')
+            if not isinstance(source, str):
+                source.seek(0)
+            with Image.open(source) as img:
+                # jpegs: let libjpeg decode straight to grayscale at 1/2..1/8
+                # scale (dct-domain), we only need 9x8 out of it anyway.
+                # no-op for other formats
+                img.draft("L", (64, 64))
+                # convert to grayscale and resize to 9x8 - reducing_gap does a
+                # cheap box reduce first so lanczos only sees a small image
+                img = img.convert("L").resize((9, 8), Image.Resampling.LANCZOS, reducing_gap=3.0)
+                arr = np.frombuffer(img.tobytes(), dtype=np.uint8).reshape(8, 9)
                 
-                return ''.join(diff)
+                # compute difference hash - all 64 neighbour compares at once,
+                # packed row by row into 8 bytes
+                bits = arr[:, :-1] < arr[:, 1:]
+                return int.from_bytes(np.packbits(bits.ravel()).tobytes(), "big")
                 
         except Exception:
             # fallback
-            return hashlib.md5(open(filepath, 'rb').read()).hexdigest()[:64]
+            return self._digest_of(source)
     
-    def _hamming_distance(self, h1: str, h2: str) -> int:
-        """compute hamming distance between two hashes"""
-        if len(h1) != len(h2):
+    def _hamming_distance(self, h1: int, h2: int) -> int:
+        """compute hamming distance between two hashes - xor + popcount"""
+        if not isinstance(h1, int) or not isinstance(h2, int):
             return 64  # max distance
-        return sum(c1 != c2 for c1, c2 in zip(h1, h2))
+        return bin(h1 ^ h2).count("1")
+    
+    def _phashes(self):
+        """the live part of the uint64 mirror, built from used_hashes on first use"""
+        import numpy as np
+        
+        if self._phash_array is None:
+            ints = [h for h in self.used_hashes if isinstance(h, int)]
+            self._phash_array = np.empty(max(64, 2 * len(ints)), dtype=np.uint64)
+            self._phash_array[:len(ints)] = np.array(ints, dtype=np.uint64)
+            self._phash_count = len(ints)
+            self._phash_bands = [{} for _ in self.HASH_BANDS]
+            for row, h in enumerate(ints):
+                self._band_index(row, h)
+        return self._phash_array[:self._phash_count]
+    
+    def _band_index(self, row: int, phash: int):
+        for bucket, (shift, mask) in zip(self._phash_bands, self.HASH_BANDS):
+            bucket.setdefault((phash >> shift) & mask, []).append(row)
+    
+    def _remember_phash(self, phash: int):
+        """append to the mirror - amortized O(1), not a copy per insert"""
+        import numpy as np
+        
+        self._phashes()
+        if self._phash_count == len(self._phash_array):
+            self._phash_array = np.concatenate([self._phash_array, np.empty_like(self._phash_array)])
+        self._phash_array[self._phash_count] = phash
+        self._band_index(self._phash_count, phash)
+        self._phash_count += 1
+    
+    def _has_near(self, phash: int, radius: int) -> bool:
+        """any used phash within radius bits of phash
+        only rows sharing a band with phash get the xor + popcount"""
+        import numpy as np
+        
+        phashes = self._phashes()
+        if not len(phashes):
+            return False
+        
+        # a handful of hashes: one xor over all of them beats the band lookup
+        if radius <= self.NEAR_RADIUS and len(phashes) > self.LINEAR_SCAN_MAX:
+            rows = set()
+            for bucket, (shift, mask) in zip(self._phash_bands, self.HASH_BANDS):
+                rows.update(bucket.get((phash >> shift) & mask, ()))
+            if not rows:
+                return False
+            phashes = phashes[np.fromiter(rows, dtype=np.intp, count=len(rows))]
+        
+        xor = phashes ^ np.uint64(phash)
+        # popcount: every uint64 as 8 bytes -> 64 bits, summed per hash
+        bits = np.unpackbits(xor.view(np.uint8)).reshape(-1, 64).sum(axis=1)
+        return bool((bits <= radius).any())
     
     # =====================
     # DOWNLOAD
     # =====================
     
-    def _download_and_validate(self, url: str, keyword: str) -> Optional[str]:
-        """download image and run all ABC checks"""
+    def _download_and_validate(self, url: str, keyword: str, cancelled=None) -> Optional[str]:
+        """download image and run all ABC checks
+        cancelled: optional callable, once it returns True the download is
+        dropped (checked per chunk and before anything gets recorded)"""
         try:
             headers = {
                 "User-Agent": random.choice(self.USER_AGENTS),
@@ -528,19 +895,23 @@ class ImageScraperPro:
                 "Referer": "https://www.google.com/"
             }
             
-            # check content-length before downloading (rule 12)
-            head_response = requests.head(url, headers=headers, timeout=10, allow_redirects=True)
-            content_length = int(head_response.headers.get("content-length", 0))
+            # download with streaming and size limit - the body isnt read
+            # until we ask for it, so no separate HEAD round-trip
+            self._pace(urlparse(url).hostname or "")
+            response = self.session.get(url, headers=headers, timeout=20, stream=True)
+            response.raise_for_status()
+            
+            # check content-length before downloading (rule 12) - the chunk
+            # counter below stays the real cap, servers dont always send it
+            content_length = int(response.headers.get("content-length", 0) or 0)
             if content_length > self.MAX_DOWNLOAD_SIZE:
                 print(f"[Scraper] skipping - too large: {content_length // (1024*1024)}MB")
+                response.close()  # hand the connection back to the pool
                 return None
             
-            # download with streaming and size limit
-            response = requests.get(url, headers=headers, timeout=20, stream=True)
-            response.raise_for_status()
-            
             content_type = response.headers.get("content-type", "")
             if "image" not in content_type.lower() and "octet" not in content_type.lower():
+                response.close()
                 return None
             
             # get extension
@@ -556,48 +927,140 @@ class ImageScraperPro:
             url_hash = hashlib.md5(url.encode()).hexdigest()[:10]
             safe_keyword = "".join(c if c.isalnum() else "_" for c in keyword)[:15]
             filename = f"{safe_keyword}_{url_hash}.{ext}"
-            temp_path = os.path.join(tempfile.gettempdir(), filename)
+            final_path = os.path.join(self.output_dir, filename)
             
-            # save to temp with size limit
+            # keep the body in memory with size limit - capped at
+            # MAX_DOWNLOAD_SIZE so this stays small, and rejects never touch disk
+            buf = io.BytesIO()
             total_size = 0
-            with open(temp_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    total_size += len(chunk)
-                    if total_size > self.MAX_DOWNLOAD_SIZE:
-                        f.close()
-                        os.unlink(temp_path)
-                        return None
-                    f.write(chunk)
+            next_peek = self.HEADER_PEEK_STEP  # None once the header has been read
+            for chunk in response.iter_content(chunk_size=8192):
+                total_size += len(chunk)
+                if total_size > self.MAX_DOWNLOAD_SIZE:
+                    response.close()
+                    return None
+                buf.write(chunk)
+                
+                # the search already has enough - stop pulling bytes
+                if cancelled is not None and cancelled():
+                    response.close()
+                    return None
+                
+                # as soon as the header is in, dimensions are known - a
+                # thumbnail gets dropped here instead of after the whole body
+                if next_peek is not None and total_size >= next_peek:
+                    size = self._peek_size(buf.getvalue())
+                    if size:
+                        next_peek = None
+                        if size[0] < self.min_width or size[1] < self.min_height:
+                            response.close()
+                            return None
+                    elif total_size >= self.HEADER_PEEK_LIMIT:
+                        next_peek = None  # no header this early, leave it to the B-check
+                    else:
+                        next_peek = total_size + self.HEADER_PEEK_STEP
             
-            # run B-check (quality)
-            if not self._check_quality(temp_path):
-                os.unlink(temp_path)
-                return None
+            # exact same bytes as something already judged (or being judged
+            # by another worker right now) - same answer, one decode.
+            # the check and the claim are one critical section
+            digest = self._digest_of(buf)
+            with self._lock:
+                if digest in self._seen_digests or digest in self._judging_digests:
+                    return None
+                self._judging_digests.add(digest)
+            judged = False
+            try:
+                # run B-check (quality)
+                if not self._check_quality(buf):
+                    judged = True
+                    return None
+                
+                # last chance to back out before the hash/url get recorded -
+                # a cancelled body isnt judged, another url may bring it again
+                if cancelled is not None and cancelled():
+                    return None
+                judged = True
+            finally:
+                with self._lock:
+                    self._judging_digests.discard(digest)
+                    if judged:
+                        self._seen_digests.add(digest)
             
             # run C-check (uniqueness with hamming)
-            if not self._check_unique(temp_path):
-                os.unlink(temp_path)
+            if not self._check_unique(buf, final_path):
                 return None
             
-            # move to output
-            final_path = os.path.join(self.output_dir, filename)
-            import shutil
-            shutil.move(temp_path, final_path)
+            # passed everything - one write straight to output
+            with open(final_path, "wb") as f:
+                f.write(buf.getbuffer())
             
-            self.used_urls.add(url)
+            with self._lock:
+                self.used_urls.add(url)
+                # the host works after all
+                if self._host_fail_count.pop(urlparse(url).hostname or "", None) is not None:
+                    self._host_fail_version += 1
             print(f"[Scraper] saved: {filename}")
             return final_path
             
         except Exception as e:
-            # cleanup temp if exists
-            try:
-                temp_path = os.path.join(tempfile.gettempdir(), f"{keyword}_{hashlib.md5(url.encode()).hexdigest()[:10]}.*")
-                import glob
-                for f in glob.glob(temp_path):
-                    os.unlink(f)
-            except:
-                pass
+            # nothing on disk to clean up - the bytes only lived in memory
+            if self._is_host_error(e):
+                self._host_failed(url)
             return None
+    
+    @staticmethod
+    def _peek_size(data: bytes):
+        """(width, height) from the start of an image, None if the header
+        isnt all there yet. Image.open only parses the header, no decode"""
+        try:
+            from PIL import Image
+            with Image.open(io.BytesIO(data)) as img:
+                return img.size
+        except Exception:
+            return None
+    
+    def _pace(self, hostname: str):
+        """rule 92 per host: wait until hostname's next slot, book the one
+        after. different hosts dont wait on each other"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._host_next_slot.get(hostname, 0.0))
+            self._host_next_slot[hostname] = slot + self.HOST_MIN_INTERVAL
+        if slot > now:
+            time.sleep(slot - now)
+    
+    @staticmethod
+    def _is_host_error(e: Exception) -> bool:
+        """true for failures that say the host is down (timeouts, dns/tls/
+        connect errors, 5xx), false for a single dead url (4xx) or our own bugs"""
+        if isinstance(e, (requests.ConnectionError, requests.Timeout)):
+            return True
+        if isinstance(e, requests.HTTPError) and e.response is not None:
+            return e.response.status_code >= 500
+        return False
+    
+    def _host_is_down(self, hostname: str) -> bool:
+        """hostname hit HOST_FAIL_LIMIT within the last HOST_FAIL_TTL seconds"""
+        with self._lock:
+            entry = self._host_fail_count.get(hostname)
+            if entry is None:
+                return False
+            if time.time() - entry[1] >= self.HOST_FAIL_TTL:
+                del self._host_fail_count[hostname]  # long enough ago, try again
+                self._host_fail_version += 1
+                return False
+            return entry[0] >= self.HOST_FAIL_LIMIT
+    
+    def _host_failed(self, url: str):
+        """count a connection-level failure against the url's host"""
+        hostname = urlparse(url).hostname or ""
+        now = time.time()
+        with self._lock:
+            entry = self._host_fail_count.get(hostname)
+            if entry is None or now - entry[1] >= self.HOST_FAIL_TTL:
+                entry = [0, now]
+            self._host_fail_count[hostname] = [entry[0] + 1, now]
+            self._host_fail_version += 1
 
 
 def test_scraper():
@@ -620,6 +1083,7 @@ def test_scraper():
         print(f"  - {img}")
     
     scraper.save_manifest()
+    scraper.close()
     print(f"\nManifest saved to: {manifest}")
 
 
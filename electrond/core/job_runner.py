@@ -30,16 +30,39 @@ from core.video_creator_pro import VideoCreatorPro
 from core.safety_monitor import SafetyMonitor
 
 
+# (second, "HH:MM:SS") - log lines come in bursts, so the clock only gets
+# formatted once per second instead of once per line
+_stamp = (0, "")
+
+
+def _timestamp() -> str:
+    global _stamp
+    now = int(time.time())
+    if now != _stamp[0]:
+        _stamp = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+    return _stamp[1]
+
+
 def log(msg: str):
     """print with timestamp so electron can parse it"""
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    print(f"[{timestamp}] {msg}", flush=True)
+    print(f"[{_timestamp()}] {msg}", flush=True)
 
 
 def error(msg: str):
     """print error to stderr and save to file"""
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    print(f"[{timestamp}] ERROR: {msg}", file=sys.stderr, flush=True)
+    print(f"[{_timestamp()}] ERROR: {msg}", file=sys.stderr, flush=True)
+
+
+def _dump_job(job: dict) -> bytes:
+    """job dict -> indented json bytes, orjson when it's installed"""
+    try:
+        import orjson
+        return orjson.dumps(job, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    except ImportError:
+        pass
+    except TypeError:
+        pass  # something orjson wont take (non-str keys etc) - stdlib handles it
+    return json.dumps(job, indent=2).encode()
 
 
 class JobRunner:
@@ -95,8 +118,12 @@ class JobRunner:
         """save current job state"""
         self.job["last_updated"] = datetime.now().isoformat()
         self.job["jobFolder"] = self.job_folder  # always include folder path
-        with open(self.job_json_path, "w") as f:
-            json.dump(self.job, f, indent=2)
+        # serialized in memory, one write, swapped in whole - json.dump
+        # straight to the file is many small writes and can leave half a file
+        tmp_path = self.job_json_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_dump_job(self.job))
+        os.replace(tmp_path, self.job_json_path)
     
     def _log_error(self, msg: str):
         """log error to file (rule 60)"""
@@ -243,7 +270,8 @@ class JobRunner:
         transcriber = WhisperTranscriber(
             model_name=model,
             use_gpu=use_gpu,
-            output_dir=self.job_folder
+            output_dir=self.job_folder,
+            backend=self.settings.get("whisperBackend", "auto")
         )
         
         for url_data in srt_urls:
@@ -273,19 +301,29 @@ class JobRunner:
     def _extract_keywords(self) -> List[str]:
         """extract keywords from SRT files"""
         extractor = KeywordExtractor()
-        all_keywords = []
+        unique = []
+        seen = set()
         
         for url_data in self.job.get("urls", []):
+            # dedupe as we go - once there are 40 the rest of the SRTs
+            # couldnt change the result, so they arent even read
+            if len(unique) >= 40:
+                break
+            
             srt_path = url_data.get("srt_path")
             if not srt_path or not os.path.exists(srt_path):
                 continue
             
             log(f"extracting keywords from: {os.path.basename(srt_path)}")
             keywords = extractor.extract_from_srt(srt_path, max_keywords=30)
-            all_keywords.extend(keywords)
-        
-        # dedupe and save
-        unique = list(dict.fromkeys(all_keywords))[:40]
+            for kw in keywords:
+                if kw not in seen:
+                    seen.add(kw)
+                    unique.append(kw)
+                    if len(unique) >= 40:
+                        break
+        
+        # save
         self.job["keywords"] = unique
         self._save_job()
         
@@ -315,30 +353,39 @@ class JobRunner:
         
         min_images = self.settings.get("minImages", 20)  # increased default
         images = []
+        seen = set()
         
-        for keyword in keywords:
+        # a few keywords at a time, side by side (one browser each)
+        step = scraper.SEARCH_WORKERS
+        for i in range(0, len(keywords), step):
             if len(images) >= min_images:
                 break
             
-            log(f"searching: {keyword}")
+            batch = keywords[i:i + step]
+            log(f"searching: {', '.join(batch)}")
             
             # throttle to be gentle (rule 92)
             time.sleep(1.0)
             
-            # check cpu before each search (rule 65)
+            # check cpu before each round (rule 65)
             status = self.monitor.check()
             if status.get("cpu") == "HIGH":
                 log("cpu high, waiting 5s...")
                 time.sleep(5.0)
             
             try:
-                found = scraper.search(keyword, max_images=3)
-                images.extend(found)
+                found = scraper.search_many(batch, max_per=3)
+                for keyword in batch:
+                    for path in found[keyword]:
+                        if path not in seen:
+                            seen.add(path)
+                            images.append(path)
             except Exception as e:
-                self._log_error(f"scrape failed for '{keyword}': {e}")
+                self._log_error(f"scrape failed for {batch}: {e}")
         
         # save manifest
         scraper.save_manifest()
+        scraper.close()
         
         self.job["images"] = images
         self._save_job()
@@ -2,7 +2,7 @@
 Da Editor - Whisper Transcriber
 ================================
 1a. transcribes video/audio to SRT format
-1b. uses openai whisper with GPU support
+1b. uses faster-whisper (int8 ctranslate2) when installed, openai whisper otherwise
 1c. handles model loading and caching
 """
 
@@ -12,7 +12,7 @@ from typing import Optional
 
 class WhisperTranscriber:
     """
-    transcribe audio to SRT using openai whisper
+    transcribe audio to SRT using faster-whisper or openai whisper
     
     1a. loads specified model
     1b. extracts audio if needed
@@ -23,15 +23,20 @@ class WhisperTranscriber:
         self,
         model_name: str = "base",
         use_gpu: bool = True,
-        output_dir: str = None
+        output_dir: str = None,
+        backend: str = "auto"
     ):
         self.model_name = model_name
         self.use_gpu = use_gpu
         self.output_dir = output_dir or os.getcwd()
+        # "auto" tries faster-whisper then openai, "faster_whisper" or
+        # "openai" pins one
+        self.requested_backend = backend
         self.model = None
+        self.backend = None  # "faster" or "openai" once loaded
         
         os.makedirs(self.output_dir, exist_ok=True)
-        print(f"[Transcriber] init with model={model_name}, gpu={use_gpu}")
+        print(f"[Transcriber] init with model={model_name}, gpu={use_gpu}, backend={backend}")
     
     def _load_model(self):
         """
@@ -41,12 +46,18 @@ class WhisperTranscriber:
         if self.model is not None:
             return
         
+        if self.requested_backend != "openai" and self._load_faster_whisper():
+            return
+        if self.requested_backend == "faster_whisper":
+            raise RuntimeError("faster-whisper not available - run: pip install faster-whisper")
+        
         try:
             import whisper
             import torch
             
             # check GPU availability
             device = "cuda" if self.use_gpu and torch.cuda.is_available() else "cpu"
+            self.backend = "openai"
             
             print(f"[Transcriber] loading {self.model_name} on {device}...")
             self.model = whisper.load_model(self.model_name, device=device)
@@ -57,6 +68,38 @@ class WhisperTranscriber:
         except Exception as e:
             raise RuntimeError(f"failed to load whisper model: {e}")
     
+    def _load_faster_whisper(self) -> bool:
+        """
+        1a. try the ctranslate2 backend first
+        int8 weights with fp16 compute on GPU, plain int8 on CPU
+        returns False if faster-whisper isnt installed or wont load
+        """
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:
+            return False
+        
+        device = "cpu"
+        if self.use_gpu:
+            try:
+                import ctranslate2
+                if ctranslate2.get_cuda_device_count() > 0:
+                    device = "cuda"
+            except Exception:
+                pass
+        compute_type = "int8_float16" if device == "cuda" else "int8"
+        
+        try:
+            print(f"[Transcriber] loading {self.model_name} (faster-whisper, {compute_type}) on {device}...")
+            self.model = WhisperModel(self.model_name, device=device, compute_type=compute_type)
+            self.backend = "faster"
+            print(f"[Transcriber] model loaded")
+            return True
+        except Exception as e:
+            print(f"[Transcriber] faster-whisper failed ({e}), using openai whisper")
+            self.model = None
+            return False
+    
     def transcribe(self, video_path: str) -> Optional[str]:
         """
         1b. transcribe video to SRT
@@ -78,16 +121,28 @@ class WhisperTranscriber:
         try:
             print(f"[Transcriber] transcribing: {video_path}")
             
-            # run transcription
-            result = self.model.transcribe(
-                video_path,
-                language="en",  # could make this configurable
-                task="transcribe",
-                verbose=False
-            )
+            if self.backend == "faster":
+                # greedy decode, vad drops the silent stretches before decoding
+                segments, _ = self.model.transcribe(
+                    video_path,
+                    language="en",
+                    task="transcribe",
+                    beam_size=1,
+                    vad_filter=True
+                )
+                segments = [{"start": s.start, "end": s.end, "text": s.text} for s in segments]
+            else:
+                # run transcription
+                result = self.model.transcribe(
+                    video_path,
+                    language="en",  # could make this configurable
+                    task="transcribe",
+                    verbose=False
+                )
+                segments = result["segments"]
             
             # convert to SRT format
-            srt_content = self._to_srt(result["segments"])
+            srt_content = self._to_srt(segments)
             
             # save to file
             with open(srt_path, "w", encoding="utf-8") as f:
@@ -154,6 +154,7 @@ def main():
             from core.image_scraper_pro import ImageScraperPro
             scraper = ImageScraperPro(output_dir=images_dir, min_width=800, min_height=600)
             images = scraper.search("mountain landscape scenic", max_images=6)
+            scraper.close()
             print(f"  Scraped {len(images)} images")
         except Exception as e:
             print(f"  Scraping failed: {e}")
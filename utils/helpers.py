@@ -7,6 +7,8 @@ nothing too crazy just the basics
 
 import os
 import re
+import errno
+import shutil
 import hashlib
 from datetime import datetime
 
@@ -47,6 +49,38 @@ def get_file_hash(filepath: str) -> str:
     return hasher.hexdigest()
 
 
+def link_or_copy(src: str, dst: str) -> str:
+    """
+    1d. put src at dst without pushing the bytes through python
+    hardlinks when both are on the same filesystem (no copy at all),
+    otherwise lets the kernel copy with copy_file_range
+    returns dst
+    """
+    try:
+        os.link(src, dst)
+        return dst
+    except OSError as e:
+        if e.errno == errno.EEXIST:
+            raise
+    
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            pass
+    
+    shutil.copy2(src, dst)
+    return dst
+
+
 def format_duration(seconds: float) -> str:
     """
     2a. format seconds to human readable duration